@@ -1,14 +1,13 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
 import os
 import sqlite3
-import json
 from datetime import datetime
 import secrets
+from sqlalchemy.orm import joinedload
 
 # Import application modules
-from models import db, User, Student, Assessment, Report
+from models import db, User, Student, Assessment, Report, upgrade_json_columns
 from data.questionnaire import get_questionnaire_for_age_group
 from data.analysis import analyze_responses
 from data.report_generator import generate_student_report, generate_parent_report
@@ -38,6 +37,10 @@ login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
+def _report_with_student():
+    """Loader option fetching a report's assessment and student in the same query"""
+    return joinedload(Report.assessment).joinedload(Assessment.student)
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -46,12 +49,14 @@ def load_user(user_id):
 @app.before_first_request
 def create_tables():
     db.create_all()
+    # Older PostgreSQL databases still hold JSON payloads in TEXT columns
+    upgrade_json_columns()
     # Create admin user if not exists
     if not User.query.filter_by(username='admin').first():
         admin = User(
             username='admin',
             email='admin@shiningstaronline.com',
-            password_hash=generate_password_hash('admin123'),
+            password_hash=User.generate_password_hash('admin123'),
             role='admin'
         )
         db.session.add(admin)
@@ -71,7 +76,10 @@ def login():
         
         user = User.query.filter_by(username=username).first()
         
-        if user and check_password_hash(user.password_hash, password):
+        if user and user.check_password(password):
+            # Persist the hash if check_password upgraded it to Argon2id
+            if db.session.is_modified(user):
+                db.session.commit()
             login_user(user)
             log_activity(user.username, 'login', 'User logged in')
             flash('Login successful!', 'success')
@@ -149,7 +157,7 @@ def admin_add_user():
         new_user = User(
             username=username,
             email=email,
-            password_hash=generate_password_hash(password),
+            password_hash=User.generate_password_hash(password),
             role=role
         )
         
@@ -177,7 +185,7 @@ def admin_edit_user(user_id):
         user.role = request.form.get('role')
         
         if request.form.get('password'):
-            user.password_hash = generate_password_hash(request.form.get('password'))
+            user.set_password(request.form.get('password'))
         
         db.session.commit()
         log_activity(current_user.username, 'user_updated', f'Updated user: {user.username}')
@@ -237,7 +245,7 @@ def submit_assessment():
     # Create assessment
     assessment = Assessment(
         student_id=student.id,
-        responses=json.dumps(data),
+        responses=data,
         age_group=age_group,
         created_by=current_user.id
     )
@@ -270,14 +278,14 @@ def submit_assessment():
     # Create report
     report = Report(
         assessment_id=assessment.id,
-        student_report=json.dumps(student_report),
-        parent_report=json.dumps(parent_report),
-        teacher_report=json.dumps(teacher_report),
-        learning_pathway=json.dumps(learning_pathway),
-        math_pathway=json.dumps(math_pathway),
-        career_suggestions=json.dumps(career_suggestions),
-        course_recommendations=json.dumps(course_recommendations),
-        exam_suggestions=json.dumps(exam_suggestions)
+        student_report=student_report,
+        parent_report=parent_report,
+        teacher_report=teacher_report,
+        learning_pathway=learning_pathway,
+        math_pathway=math_pathway,
+        career_suggestions=career_suggestions,
+        course_recommendations=course_recommendations,
+        exam_suggestions=exam_suggestions
     )
     db.session.add(report)
     db.session.commit()
@@ -297,20 +305,20 @@ def submit_assessment():
 @app.route('/view_report/<int:report_id>')
 @login_required
 def view_report(report_id):
-    report = Report.query.get_or_404(report_id)
-    assessment = Assessment.query.get(report.assessment_id)
-    student = Student.query.get(assessment.student_id)
+    report = Report.query.options(_report_with_student()).get_or_404(report_id)
+    assessment = report.assessment
+    student = assessment.student
     
     # Check permissions
     if current_user.role != 'admin' and current_user.id != student.parent_id:
         flash('Access denied', 'danger')
         return redirect(url_for('dashboard'))
     
-    student_report = json.loads(report.student_report)
-    parent_report = json.loads(report.parent_report)
-    learning_pathway = json.loads(report.learning_pathway)
-    career_suggestions = json.loads(report.career_suggestions)
-    course_recommendations = json.loads(report.course_recommendations)
+    student_report = report.student_report
+    parent_report = report.parent_report
+    learning_pathway = report.learning_pathway
+    career_suggestions = report.career_suggestions
+    course_recommendations = report.course_recommendations
     
     return render_template('view_report.html',
                           student=student,
@@ -327,11 +335,11 @@ def teacher_view_report(report_id):
         flash('Access denied', 'danger')
         return redirect(url_for('dashboard'))
     
-    report = Report.query.get_or_404(report_id)
-    assessment = Assessment.query.get(report.assessment_id)
-    student = Student.query.get(assessment.student_id)
+    report = Report.query.options(_report_with_student()).get_or_404(report_id)
+    assessment = report.assessment
+    student = assessment.student
     
-    teacher_report = json.loads(report.teacher_report)
+    teacher_report = report.teacher_report
     
     return render_template('teacher/teacher_report.html',
                           student=student,
@@ -3,6 +3,7 @@ Learning Style Analysis Algorithm
 This module processes questionnaire responses to determine learning styles and traits.
 """
 
+import functools
 import numpy as np
 from collections import Counter
 
@@ -204,6 +205,33 @@ INTERESTS = {
     }
 }
 
+@functools.lru_cache(maxsize=32)
+def _questions_by_id(age):
+    """
+    Indexes the questionnaire for an age by question ID.
+    
+    Args:
+        age (int): Age of the student
+        
+    Returns:
+        dict: Question dictionaries keyed by question ID
+    """
+    from data.questionnaire import get_questions_for_age
+    
+    return {question["id"]: question for question in get_questions_for_age(age)}
+
+@functools.lru_cache(maxsize=1)
+def _parent_questions_by_id():
+    """
+    Indexes the parent questionnaire by question ID.
+    
+    Returns:
+        dict: Parent question dictionaries keyed by question ID
+    """
+    from data.questionnaire import get_parent_questions
+    
+    return {question["id"]: question for question in get_parent_questions()}
+
 class LearningStyleAnalyzer:
     """
     Analyzes questionnaire responses to determine learning styles, traits, and interests.
@@ -391,14 +419,7 @@ class LearningStyleAnalyzer:
         Returns:
             dict: Question dictionary or None if not found
         """
-        from data.questionnaire import get_questions_for_age
-        
-        questions = get_questions_for_age(age)
-        for question in questions:
-            if question["id"] == question_id:
-                return question
-        
-        return None
+        return _questions_by_id(age).get(question_id)
     
     def _find_parent_question(self, question_id):
         """
@@ -410,14 +431,7 @@ class LearningStyleAnalyzer:
         Returns:
             dict: Question dictionary or None if not found
         """
-        from data.questionnaire import get_parent_questions
-        
-        questions = get_parent_questions()
-        for question in questions:
-            if question["id"] == question_id:
-                return question
-        
-        return None
+        return _parent_questions_by_id().get(question_id)
     
     def _calculate_dimension_score(self, responses, relevant_question_ids, total_questions):
         """
@@ -11,6 +11,7 @@ from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 import pdfkit
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 class ReportDeliveryManager:
@@ -18,16 +19,19 @@ class ReportDeliveryManager:
     Manages the generation and delivery of reports to students and parents.
     """
     
-    def __init__(self, output_dir, templates_dir):
+    def __init__(self, output_dir, templates_dir, jinja_env=None):
         """
         Initialize the report delivery manager.
         
         Args:
             output_dir (str): Directory to save generated reports
             templates_dir (str): Directory containing report templates
+            jinja_env (Environment, optional): Shared Jinja environment for the templates directory
         """
         self.output_dir = output_dir
         self.templates_dir = templates_dir
+        self.jinja_env = jinja_env
+        self._report_generator = None
         self.pdf_output_dir = os.path.join(output_dir, "pdf")
         
         # Create output directories if they don't exist
@@ -81,11 +85,13 @@ class ReportDeliveryManager:
             "report_id": f"SSR-{datetime.now().strftime('%Y%m%d')}-{student_info['id']}"
         }
         
-        # Generate student report
-        student_html_path, student_pdf_path = self._generate_student_report(report_data)
-        
-        # Generate parent report
-        parent_html_path, parent_pdf_path = self._generate_parent_report(report_data)
+        # Generate student and parent reports concurrently; PDF conversion runs
+        # in an external process, so the two conversions overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            student_future = executor.submit(self._generate_student_report, report_data)
+            parent_future = executor.submit(self._generate_parent_report, report_data)
+            student_html_path, student_pdf_path = student_future.result()
+            parent_html_path, parent_pdf_path = parent_future.result()
         
         # Deliver reports
         student_delivery_status = self._deliver_student_report(student_info, student_pdf_path)
@@ -117,10 +123,8 @@ class ReportDeliveryManager:
         Returns:
             tuple: Paths to the HTML and PDF reports
         """
-        from data.report_generator import ReportGenerator
-        
         # Generate HTML report
-        report_generator = ReportGenerator(self.templates_dir)
+        report_generator = self._get_report_generator()
         html_path = report_generator.generate_student_report(
             report_data["student"], 
             report_data["results"], 
@@ -150,10 +154,8 @@ class ReportDeliveryManager:
         Returns:
             tuple: Paths to the HTML and PDF reports
         """
-        from data.report_generator import ReportGenerator
-        
         # Generate HTML report
-        report_generator = ReportGenerator(self.templates_dir)
+        report_generator = self._get_report_generator()
         html_path = report_generator.generate_parent_report(
             report_data["student"], 
             report_data["results"], 
@@ -174,6 +176,20 @@ class ReportDeliveryManager:
         
         return html_path, pdf_path
     
+    def _get_report_generator(self):
+        """
+        Returns the report generator shared by all reports of this manager.
+        
+        Returns:
+            ReportGenerator: Report generator using the shared Jinja environment
+        """
+        if self._report_generator is None:
+            from data.report_generator import ReportGenerator
+            
+            self._report_generator = ReportGenerator(self.templates_dir, self.jinja_env)
+        
+        return self._report_generator
+    
     def _deliver_student_report(self, student_info, report_path):
         """
         Delivers the report to the student via email.
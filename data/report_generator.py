@@ -5,6 +5,7 @@ This module generates personalized insight reports based on analysis results.
 
 import os
 import json
+import threading
 from datetime import datetime
 from jinja2 import Environment, FileSystemLoader
 import matplotlib.pyplot as plt
@@ -12,20 +13,25 @@ import numpy as np
 import base64
 from io import BytesIO
 
+# pyplot keeps global figure state, so charts are drawn one at a time even when
+# reports are generated on several threads
+_PLOT_LOCK = threading.Lock()
+
 class ReportGenerator:
     """
     Generates personalized reports based on learning style analysis results.
     """
     
-    def __init__(self, templates_dir):
+    def __init__(self, templates_dir, env=None):
         """
         Initialize the report generator with templates directory.
         
         Args:
             templates_dir (str): Path to the templates directory
+            env (Environment, optional): Shared Jinja environment for the templates directory
         """
         self.templates_dir = templates_dir
-        self.env = Environment(loader=FileSystemLoader(templates_dir))
+        self.env = env or Environment(loader=FileSystemLoader(templates_dir))
         
     def generate_student_report(self, student_info, analysis_results, output_dir):
         """
@@ -111,13 +117,14 @@ class ReportGenerator:
         """
         charts = {}
         
-        # Generate dimension scores radar chart
-        charts["dimension_radar"] = self._generate_radar_chart(analysis_results["dimension_scores"])
-        
-        # Generate learning styles bar chart
-        # This would require additional data not currently available in the analysis results
-        # For now, we'll use a placeholder
-        charts["learning_styles"] = self._generate_placeholder_chart()
+        with _PLOT_LOCK:
+            # Generate dimension scores radar chart
+            charts["dimension_radar"] = self._generate_radar_chart(analysis_results["dimension_scores"])
+            
+            # Generate learning styles bar chart
+            # This would require additional data not currently available in the analysis results
+            # For now, we'll use a placeholder
+            charts["learning_styles"] = self._generate_placeholder_chart()
         
         return charts
     
@@ -5,20 +5,189 @@ This module implements security measures to protect sensitive student and parent
 
 import os
 import json
+import sqlite3
 import hashlib
+import hmac
 import base64
 import secrets
+import atexit
+import functools
+import threading
+import time
+import copy
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi not installed; new hashes fall back to PBKDF2
+    PasswordHasher = None
+
+try:
+    import ijson
+except ImportError:  # ijson not installed; legacy logs are loaded with json
+    ijson = None
+
+try:
+    from rfernet import Fernet as RFernet
+except ImportError:  # rfernet not installed; use cryptography's Fernet
+    RFernet = None
+
+# Shared pool for batch key derivations; OpenSSL releases the GIL while running
+# PBKDF2, so threads give real parallelism here.
+_kdf_executor = None
+
+
+def _get_kdf_executor():
+    """
+    Returns the shared key-derivation thread pool, creating it on first use.
+    
+    Returns:
+        ThreadPoolExecutor: Pool bounded to the number of CPUs
+    """
+    global _kdf_executor
+    if _kdf_executor is None:
+        _kdf_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="kdf"
+        )
+    return _kdf_executor
+
+
+def _now_iso():
+    """
+    Returns the current UTC time as an ISO 8601 string.
+    
+    Returns:
+        str: Timezone-aware UTC timestamp
+    """
+    return datetime.now(timezone.utc).isoformat()
+
+
+@functools.lru_cache(maxsize=50000)
+def _anon_id(original_id, key):
+    """
+    Computes the anonymous ID for an original ID under a given key.
+    
+    Args:
+        original_id (str): Original ID
+        key (bytes): Anonymization key
+        
+    Returns:
+        str: Anonymous ID
+    """
+    # Keyed BLAKE2b with a 5-byte digest yields exactly 10 hex characters
+    hash_output = hashlib.blake2b(
+        original_id.encode(),
+        digest_size=5,
+        key=key
+    ).hexdigest()
+    
+    return "anon_" + hash_output
+
+
+class _RFernetCipher:
+    """
+    Adapts rfernet's str-token API to the bytes-token API of cryptography's Fernet.
+    """
+    
+    def __init__(self, key):
+        """
+        Args:
+            key (bytes): Fernet key
+        """
+        self._fernet = RFernet(key.decode())
+    
+    def encrypt(self, data):
+        """
+        Encrypts bytes into a Fernet token (bytes).
+        """
+        return self._fernet.encrypt(data).encode()
+    
+    def decrypt(self, token):
+        """
+        Decrypts a Fernet token (bytes) into bytes.
+        """
+        return self._fernet.decrypt(token.decode())
+
+
+@functools.lru_cache(maxsize=8)
+def _create_cipher(key):
+    """
+    Creates a Fernet cipher, preferring the Rust-backed rfernet when installed.
+    
+    Args:
+        key (bytes): Fernet key
+        
+    Returns:
+        object: Cipher with bytes-in/bytes-out encrypt and decrypt
+    """
+    if RFernet is not None:
+        return _RFernetCipher(key)
+    return Fernet(key)
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_field_ciphers(key, fields):
+    """
+    Derives one AES-GCM cipher per sensitive field from a master key.
+    
+    Cached per key, so every manager opened on the same key directory shares
+    the derived ciphers instead of re-running HKDF.
+    
+    Args:
+        key (bytes): Fernet-encoded master key
+        fields (tuple): Sensitive field names
+        
+    Returns:
+        dict: Field name -> AESGCM cipher
+    """
+    master_key = base64.urlsafe_b64decode(key)
+    
+    field_ciphers = {}
+    for field in fields:
+        subkey = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=field.encode()
+        ).derive(master_key)
+        field_ciphers[field] = AESGCM(subkey)
+    
+    return field_ciphers
+
 
 class DataSecurityManager:
     """
     Manages data security for the diagnostic program.
     """
     
+    # Records and fields encrypted at rest
+    SENSITIVE_SUBJECTS = ("student", "parent")
+    SENSITIVE_FIELDS = ("email", "phone", "address")
+    
+    # Format of encrypted records: "1.0" is whole-key Fernet, "2.0" per-field AES-GCM
+    ENCRYPTION_VERSION = "2.0"
+    LEGACY_ENCRYPTION_VERSION = "1.0"
+    
+    # Buffered audit entries are written once either threshold is reached
+    LOG_FLUSH_ENTRIES = 128
+    LOG_FLUSH_INTERVAL = 1.0
+    
+    # Seconds between sweeps of expired rows from the token store
+    TOKEN_PURGE_INTERVAL = 3600
+    
+    # Maximum number of validated tokens kept in memory
+    TOKEN_CACHE_SIZE = 10000
+    
     def __init__(self, data_dir):
         """
         Initialize the data security manager.
@@ -29,7 +198,8 @@ class DataSecurityManager:
         self.data_dir = data_dir
         self.keys_dir = os.path.join(data_dir, "keys")
         self.logs_dir = os.path.join(data_dir, "logs")
-        self.access_logs_file = os.path.join(self.logs_dir, "access_logs.json")
+        self.access_logs_file = os.path.join(self.logs_dir, "access_logs.jsonl")
+        self.legacy_access_logs_file = os.path.join(self.logs_dir, "access_logs.json")
         
         # Create necessary directories
         os.makedirs(self.keys_dir, exist_ok=True)
@@ -38,8 +208,33 @@ class DataSecurityManager:
         # Initialize encryption key
         self.encryption_key = self._load_or_create_encryption_key()
         
+        # Fernet cipher, kept for records written in the legacy format
+        self._cipher = _create_cipher(self.encryption_key)
+        
+        # Per-field AES-GCM ciphers with subkeys derived from the master key
+        self._field_ciphers = _derive_field_ciphers(self.encryption_key, self.SENSITIVE_FIELDS)
+        
+        # Key for deriving anonymous IDs
+        self._anon_key = self._load_or_create_anon_key()
+        
         # Set up logging
         self._setup_logging()
+        
+        # Buffered audit log sink, drained on size/time threshold, on close()
+        # and at exit
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._last_log_flush = time.monotonic()
+        self._log_fd = os.open(self.access_logs_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        atexit.register(self._flush_logs)
+        
+        # Access tokens live in a single SQLite store keyed by token
+        self._tokens_lock = threading.Lock()
+        self._tokens = self._open_token_store()
+        self._last_token_purge = 0.0
+        
+        # Validated tokens: token -> (expiry epoch, token data), in LRU order
+        self._token_cache = OrderedDict()
     
     def encrypt_sensitive_data(self, data):
         """
@@ -51,36 +246,26 @@ class DataSecurityManager:
         Returns:
             dict: Data with sensitive fields encrypted
         """
+        timestamp = _now_iso()
+        
         # Create a copy of the data to avoid modifying the original
         secure_data = data.copy()
         
-        # Encrypt sensitive fields in student information
-        if "student" in secure_data:
-            student = secure_data["student"].copy()
-            if "email" in student:
-                student["email"] = self._encrypt_value(student["email"])
-            if "phone" in student:
-                student["phone"] = self._encrypt_value(student["phone"])
-            if "address" in student:
-                student["address"] = self._encrypt_value(student["address"])
-            secure_data["student"] = student
-        
-        # Encrypt sensitive fields in parent information
-        if "parent" in secure_data:
-            parent = secure_data["parent"].copy()
-            if "email" in parent:
-                parent["email"] = self._encrypt_value(parent["email"])
-            if "phone" in parent:
-                parent["phone"] = self._encrypt_value(parent["phone"])
-            if "address" in parent:
-                parent["address"] = self._encrypt_value(parent["address"])
-            secure_data["parent"] = parent
+        # Encrypt sensitive fields in student and parent information
+        for subject in self.SENSITIVE_SUBJECTS:
+            if subject in secure_data:
+                record = secure_data[subject].copy()
+                for field in self.SENSITIVE_FIELDS:
+                    value = record.get(field)
+                    if value:
+                        record[field] = self._encrypt_value(value, field)
+                secure_data[subject] = record
         
         # Add security metadata
         secure_data["_security"] = {
             "encrypted": True,
-            "timestamp": datetime.now().isoformat(),
-            "version": "1.0"
+            "timestamp": timestamp,
+            "version": self.ENCRYPTION_VERSION
         }
         
         return secure_data
@@ -99,30 +284,20 @@ class DataSecurityManager:
         if not secure_data.get("_security", {}).get("encrypted", False):
             return secure_data
         
+        version = secure_data["_security"].get("version", self.LEGACY_ENCRYPTION_VERSION)
+        
         # Create a copy of the data to avoid modifying the original
         data = secure_data.copy()
         
-        # Decrypt sensitive fields in student information
-        if "student" in data:
-            student = data["student"].copy()
-            if "email" in student:
-                student["email"] = self._decrypt_value(student["email"])
-            if "phone" in student:
-                student["phone"] = self._decrypt_value(student["phone"])
-            if "address" in student:
-                student["address"] = self._decrypt_value(student["address"])
-            data["student"] = student
-        
-        # Decrypt sensitive fields in parent information
-        if "parent" in data:
-            parent = data["parent"].copy()
-            if "email" in parent:
-                parent["email"] = self._decrypt_value(parent["email"])
-            if "phone" in parent:
-                parent["phone"] = self._decrypt_value(parent["phone"])
-            if "address" in parent:
-                parent["address"] = self._decrypt_value(parent["address"])
-            data["parent"] = parent
+        # Decrypt sensitive fields in student and parent information
+        for subject in self.SENSITIVE_SUBJECTS:
+            if subject in data:
+                record = data[subject].copy()
+                for field in self.SENSITIVE_FIELDS:
+                    value = record.get(field)
+                    if value:
+                        record[field] = self._decrypt_value(value, field, version)
+                data[subject] = record
         
         # Remove security metadata
         if "_security" in data:
@@ -168,7 +343,7 @@ class DataSecurityManager:
         
         # Add anonymization metadata
         anon_data["_anonymized"] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "version": "1.0"
         }
         
@@ -188,7 +363,7 @@ class DataSecurityManager:
             bool: Success status
         """
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "user_id": user_id,
             "data_type": data_type,
             "action": action,
@@ -196,27 +371,43 @@ class DataSecurityManager:
             "ip_address": "127.0.0.1"  # In a real system, this would be the actual IP
         }
         
-        # Load existing logs
-        logs = []
-        if os.path.exists(self.access_logs_file):
-            try:
-                with open(self.access_logs_file, 'r') as f:
-                    logs = json.load(f)
-            except json.JSONDecodeError:
-                logs = []
-        
-        # Add new log entry
-        logs.append(log_entry)
-        
-        # Save updated logs
+        # Buffer the entry as a single JSON line
         try:
-            with open(self.access_logs_file, 'w') as f:
-                json.dump(logs, f, indent=2)
+            with self._log_lock:
+                self._log_buf.append((json.dumps(log_entry) + "\n").encode())
+                if (len(self._log_buf) >= self.LOG_FLUSH_ENTRIES or
+                        time.monotonic() - self._last_log_flush >= self.LOG_FLUSH_INTERVAL):
+                    self._flush_logs_locked()
             return True
         except Exception as e:
             logging.error(f"Failed to log data access: {e}")
             return False
     
+    def iter_access_logs(self):
+        """
+        Iterates over all audit log entries, oldest first.
+        
+        Entries from the legacy JSON array file are streamed before those in
+        the JSONL file, so only one entry is held in memory at a time.
+        
+        Yields:
+            dict: Audit log entry
+        """
+        self._flush_logs()
+        
+        if os.path.exists(self.legacy_access_logs_file):
+            with open(self.legacy_access_logs_file, 'rb') as f:
+                if ijson is not None:
+                    yield from ijson.items(f, 'item', use_float=True)
+                else:
+                    yield from json.load(f)
+        
+        if os.path.exists(self.access_logs_file):
+            with open(self.access_logs_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+    
     def generate_access_token(self, user_id, role, expiry_hours=24):
         """
         Generates a secure access token for API access.
@@ -233,18 +424,23 @@ class DataSecurityManager:
         token = secrets.token_hex(16)
         
         # Create token data
+        now = datetime.now(timezone.utc)
         token_data = {
             "user_id": user_id,
             "role": role,
-            "created": datetime.now().isoformat(),
-            "expires": (datetime.now() + datetime.timedelta(hours=expiry_hours)).isoformat(),
+            "created": now.isoformat(),
+            "expires": (now + timedelta(hours=expiry_hours)).isoformat(),
             "token": token
         }
         
         # Save token data
-        token_file = os.path.join(self.keys_dir, f"token_{token}.json")
-        with open(token_file, 'w') as f:
-            json.dump(token_data, f, indent=2)
+        with self._tokens_lock:
+            self._tokens.execute(
+                "INSERT INTO tokens (token, user_id, role, created, expires) VALUES (?, ?, ?, ?, ?)",
+                (token, user_id, role, token_data["created"], token_data["expires"])
+            )
+            if time.monotonic() - self._last_token_purge >= self.TOKEN_PURGE_INTERVAL:
+                self._purge_expired_tokens_locked()
         
         return token
     
@@ -258,23 +454,84 @@ class DataSecurityManager:
         Returns:
             dict: Token data if valid, None otherwise
         """
-        # Check if token file exists
-        token_file = os.path.join(self.keys_dir, f"token_{token}.json")
-        if not os.path.exists(token_file):
+        # Serve repeat validations from memory until the token expires
+        with self._tokens_lock:
+            cached = self._token_cache.get(token)
+            if cached is not None:
+                if time.time() < cached[0]:
+                    self._token_cache.move_to_end(token)
+                    return dict(cached[1])
+                del self._token_cache[token]
+        
+        # Look up the token
+        with self._tokens_lock:
+            row = self._tokens.execute(
+                "SELECT user_id, role, created, expires FROM tokens WHERE token = ?",
+                (token,)
+            ).fetchone()
+        
+        if row is None:
             return None
         
-        # Load token data
-        with open(token_file, 'r') as f:
-            token_data = json.load(f)
+        token_data = {
+            "user_id": row[0],
+            "role": row[1],
+            "created": row[2],
+            "expires": row[3],
+            "token": token
+        }
         
         # Check if token has expired
         expires = datetime.fromisoformat(token_data["expires"])
-        if datetime.now() > expires:
+        if datetime.now(timezone.utc) > expires:
             # Token has expired, delete it
-            os.remove(token_file)
+            with self._tokens_lock:
+                self._tokens.execute("DELETE FROM tokens WHERE token = ?", (token,))
             return None
         
-        return token_data
+        with self._tokens_lock:
+            self._token_cache[token] = (expires.timestamp(), token_data)
+            self._token_cache.move_to_end(token)
+            if len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        
+        # Hand out a copy so callers cannot alter the cached entry
+        return dict(token_data)
+    
+    def _open_token_store(self):
+        """
+        Opens the SQLite token store, creating its table if needed.
+        
+        Returns:
+            sqlite3.Connection: Autocommit connection to the token store
+        """
+        conn = sqlite3.connect(
+            os.path.join(self.keys_dir, "tokens.db"),
+            isolation_level=None,
+            check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tokens (
+                token TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                created TEXT NOT NULL,
+                expires TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tokens_expires ON tokens (expires)")
+        return conn
+    
+    def _purge_expired_tokens_locked(self):
+        """
+        Deletes expired tokens; the caller must hold the token store lock.
+        """
+        self._tokens.execute("DELETE FROM tokens WHERE expires < ?", (_now_iso(),))
+        self._last_token_purge = time.monotonic()
     
     def _load_or_create_encryption_key(self):
         """
@@ -299,34 +556,58 @@ class DataSecurityManager:
         
         return key
     
-    def _encrypt_value(self, value):
+    def _load_or_create_anon_key(self):
+        """
+        Loads the anonymization key or creates a new one if it doesn't exist.
+        
+        Returns:
+            bytes: 32-byte key for anonymous ID hashing
+        """
+        key_file = os.path.join(self.keys_dir, "anon_key.key")
+        
+        if os.path.exists(key_file):
+            # Load existing key
+            with open(key_file, 'rb') as f:
+                key = f.read()
+        else:
+            # Generate a new key
+            key = secrets.token_bytes(32)
+            
+            # Save the key
+            with open(key_file, 'wb') as f:
+                f.write(key)
+        
+        return key
+    
+    def _encrypt_value(self, value, field):
         """
-        Encrypts a single value.
+        Encrypts a single value with the cipher for its field.
         
         Args:
             value (str): Value to encrypt
+            field (str): Sensitive field the value belongs to
             
         Returns:
-            str: Encrypted value (base64 encoded)
+            str: Encrypted value (base64 encoded nonce + ciphertext)
         """
         if not value:
             return value
         
-        # Create a Fernet cipher with the encryption key
-        cipher = Fernet(self.encryption_key)
-        
-        # Encrypt the value
-        encrypted_value = cipher.encrypt(value.encode())
+        # Encrypt the value under a fresh nonce
+        nonce = os.urandom(12)
+        encrypted_value = self._field_ciphers[field].encrypt(nonce, value.encode(), None)
         
-        # Return base64 encoded encrypted value
-        return base64.b64encode(encrypted_value).decode()
+        # Return base64 encoded nonce and encrypted value
+        return base64.b64encode(nonce + encrypted_value).decode()
     
-    def _decrypt_value(self, encrypted_value):
+    def _decrypt_value(self, encrypted_value, field, version=ENCRYPTION_VERSION):
         """
         Decrypts a single value.
         
         Args:
             encrypted_value (str): Encrypted value (base64 encoded)
+            field (str): Sensitive field the value belongs to
+            version (str): Encryption format of the record
             
         Returns:
             str: Decrypted value
@@ -335,11 +616,12 @@ class DataSecurityManager:
             return encrypted_value
         
         try:
-            # Create a Fernet cipher with the encryption key
-            cipher = Fernet(self.encryption_key)
+            raw_value = base64.b64decode(encrypted_value)
             
-            # Decode base64 and decrypt the value
-            decrypted_value = cipher.decrypt(base64.b64decode(encrypted_value))
+            if version == self.LEGACY_ENCRYPTION_VERSION:
+                decrypted_value = self._cipher.decrypt(raw_value)
+            else:
+                decrypted_value = self._field_ciphers[field].decrypt(raw_value[:12], raw_value[12:], None)
             
             # Return decoded value
             return decrypted_value.decode()
@@ -357,13 +639,48 @@ class DataSecurityManager:
         Returns:
             str: Anonymous ID
         """
-        # Create a hash of the original ID with a salt
-        salt = "shining_star_salt"  # In a real system, this would be a secure, stored salt
-        hash_input = (original_id + salt).encode()
-        hash_output = hashlib.sha256(hash_input).hexdigest()
+        return _anon_id(original_id, self._anon_key)
+    
+    def close(self):
+        """
+        Flushes buffered audit log entries and releases the log file and token store.
         
-        # Return a portion of the hash as the anonymous ID
-        return "anon_" + hash_output[:10]
+        The manager must not be used afterwards; closing twice is a no-op.
+        """
+        with self._log_lock:
+            if self._log_fd is None:
+                return
+            self._flush_logs_locked()
+            os.close(self._log_fd)
+            self._log_fd = None
+        atexit.unregister(self._flush_logs)
+        
+        with self._tokens_lock:
+            self._tokens.close()
+    
+    def _flush_logs(self):
+        """
+        Writes any buffered audit log entries to disk.
+        """
+        with self._log_lock:
+            if self._log_fd is not None:
+                self._flush_logs_locked()
+    
+    def _flush_logs_locked(self):
+        """
+        Writes buffered audit log entries; the caller must hold the log lock.
+        """
+        if self._log_buf:
+            # One gathered write per batch where supported (POSIX writev)
+            written = 0
+            if hasattr(os, "writev"):
+                written = os.writev(self._log_fd, self._log_buf)
+            if written < sum(map(len, self._log_buf)):
+                pending = b"".join(self._log_buf)[written:]
+                while pending:
+                    pending = pending[os.write(self._log_fd, pending):]
+            self._log_buf.clear()
+        self._last_log_flush = time.monotonic()
     
     def _setup_logging(self):
         """
@@ -397,6 +714,20 @@ class UserAccessControl:
         # Create necessary directories
         os.makedirs(self.users_dir, exist_ok=True)
         
+        # Parsed user records: username -> ((mtime_ns, size), user data)
+        self._user_cache = {}
+        
+        # Data access per user: username -> (user data it was built from, access)
+        self._access_cache = {}
+        
+        # Per-user locks serializing read-modify-write of a user file
+        self._user_locks = {}
+        
+        # Argon2id hasher for new passwords (None when argon2-cffi is missing)
+        self._password_hasher = None
+        if PasswordHasher is not None:
+            self._password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+        
         # Define role permissions
         self.role_permissions = {
             "admin": {
@@ -424,6 +755,12 @@ class UserAccessControl:
                 "export_data": False
             }
         }
+        
+        # Granted permissions per role, for set-membership checks
+        self._role_perms = {
+            role: frozenset(permission for permission, granted in perms.items() if granted)
+            for role, perms in self.role_permissions.items()
+        }
     
     def create_user(self, username, role, password, email=None, name=None):
         """
@@ -458,14 +795,13 @@ class UserAccessControl:
             "password_hash": password_hash,
             "email": email,
             "name": name,
-            "created": datetime.now().isoformat(),
+            "created": _now_iso(),
             "last_login": None,
             "active": True
         }
         
         # Save user data
-        with open(user_file, 'w') as f:
-            json.dump(user_data, f, indent=2)
+        self._write_user(username, user_data)
         
         # Return user data without password hash
         user_data_safe = user_data.copy()
@@ -483,33 +819,55 @@ class UserAccessControl:
         Returns:
             dict: User data if authentication successful, None otherwise
         """
-        # Check if user exists
-        user_file = os.path.join(self.users_dir, f"{username}.json")
-        if not os.path.exists(user_file):
-            return None
-        
-        # Load user data
-        with open(user_file, 'r') as f:
-            user_data = json.load(f)
-        
-        # Check if user is active
-        if not user_data.get("active", True):
-            return None
-        
-        # Verify password
-        if not self._verify_password(password, user_data["password_hash"]):
-            return None
-        
-        # Update last login time
-        user_data["last_login"] = datetime.now().isoformat()
-        with open(user_file, 'w') as f:
-            json.dump(user_data, f, indent=2)
+        # Concurrent logins of one user would otherwise race on the user file
+        with self._user_lock(username):
+            # Load user data
+            user_data = self._load_user(username)
+            if user_data is None:
+                return None
+            
+            # Check if user is active
+            if not user_data.get("active", True):
+                return None
+            
+            # Verify password
+            if not self._verify_password(password, user_data["password_hash"]):
+                return None
+            
+            # Upgrade legacy or outdated hashes now that we know the password
+            if self._password_needs_rehash(user_data["password_hash"]):
+                user_data["password_hash"] = self._hash_password(password)
+            
+            # Update last login time
+            user_data["last_login"] = _now_iso()
+            self._write_user(username, user_data)
         
         # Return user data without password hash
         user_data_safe = user_data.copy()
         del user_data_safe["password_hash"]
         return user_data_safe
     
+    def authenticate_users(self, credentials):
+        """
+        Authenticates a batch of users, deriving password keys concurrently.
+        
+        Entries for the same username are serialized by the per-user lock.
+        
+        Args:
+            credentials (list): (username, password) pairs
+            
+        Returns:
+            list: User data (or None) for each pair, in input order
+        """
+        credentials = list(credentials)
+        if len(credentials) < 2:
+            return [self.authenticate_user(username, password) for username, password in credentials]
+        
+        return list(_get_kdf_executor().map(
+            lambda pair: self.authenticate_user(*pair),
+            credentials
+        ))
+    
     def check_permission(self, username, permission):
         """
         Checks if a user has a specific permission.
@@ -521,27 +879,17 @@ class UserAccessControl:
         Returns:
             bool: True if user has permission, False otherwise
         """
-        # Check if user exists
-        user_file = os.path.join(self.users_dir, f"{username}.json")
-        if not os.path.exists(user_file):
-            return False
-        
         # Load user data
-        with open(user_file, 'r') as f:
-            user_data = json.load(f)
+        user_data = self._load_user_record(username)
+        if user_data is None:
+            return False
         
         # Check if user is active
         if not user_data.get("active", True):
             return False
         
-        # Get user role
-        role = user_data.get("role")
-        
-        # Check if role has permission
-        if role in self.role_permissions:
-            return self.role_permissions[role].get(permission, False)
-        
-        return False
+        # Check if the user's role grants the permission
+        return permission in self._role_perms.get(user_data.get("role"), ())
     
     def get_user_specific_data_access(self, username):
         """
@@ -551,17 +899,34 @@ class UserAccessControl:
             username (str): Username
             
         Returns:
-            dict: Data access information
+            dict: Data access information, with student IDs as a frozenset
         """
-        # Check if user exists
-        user_file = os.path.join(self.users_dir, f"{username}.json")
-        if not os.path.exists(user_file):
+        # Load user data
+        user_data = self._load_user_record(username)
+        if user_data is None:
+            self._access_cache.pop(username, None)
             return {}
         
-        # Load user data
-        with open(user_file, 'r') as f:
-            user_data = json.load(f)
+        # _load_user_record returns the same record object until the user file
+        # changes, so a cached entry built from it is still current
+        cached = self._access_cache.get(username)
+        if cached is not None and cached[0] is user_data:
+            return cached[1]
+        
+        access = self._build_data_access(user_data)
+        self._access_cache[username] = (user_data, access)
+        return access
+    
+    def _build_data_access(self, user_data):
+        """
+        Builds the data access information for a user record.
         
+        Args:
+            user_data (dict): User record
+            
+        Returns:
+            dict: Data access information
+        """
         # Check if user is active
         if not user_data.get("active", True):
             return {}
@@ -577,38 +942,128 @@ class UserAccessControl:
             # Teachers can access data for their assigned students
             return {
                 "all_access": False,
-                "student_ids": user_data.get("assigned_students", [])
+                "student_ids": frozenset(user_data.get("assigned_students", ()))
             }
         elif role == "parent":
             # Parents can only access data for their children
             return {
                 "all_access": False,
-                "student_ids": user_data.get("children", [])
+                "student_ids": frozenset(user_data.get("children", ()))
             }
         
         return {}
     
+    def _load_user(self, username):
+        """
+        Loads a user record for modification.
+        
+        Args:
+            username (str): Username
+            
+        Returns:
+            dict: Private copy of the user data, or None if the user does not exist
+        """
+        user_data = self._load_user_record(username)
+        if user_data is None:
+            return None
+        return copy.deepcopy(user_data)
+    
+    def _load_user_record(self, username):
+        """
+        Loads a user record, reusing the cached copy while the file is unchanged.
+        
+        Args:
+            username (str): Username
+            
+        Returns:
+            dict: User data (shared; do not modify), or None if the user does not exist
+        """
+        user_file = os.path.join(self.users_dir, f"{username}.json")
+        try:
+            st = os.stat(user_file)
+        except FileNotFoundError:
+            self._user_cache.pop(username, None)
+            return None
+        
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._user_cache.get(username)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with open(user_file, 'r') as f:
+            user_data = json.load(f)
+        
+        self._user_cache[username] = (signature, user_data)
+        return user_data
+    
+    def _write_user(self, username, user_data):
+        """
+        Saves a user record, replacing the file atomically.
+        
+        Args:
+            username (str): Username
+            user_data (dict): User data
+        """
+        user_file = os.path.join(self.users_dir, f"{username}.json")
+        fd, tmp_path = tempfile.mkstemp(dir=self.users_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(user_data, f, indent=2)
+            os.replace(tmp_path, user_file)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _user_lock(self, username):
+        """
+        Returns the lock guarding a user's file.
+        
+        Args:
+            username (str): Username
+            
+        Returns:
+            threading.Lock: Lock shared by every caller for this username
+        """
+        lock = self._user_locks.get(username)
+        if lock is None:
+            lock = self._user_locks.setdefault(username, threading.Lock())
+        return lock
+    
     def _hash_password(self, password):
         """
         Hashes a password.
         
+        Uses Argon2id when argon2-cffi is available, otherwise PBKDF2-SHA256.
+        
+        Args:
+            password (str): Password to hash
+            
+        Returns:
+            str or dict: Encoded Argon2id hash, or PBKDF2 hash data
+        """
+        if self._password_hasher is not None:
+            return self._password_hasher.hash(password)
+        
+        return self._hash_password_pbkdf2(password)
+    
+    def _hash_password_pbkdf2(self, password):
+        """
+        Hashes a password with PBKDF2-SHA256.
+        
         Args:
             password (str): Password to hash
             
         Returns:
-            str: Password hash
+            dict: Password hash data
         """
         # Generate a random salt
         salt = os.urandom(16)
         
         # Hash the password with the salt
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000
-        )
-        key = kdf.derive(password.encode())
+        key = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100000, 32)
         
         # Combine salt and key for storage
         password_hash = {
@@ -623,6 +1078,29 @@ class UserAccessControl:
         """
         Verifies a password against a hash.
         
+        Args:
+            password (str): Password to verify
+            password_hash (str or dict): Encoded Argon2id hash or legacy PBKDF2 hash data
+            
+        Returns:
+            bool: True if password is correct, False otherwise
+        """
+        if isinstance(password_hash, dict):
+            return self._verify_password_pbkdf2(password, password_hash)
+        
+        if self._password_hasher is None:
+            logging.error("Cannot verify Argon2 password hash: argon2-cffi is not installed")
+            return False
+        
+        try:
+            return self._password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
+    def _verify_password_pbkdf2(self, password, password_hash):
+        """
+        Verifies a password against legacy PBKDF2 hash data.
+        
         Args:
             password (str): Password to verify
             password_hash (dict): Password hash data
@@ -636,16 +1114,31 @@ class UserAccessControl:
         stored_key = base64.b64decode(password_hash["key"])
         
         # Hash the provided password with the same salt and iterations
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=iterations
+        derived_key = hashlib.pbkdf2_hmac(
+            "sha256",
+            password.encode(),
+            salt,
+            iterations,
+            len(stored_key)
         )
         
-        try:
-            # Verify the password
-            kdf.verify(password.encode(), stored_key)
-            return True
-        except Exception:
+        # Compare in constant time
+        return hmac.compare_digest(derived_key, stored_key)
+    
+    def _password_needs_rehash(self, password_hash):
+        """
+        Checks whether a stored hash should be replaced with a fresh Argon2id hash.
+        
+        Args:
+            password_hash (str or dict): Stored password hash
+            
+        Returns:
+            bool: True if the hash is legacy PBKDF2 or uses outdated parameters
+        """
+        if self._password_hasher is None:
             return False
+        
+        if isinstance(password_hash, dict):
+            return True
+        
+        return self._password_hasher.check_needs_rehash(password_hash)
@@ -4,9 +4,668 @@ This module generates specialized reports for teachers with deeper academic insi
 """
 
 import os
+import sys
 import json
+import pickle
+import contextlib
+import stat
+import hashlib
+import functools
+import itertools
+import tempfile
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from enum import IntEnum
+from types import MappingProxyType
+from jinja2 import ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+
+try:
+    import orjson
+except ImportError:  # orjson not installed; profile keys are built with json
+    orjson = None
+
+# Jinja environments shared by all generators, keyed by templates directory, so
+# compiled templates are reused across instances
+_ENV_CACHE = {}
+
+# Compiled template bytecode persisted across process restarts
+_BYTECODE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "teacher_report_jinja_cache")
+
+# Subdirectory of a templates directory holding templates precompiled to Python
+# modules by compile_report_templates
+_COMPILED_TEMPLATES_DIRNAME = "__compiled__"
+
+# Insight blocks persisted across processes, keyed by a hash of the profile key;
+# the per-user directory is used when the shared one is not safe to load from
+_INSIGHT_CACHE_DIR = os.environ.get(
+    "TEACHER_REPORT_CACHE",
+    os.path.join(tempfile.gettempdir(), "teacher_report_cache")
+)
+_USER_INSIGHT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "learninglens",
+    "teacher_report"
+)
+
+# Report text lives in a JSON resource beside this module rather than in
+# Python literals, so the strings stay out of the module's code objects
+_STRINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "teacher_report_strings.json")
+
+
+def _module_fingerprint():
+    """
+    Hashes this module's source and report text so cached insight blocks
+    built by another version of the helpers are never reused.
+    
+    Returns:
+        bytes: Short digest of the module source and report text, empty if either cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        for path in (__file__, _STRINGS_PATH):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    except OSError:
+        return b""
+    return digest.digest()
+
+
+_INSIGHT_CACHE_VERSION = _module_fingerprint()
+
+# Write buffer for rendered reports, large enough to hold a typical report so
+# it reaches the disk in a handful of write calls
+_REPORT_WRITE_BUFFER = 1 << 20
+
+# Fixed parts of report identifiers and output file names
+_REPORT_ID_PREFIX = "TSSR-"
+_REPORT_FILENAME_PREFIX = "teacher_report_"
+_REPORT_TEMPLATE_NAME = "teacher_report.html"
+
+# Insight blocks of profiles seen at least _HOT_PROFILE_THRESHOLD times are
+# pinned here so churn in the bounded LRU cache never evicts them; hit counts
+# are dropped once they track more than _PROFILE_HITS_LIMIT profiles
+_HOT_PROFILE_THRESHOLD = 50
+_HOT_PROFILE_LIMIT = 256
+_PROFILE_HITS_LIMIT = 4096
+_HOT_INSIGHT_BLOCKS = {}
+_PROFILE_HITS = {}
+
+
+def _private_cache_dir(path):
+    """
+    Creates a cache directory and checks that no other user can write to it,
+    since cached files are unpickled or unmarshalled when read back.
+    
+    Args:
+        path (str): Cache directory
+        
+    Returns:
+        str: The directory, or None if it is missing, not a real directory,
+            owned by another user, or group- or world-writable
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return None
+    
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        return None
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _insight_cache_dir():
+    """
+    Returns the directory insight blocks are persisted in.
+    
+    Returns:
+        str: Private cache directory, or None to skip the disk cache
+    """
+    return _private_cache_dir(_INSIGHT_CACHE_DIR) or _private_cache_dir(_USER_INSIGHT_CACHE_DIR)
+
+
+def _get_environment(templates_dir):
+    """
+    Returns the shared Jinja environment for a templates directory.
+    
+    Args:
+        templates_dir (str): Directory containing report templates
+        
+    Returns:
+        Environment: Cached Jinja environment
+    """
+    env = _ENV_CACHE.get(templates_dir)
+    if env is None:
+        # Bytecode is unmarshalled when loaded, so only use a private directory
+        bytecode_dir = _private_cache_dir(_BYTECODE_CACHE_DIR)
+        bytecode_cache = None
+        if bytecode_dir is not None:
+            bytecode_cache = FileSystemBytecodeCache(bytecode_dir, "%s.cache")
+        
+        # Prefer precompiled template modules, which skip parsing and code
+        # generation entirely, and fall back to the template sources
+        loader = FileSystemLoader(templates_dir)
+        compiled_dir = os.path.join(templates_dir, _COMPILED_TEMPLATES_DIRNAME)
+        if os.path.isdir(compiled_dir):
+            loader = ChoiceLoader([ModuleLoader(compiled_dir), loader])
+        
+        env = _ENV_CACHE.setdefault(
+            templates_dir,
+            Environment(
+                loader=loader,
+                auto_reload=False,
+                cache_size=400,
+                bytecode_cache=bytecode_cache
+            )
+        )
+    return env
+
+
+def compile_report_templates(templates_dir):
+    """
+    Precompiles the report templates into importable Python modules.
+    
+    Intended as a build/deploy step; environments created afterwards load the
+    compiled modules instead of compiling the template sources.
+    
+    Args:
+        templates_dir (str): Directory containing report templates
+        
+    Returns:
+        str: Directory the compiled modules were written to
+    """
+    target_dir = os.path.join(templates_dir, _COMPILED_TEMPLATES_DIRNAME)
+    env = Environment(loader=FileSystemLoader(templates_dir))
+    env.compile_templates(
+        target_dir,
+        extensions=("html",),
+        zip=None,
+        ignore_errors=False
+    )
+    
+    # Drop the cached environment so the next generator picks up the modules
+    _ENV_CACHE.pop(templates_dir, None)
+    
+    return target_dir
+
+
+def _interned(value):
+    """
+    Rebuilds a lookup table or insight block with every string interned.
+    
+    Args:
+        value: Table, sequence, result dataclass or scalar
+        
+    Returns:
+        Equivalent structure of the same types sharing interned strings
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return type(value)(*(_interned(getattr(value, field.name)) for field in fields(value)))
+    if isinstance(value, MappingProxyType):
+        return MappingProxyType(_interned(dict(value)))
+    if isinstance(value, dict):
+        return {_interned(k): _interned(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return type(value)(_interned(v) for v in value)
+    return value
+
+
+class _Style(IntEnum):
+    """Known primary learning styles, used to index the per-style tables."""
+    VISUAL = 0
+    AUDITORY = 1
+    KINESTHETIC = 2
+    LOGICAL = 3
+    SOCIAL = 4
+    INDEPENDENT = 5
+
+
+_STYLE_INDEX = MappingProxyType({style.name.lower(): style for style in _Style})
+
+
+def _by_style(table):
+    """
+    Lays out a style-keyed table as a tuple indexed by _Style.
+    
+    Args:
+        table (dict): Values keyed by learning style name
+        
+    Returns:
+        tuple: Values in _Style order, None for styles without an entry
+    """
+    return tuple(table.get(style.name.lower()) for style in _Style)
+
+
+# Report text, loaded once at import time
+with open(_STRINGS_PATH, 'rb') as _f:
+    _STRINGS = json.load(_f)
+del _f
+
+
+def _frozen(value):
+    """
+    Converts parsed JSON into the immutable, interned form of the lookup tables.
+    
+    Args:
+        value: Table, sequence or scalar parsed from the strings resource
+        
+    Returns:
+        Equivalent structure with lists as tuples and every string interned
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _frozen(v) for k, v in value.items()}
+    return value
+
+
+def _text(name):
+    """
+    Returns one text table from the strings resource.
+    
+    Args:
+        name (str): Table name in the strings resource
+        
+    Returns:
+        Read-only mapping, tuple or string with every string interned
+    """
+    table = _frozen(_STRINGS[name])
+    return MappingProxyType(table) if isinstance(table, dict) else table
+
+
+# Static lookup tables for the academic insight helpers, built once at import
+# time and exposed read-only so per-report calls never rebuild or mutate them
+_APPROACHES = _by_style(_text("approaches"))
+
+# Sentences appended to the academic approach, in order, for matching top traits
+_APPROACH_TRAIT_MODIFIERS = _text("approach_trait_modifiers")
+
+_STYLE_AFFINITIES = _by_style(_text("style_affinities"))
+_INTEREST_SUBJECTS = _text("interest_subjects")
+_PACE_BY_STYLE = _text("pace_by_style")
+_DEPTH_BY_TRAITS = _text("depth_by_traits")
+_ATTENTION_BY_STYLE = _text("attention_by_style")
+_FOCUS_BY_TRAITS = _text("focus_by_traits")
+_ATTENTION_STRATEGIES = _text("attention_strategies")
+_ROLE_BY_STYLE = _text("role_by_style")
+_COLLAB_BY_TRAITS = _text("collab_by_traits")
+_ASSESSMENT_BY_STYLE = _text("assessment_by_style")
+_ASSESSMENT_APPROACH_BY_TRAITS = _text("assessment_approach_by_traits")
+_CHALLENGING_MAP = _by_style(_text("challenging_map"))
+_ASSESSMENT_RECOMMENDATIONS = _text("assessment_recommendations")
+_ENGAGEMENT_BY_STYLE = _text("engagement_by_style")
+_MOTIVATION_BY_TRAITS = _text("motivation_by_traits")
+_DIFFERENTIATION_STRATEGIES = _text("differentiation_strategies")
+
+
+# Classroom challenge tables are only needed by the challenges generator, so
+# they are frozen and interned on first use rather than at import time
+@functools.cache
+def _challenges_by_style():
+    """Style-based classroom challenges and solutions, built on first use."""
+    return _text("challenges_by_style")
+
+
+@functools.cache
+def _challenges_by_traits():
+    """Trait-based classroom challenges and solutions, built on first use."""
+    return _text("challenges_by_traits")
+
+
+# Strength, growth and mathematics tables for the per-profile generators
+_STRENGTHS_BY_STYLE = _text("strengths_by_style")
+_TRAIT_STRENGTHS = _text("trait_strengths")
+_GROWTH_BY_STYLE = _text("growth_by_style")
+_INTEREST_RECOMMENDATIONS = _text("interest_recommendations")
+_MATH_STYLES = _text("math_styles")
+_DEFAULT_MATH_STYLE = _text("default_math_style")
+
+# Sentences appended to the math learning style, in order, for matching top traits
+_MATH_STYLE_TRAIT_MODIFIERS = _text("math_style_trait_modifiers")
+
+# Report labels of the Abacus and Vedic Math potential levels, lowest first
+_POTENTIAL_LABELS = _interned(("Medium-Low", "Medium", "Medium-High", "High"))
+
+
+class PotentialLevel(IntEnum):
+    """Abacus and Vedic Math potential, ordered so levels compare as scores."""
+    MEDIUM_LOW = 0
+    MEDIUM = 1
+    MEDIUM_HIGH = 2
+    HIGH = 3
+    
+    def __str__(self):
+        return _POTENTIAL_LABELS[self]
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+_POTENTIAL_MAX = PotentialLevel.HIGH
+_POTENTIAL_DEFAULT = PotentialLevel.MEDIUM
+
+_ABACUS_POTENTIAL = MappingProxyType({
+    "visual": 3,
+    "kinesthetic": 3,
+    "logical": 2,
+    "independent": 1,
+    "auditory": 0,
+    "social": 0
+})
+
+_VEDIC_POTENTIAL = MappingProxyType({
+    "logical": 3,
+    "visual": 2,
+    "independent": 2,
+    "auditory": 1,
+    "kinesthetic": 0,
+    "social": 0
+})
+
+# (abacus, vedic) score deltas for each of the top two traits
+_TRAIT_ADJUSTMENTS = MappingProxyType({
+    "analytical": (1, 1),
+    "persistent": (1, 1),
+    "organized": (1, 1),
+    "creative": (0, 1),
+    "leadership": (0, 0),
+    "collaborative": (-1, -1)
+})
+
+_ABACUS_RECOMMENDATIONS_HIGH = _text("abacus_recommendations_high")
+_ABACUS_RECOMMENDATIONS_LOW = _text("abacus_recommendations_low")
+_VEDIC_RECOMMENDATIONS_HIGH = _text("vedic_recommendations_high")
+_VEDIC_RECOMMENDATIONS_LOW = _text("vedic_recommendations_low")
+_MATH_STRENGTHS_BY_STYLE = _text("math_strengths_by_style")
+_MATH_TRAIT_STRENGTHS = _text("math_trait_strengths")
+_MATH_CHALLENGES_BY_STYLE = _text("math_challenges_by_style")
+_MATH_TRAIT_CHALLENGES = _text("math_trait_challenges")
+_MATH_STRATEGIES_BY_STYLE = _text("math_strategies_by_style")
+_MATH_TRAIT_STRATEGIES = _text("math_trait_strategies")
+
+# Fallbacks for learning styles and traits without an entry
+_DEFAULT_ENGAGEMENT = _text("default_engagement")
+_DEFAULT_MOTIVATION = _text("default_motivation")
+_DEFAULT_CHALLENGES = _text("default_challenges")
+_DEFAULT_GROWTH_AREAS = _text("default_growth_areas")
+_DEFAULT_RECOMMENDATIONS = _text("default_recommendations")
+_DEFAULT_STRENGTHS = _text("default_strengths")
+_DEFAULT_MATH_STRENGTHS = _text("default_math_strengths")
+_DEFAULT_MATH_CHALLENGES = _text("default_math_challenges")
+_DEFAULT_MATH_STRATEGIES = _text("default_math_strategies")
+
+# Closing strategies added to every mathematics teaching plan
+_ABACUS_VEDIC_STRATEGIES = _text("abacus_vedic_strategies")
+
+# Global examination catalog by school stage; the entries stay plain dicts so
+# insight blocks that share them can still be pickled to the on-disk cache
+_ELEMENTARY_EXAMS = _text("elementary_exams")  # ages 5-10, grades K-5
+_MIDDLE_EXAMS = _text("middle_exams")  # ages 11-13, grades 6-8
+_HIGH_EXAMS = _text("high_exams")  # ages 14-18, grades 9-12
+_APTITUDE_TESTS = _text("aptitude_tests")  # all age groups
+
+# Exam tiers in age order; the cuts are the oldest age in each tier but the last
+_EXAM_TIERS = (_ELEMENTARY_EXAMS, _MIDDLE_EXAMS, _HIGH_EXAMS)
+_EXAM_AGE_CUTS = (10, 13)
+
+# Exam-taking strengths, challenges and preparation strategies, grouped per
+# learning style and per trait so one lookup serves all three sections
+_EXAM_BY_STYLE = _text("exam_by_style")
+_EXAM_BY_TRAIT = _text("exam_by_trait")
+_DEFAULT_EXAM = _text("default_exam")
+_GENERAL_EXAM_STRATEGIES = _text("general_exam_strategies")
+
+# Intern the keys of the scoring tables kept in code so they resolve to the
+# same objects as the style and trait names in the text tables
+for _name in (
+    "_ABACUS_POTENTIAL",
+    "_VEDIC_POTENTIAL",
+    "_TRAIT_ADJUSTMENTS"
+):
+    globals()[_name] = _interned(globals()[_name])
+del _name
+
+# Leading two strengths per secondary style and subjects per interest, sliced
+# once instead of on every subject affinity lookup
+_STYLE_STRENGTHS_HEAD2 = tuple(affinity["strengths"][:2] for affinity in _STYLE_AFFINITIES)
+_INTEREST_SUBJECTS_HEAD2 = MappingProxyType({
+    interest: subjects[:2] for interest, subjects in _INTEREST_SUBJECTS.items()
+})
+
+
+def _combine_by_traits(by_style, default, by_trait, suffix=()):
+    """
+    Precomputes base-plus-trait item lists for every style and leading traits.
+    
+    Args:
+        by_style (Mapping): Base items keyed by learning style
+        default (tuple): Base items for unknown learning styles
+        by_trait (Mapping): Item (str) or items (tuple) added for each leading trait
+        suffix (tuple): Items appended after the trait items
+        
+    Returns:
+        MappingProxyType: Item tuples keyed by (style or None, known leading traits)
+    """
+    leads = [()] + [(trait,) for trait in by_trait] + list(itertools.product(by_trait, repeat=2))
+    table = {}
+    # Single items are wrapped so every trait contributes a sequence
+    trait_items = {
+        trait: (extra,) if isinstance(extra, str) else tuple(extra)
+        for trait, extra in by_trait.items()
+    }
+    for style in (None, *by_style):
+        base = by_style[style] if style is not None else default
+        for lead in leads:
+            table[(style, lead)] = (
+                *base,
+                *itertools.chain.from_iterable(trait_items[trait] for trait in lead),
+                *suffix
+            )
+    return MappingProxyType(table)
+
+
+def _lookup_by_traits(table, by_style, by_trait, primary_style, top_traits):
+    """
+    Reads a _combine_by_traits table for a learner profile.
+    
+    Args:
+        table (Mapping): Table built by _combine_by_traits
+        by_style (Mapping): Base items keyed by learning style
+        by_trait (Mapping): Per-trait items the table was built from
+        primary_style (str): Primary learning style
+        top_traits (tuple): Top personality traits
+        
+    Returns:
+        tuple: Combined items
+    """
+    style = primary_style if primary_style in by_style else None
+    lead = tuple(trait for trait in top_traits[:2] if trait in by_trait)
+    return table[(style, lead)]
+
+
+# Every (style, leading traits) outcome of the strength, challenge and strategy
+# generators, materialized once so each call is a single lookup
+_STRENGTHS_TABLE = _combine_by_traits(_STRENGTHS_BY_STYLE, _DEFAULT_STRENGTHS, _TRAIT_STRENGTHS)
+_MATH_STRENGTHS_TABLE = _combine_by_traits(
+    _MATH_STRENGTHS_BY_STYLE, _DEFAULT_MATH_STRENGTHS, _MATH_TRAIT_STRENGTHS
+)
+_MATH_CHALLENGES_TABLE = _combine_by_traits(
+    _MATH_CHALLENGES_BY_STYLE, _DEFAULT_MATH_CHALLENGES, _MATH_TRAIT_CHALLENGES
+)
+_MATH_STRATEGIES_TABLE = _combine_by_traits(
+    _MATH_STRATEGIES_BY_STYLE, _DEFAULT_MATH_STRATEGIES, _MATH_TRAIT_STRATEGIES,
+    suffix=_ABACUS_VEDIC_STRATEGIES
+)
+
+
+def _exam_section(table, field):
+    """
+    Projects one section out of a grouped exam table.
+    
+    Args:
+        table (Mapping): Exam entries keyed by learning style or trait
+        field (str): Section to keep
+        
+    Returns:
+        MappingProxyType: The section of each entry, under the same keys
+    """
+    return MappingProxyType({key: entry[field] for key, entry in table.items()})
+
+
+# Every (style, leading traits) outcome of the exam assessment, joined against
+# the style and trait tables once so a whole class resolves with one lookup
+# per student; each entry is a (strengths, challenges, strategies) triple, the
+# strategies already closed by the general exam strategies
+_EXAM_TABLE = MappingProxyType({
+    key: (strengths, challenges, strategies)
+    for (key, strengths), challenges, strategies in zip(
+        _combine_by_traits(
+            _exam_section(_EXAM_BY_STYLE, "strengths"), _DEFAULT_EXAM["strengths"],
+            _exam_section(_EXAM_BY_TRAIT, "strength")
+        ).items(),
+        _combine_by_traits(
+            _exam_section(_EXAM_BY_STYLE, "challenges"), _DEFAULT_EXAM["challenges"],
+            _exam_section(_EXAM_BY_TRAIT, "challenge")
+        ).values(),
+        _combine_by_traits(
+            _exam_section(_EXAM_BY_STYLE, "strategies"), _DEFAULT_EXAM["strategies"],
+            _exam_section(_EXAM_BY_TRAIT, "strategies"),
+            suffix=_GENERAL_EXAM_STRATEGIES
+        ).values()
+    )
+})
+
+
+# Fixed-shape insight fragments; slotted and frozen so the shared instances are
+# compact and safe to hand to every report with the same profile
+@dataclass(slots=True, frozen=True)
+class StrengthsGrowth:
+    """Strengths, growth areas and recommendations for a learner."""
+    strengths: tuple
+    growth_areas: tuple
+    recommendations: tuple
+
+
+@dataclass(slots=True, frozen=True)
+class ParentAlignment:
+    """Parent-student alignment insights."""
+    alignment_areas: tuple
+    difference_areas: tuple
+    communication_strategies: tuple
+
+
+@dataclass(slots=True, frozen=True)
+class Potential:
+    """Potential level for a mental math method with its recommendations."""
+    potential: PotentialLevel
+    recommendations: tuple
+
+
+@dataclass(slots=True, frozen=True)
+class AbacusVedic:
+    """Abacus and Vedic Math potential."""
+    abacus: Potential
+    vedic: Potential
+
+
+@dataclass(slots=True, frozen=True)
+class MathAptitude:
+    """Mathematical aptitude assessment."""
+    math_learning_style: str
+    abacus_vedic_potential: AbacusVedic
+    strengths: tuple
+    challenges: tuple
+    teaching_strategies: tuple
+
+
+# Parent alignment outcomes that do not depend on the comparison contents,
+# shared by every report instead of rebuilt per student and interned like the
+# text tables
+_NO_PARENT_ALIGNMENT = _interned(ParentAlignment(
+    alignment_areas=("No parent comparison data available",),
+    difference_areas=("No parent comparison data available",),
+    communication_strategies=(
+        "Discuss learning preferences with both student and parents",
+        "Share specific observations about learning style",
+        "Provide concrete examples of effective strategies"
+    )
+))
+
+_NO_ALIGNMENT_AREAS = _interned(("Limited alignment data available",))
+_NO_DIFFERENCE_AREAS = _interned(("Limited difference data available",))
+
+_COMMUNICATION_STRATEGIES = _interned((
+    "Share specific observations about learning patterns",
+    "Provide concrete examples of classroom successes",
+    "Focus on strengths while addressing growth areas"
+))
+
+_COMMUNICATION_STRATEGIES_WITH_DIFFERENCES = _COMMUNICATION_STRATEGIES + _interned((
+    "Discuss different perspectives without judgment",
+    "Use student work samples to illustrate learning style",
+    "Suggest home activities aligned with learning preferences"
+))
+
+
+# The parts of the analysis results that the insight generators read
+_LearnerProfile = namedtuple(
+    "_LearnerProfile",
+    "primary_style secondary_styles top_traits top_interests"
+)
+
+_EMPTY = ()
+
+
+def _unpack_analysis(analysis_results):
+    """
+    Extracts the learner profile from analysis results in one pass.
+    
+    Args:
+        analysis_results (dict): Results from learning style analysis
+        
+    Returns:
+        _LearnerProfile: Primary style plus tuples of secondary styles, top
+        traits and top interests
+    """
+    learning_styles = analysis_results.get("learning_styles") or {}
+    traits = analysis_results.get("traits") or {}
+    interests = analysis_results.get("interests") or {}
+    return _LearnerProfile(
+        learning_styles.get("primary", ""),
+        tuple(learning_styles.get("secondary") or _EMPTY),
+        tuple(traits.get("top_traits") or _EMPTY),
+        tuple(interests.get("top_interests") or _EMPTY)
+    )
+
+
+def _profile_key(profile):
+    """
+    Serializes a learner profile into a canonical cache key.
+    
+    Args:
+        profile (dict): Profile inputs of the insight block
+        
+    Returns:
+        bytes: JSON with sorted keys
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            profile,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(profile, sort_keys=True, default=str).encode('utf-8')
+
 
 class TeacherReportGenerator:
     """
@@ -21,7 +680,14 @@ class TeacherReportGenerator:
             templates_dir (str): Directory containing report templates
         """
         self.templates_dir = templates_dir
-        self.env = Environment(loader=FileSystemLoader(templates_dir))
+    
+    @property
+    def env(self):
+        """
+        Shared Jinja environment for this generator's templates directory,
+        looked up on each use so a rebuilt environment is picked up.
+        """
+        return _get_environment(self.templates_dir)
     
     def generate_teacher_report(self, student_info, analysis_results, parent_comparison, output_dir):
         """
@@ -36,20 +702,159 @@ class TeacherReportGenerator:
         Returns:
             str: Path to the generated HTML report
         """
-        # Create template data with enhanced academic insights
-        template_data = self._prepare_template_data(student_info, analysis_results, parent_comparison)
+        os.makedirs(output_dir, exist_ok=True)
+        return self._write_report(student_info, analysis_results, parent_comparison, output_dir)
+    
+    def generate_batch(self, jobs, output_dir):
+        """
+        Generates teacher reports for a batch of students.
         
-        # Render the template
-        template = self.env.get_template('teacher_report.html')
-        rendered_html = template.render(**template_data)
+        The output directory is created once and the compiled template and
+        cached insight blocks are shared by every report in the batch.
         
-        # Save the rendered HTML
+        Args:
+            jobs (iterable): (student_info, analysis_results, parent_comparison) tuples
+            output_dir (str): Directory to save the generated reports
+            
+        Returns:
+            list: Paths to the generated HTML reports, in job order
+        """
         os.makedirs(output_dir, exist_ok=True)
-        report_filename = f"teacher_report_{student_info['id']}.html"
+        return [
+            self._write_report(student_info, analysis_results, parent_comparison, output_dir)
+            for student_info, analysis_results, parent_comparison in jobs
+        ]
+    
+    def generate_reports(self, rows):
+        """
+        Prepares template data for a class of students.
+        
+        Students are grouped by learner profile so the insight sections of
+        each distinct profile are built once and shared by reference across
+        every student in the group; only the student-specific fields differ.
+        
+        Args:
+            rows (iterable): (student_info, analysis_results, parent_comparison) tuples
+            
+        Returns:
+            list: Template data for each student, in row order
+        """
+        rows = list(rows)
+        
+        # Group row indexes by the profile their insight sections depend on
+        grouped = defaultdict(list)
+        for index, (student_info, analysis_results, parent_comparison) in enumerate(rows):
+            grouped[self._insight_key(student_info, analysis_results, parent_comparison)].append(index)
+        
+        # One timestamp for the whole class keeps dates and report ids aligned
+        now = datetime.now()
+        
+        reports = [None] * len(rows)
+        for profile_key, indexes in grouped.items():
+            insight_block = self._insight_block(profile_key)
+            for index in indexes:
+                student_info, analysis_results, _ = rows[index]
+                reports[index] = self._wrap_insight_block(insight_block, student_info, analysis_results, now)
+        
+        return reports
+    
+    def generate_batch_parallel(self, jobs, output_dir, workers=None):
+        """
+        Generates teacher reports for a batch of students across worker processes.
+        
+        Args:
+            jobs (iterable): (student_info, analysis_results, parent_comparison) tuples
+            output_dir (str): Directory to save the generated reports
+            workers (int, optional): Number of worker processes, defaults to the CPU count
+            
+        Returns:
+            list: Paths to the generated HTML reports, in job order
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        tasks = [
+            (self.templates_dir, student_info, analysis_results, parent_comparison, output_dir)
+            for student_info, analysis_results, parent_comparison in jobs
+        ]
+        
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(_render_one, tasks))
+    
+    def _write_report(self, student_info, analysis_results, parent_comparison, output_dir):
+        """
+        Renders one teacher report into an existing output directory.
+        
+        Args:
+            student_info (dict): Student information
+            analysis_results (dict): Results from learning style analysis
+            parent_comparison (dict): Results from parent-student comparison
+            output_dir (str): Directory to save the generated report
+            
+        Returns:
+            str: Path to the generated HTML report
+        """
+        report_filename = _REPORT_FILENAME_PREFIX + str(student_info['id']) + ".html"
         report_path = os.path.join(output_dir, report_filename)
         
-        with open(report_path, 'w') as f:
-            f.write(rendered_html)
+        # Edits to the template change its size or modification time
+        try:
+            template_stat = os.stat(os.path.join(self.templates_dir, _REPORT_TEMPLATE_NAME))
+            template_signature = [template_stat.st_mtime_ns, template_stat.st_size]
+        except OSError:
+            template_signature = None
+        
+        # Skip rendering when the existing report was built from the same
+        # inputs, templates and module version on the same day
+        input_hash = hashlib.blake2b(
+            _INSIGHT_CACHE_VERSION + _profile_key({
+                "student": student_info,
+                "analysis": analysis_results,
+                "parent": parent_comparison,
+                "templates": self.templates_dir,
+                "template": template_signature,
+                "day": datetime.now().strftime("%Y%m%d")
+            }),
+            digest_size=16
+        ).hexdigest()
+        hash_path = report_path + ".hash"
+        
+        try:
+            with open(hash_path) as f:
+                if f.read() == input_hash and os.path.exists(report_path):
+                    return report_path
+        except OSError:
+            pass
+        
+        # Create template data with enhanced academic insights
+        template_data = self._prepare_template_data(student_info, analysis_results, parent_comparison)
+        
+        # The environment keeps compiled templates, so this is a cache lookup
+        template = self.env.get_template(_REPORT_TEMPLATE_NAME)
+        
+        # Render into a sibling file and swap it in, so readers never see a
+        # partially written report; mkstemp keeps concurrent workers rendering
+        # the same student from sharing a temporary file
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb', buffering=_REPORT_WRITE_BUFFER) as f:
+                # mkstemp creates the file owner-only; reports are served later
+                os.fchmod(f.fileno(), 0o644)
+                stream = template.stream(**template_data)
+                stream.enable_buffering(size=5)
+                stream.dump(f, encoding='utf-8')
+                f.flush()
+                
+                # Reports are written once and served later; let the kernel
+                # reclaim their page cache instead of holding it
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            os.replace(tmp_path, report_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        with open(hash_path, 'w') as f:
+            f.write(input_hash)
         
         return report_path
     
@@ -65,112 +870,254 @@ class TeacherReportGenerator:
         Returns:
             dict: Template data for the teacher report
         """
-        # Extract basic information from analysis results
-        learning_styles = analysis_results.get("learning_styles", {})
-        traits = analysis_results.get("traits", {})
-        interests = analysis_results.get("interests", {})
-        
-        # Generate academic insights specific for teachers
-        academic_insights = self._generate_academic_insights(
-            student_info,
-            learning_styles,
-            traits,
-            interests
-        )
-        
-        # Generate classroom strategies based on learning profile
-        classroom_strategies = self._generate_classroom_strategies(
-            learning_styles,
-            traits
-        )
-        
-        # Generate potential challenges and solutions
-        challenges_solutions = self._generate_challenges_solutions(
-            learning_styles,
-            traits
+        # Reuse the insight sections already built for an identical profile
+        insight_block = self._insight_block(
+            self._insight_key(student_info, analysis_results, parent_comparison)
         )
         
-        # Generate academic strengths and growth areas
-        strengths_growth = self._generate_strengths_growth_areas(
-            learning_styles,
-            traits,
-            interests
-        )
-        
-        # Generate parent alignment insights
-        parent_alignment = self._generate_parent_alignment_insights(
-            parent_comparison
-        )
-        
-        # Generate mathematical aptitude assessment
-        math_aptitude = self._generate_math_aptitude_assessment(
-            analysis_results
-        )
+        # Take a single timestamp so the date and report id always agree
+        return self._wrap_insight_block(insight_block, student_info, analysis_results, datetime.now())
+    
+    @staticmethod
+    def _insight_key(student_info, analysis_results, parent_comparison):
+        """
+        Builds the cache key for the insight sections of a report.
         
-        # Generate examination readiness assessment
-        exam_readiness = self._generate_exam_readiness(
-            student_info,
-            analysis_results
-        )
+        Args:
+            student_info (dict): Student information
+            analysis_results (dict): Results from learning style analysis
+            parent_comparison (dict): Results from parent-student comparison
+            
+        Returns:
+            bytes: Canonical JSON of the learner profile, parent comparison
+                and age
+        """
+        # Only the fields the generators read take part in the key (as a plain
+        # tuple, since orjson does not serialize tuple subclasses); exam
+        # readiness is the only section that depends on the student record
+        return _profile_key({
+            "profile": tuple(_unpack_analysis(analysis_results)),
+            "pc": parent_comparison,
+            "age": student_info.get("age", 10)
+        })
+    
+    @staticmethod
+    def _wrap_insight_block(insight_block, student_info, analysis_results, now):
+        """
+        Attaches the student-specific fields to a shared insight block.
         
+        Args:
+            insight_block (dict): Insight sections of the template data
+            student_info (dict): Student information
+            analysis_results (dict): Results from learning style analysis
+            now (datetime): Timestamp for the report date and id
+            
+        Returns:
+            dict: Template data for the teacher report
+        """
         # Compile all data for the template
         template_data = {
             "student": student_info,
-            "date": datetime.now().strftime("%B %d, %Y"),
-            "report_id": f"TSSR-{datetime.now().strftime('%Y%m%d')}-{student_info['id']}",
-            "learning_styles": learning_styles,
-            "traits": traits,
-            "interests": interests,
-            "academic_insights": academic_insights,
-            "classroom_strategies": classroom_strategies,
-            "challenges_solutions": challenges_solutions,
-            "strengths_growth": strengths_growth,
-            "parent_alignment": parent_alignment,
-            "math_aptitude": math_aptitude,
-            "exam_readiness": exam_readiness
+            "date": now.strftime("%B %d, %Y"),
+            "report_id": _REPORT_ID_PREFIX + now.strftime("%Y%m%d") + "-" + str(student_info['id']),
+            "learning_styles": analysis_results.get("learning_styles", {}),
+            "traits": analysis_results.get("traits", {}),
+            "interests": analysis_results.get("interests", {})
         }
+        template_data.update(insight_block)
         
         return template_data
     
-    def _generate_academic_insights(self, student_info, learning_styles, traits, interests):
+    @classmethod
+    def _insight_block(cls, profile_key):
+        """
+        Returns the insight block for a profile, straight from the pinned
+        table once the profile is frequent enough.
+        
+        Args:
+            profile_key (bytes): Canonical JSON of the learner profile,
+                parent comparison and age
+            
+        Returns:
+            dict: Insight sections of the template data
+        """
+        insight_block = _HOT_INSIGHT_BLOCKS.get(profile_key)
+        if insight_block is not None:
+            return insight_block
+        
+        insight_block = cls._build_insight_block(profile_key)
+        
+        # Count the profile and pin it once it crosses the threshold
+        hits = _PROFILE_HITS.get(profile_key, 0) + 1
+        if hits >= _HOT_PROFILE_THRESHOLD and len(_HOT_INSIGHT_BLOCKS) < _HOT_PROFILE_LIMIT:
+            _HOT_INSIGHT_BLOCKS[profile_key] = insight_block
+            _PROFILE_HITS.pop(profile_key, None)
+        else:
+            if len(_PROFILE_HITS) >= _PROFILE_HITS_LIMIT:
+                _PROFILE_HITS.clear()
+            _PROFILE_HITS[profile_key] = hits
+        
+        return insight_block
+    
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _build_insight_block(cls, profile_key):
+        """
+        Returns the insight block for a profile, from disk when another process
+        already built it.
+        
+        Args:
+            profile_key (bytes): Canonical JSON of the learner profile,
+                parent comparison and age
+            
+        Returns:
+            dict: Insight sections of the template data
+        """
+        cache_dir = _insight_cache_dir()
+        if cache_dir is None:
+            return cls._compute_insight_block(profile_key)
+        
+        digest = hashlib.blake2b(_INSIGHT_CACHE_VERSION + profile_key, digest_size=16).hexdigest()
+        cache_path = os.path.join(cache_dir, digest + ".pkl")
+        
+        # Unpickled strings are fresh copies; intern them so blocks read back
+        # from disk share the strings of the text tables and of each other
+        try:
+            with open(cache_path, 'rb') as f:
+                return _interned(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        
+        insight_block = cls._compute_insight_block(profile_key)
+        
+        # Publish atomically so concurrent workers never read a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        except OSError:
+            return insight_block
+        
+        # The disk cache is optional: any failure to write it, including a
+        # block that cannot be pickled, only drops the temporary file
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(insight_block, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+        
+        return insight_block
+    
+    @classmethod
+    def _compute_insight_block(cls, profile_key):
+        """
+        Builds the report sections that depend only on the learner profile.
+        
+        Args:
+            profile_key (bytes): Canonical JSON of the learner profile,
+                parent comparison and age
+            
+        Returns:
+            dict: Insight sections of the template data
+        """
+        profile = json.loads(profile_key)
+        
+        # Restore the learner profile as hashable tuples for the cached helpers,
+        # interning the names so comparisons against the interned table keys
+        # short-circuit on identity
+        primary_style, secondary_styles, top_traits, top_interests = profile["profile"]
+        primary_style = _interned(primary_style)
+        secondary_styles = _interned(tuple(secondary_styles))
+        top_traits = _interned(tuple(top_traits))
+        top_interests = _interned(tuple(top_interests))
+        top_traits_set = frozenset(top_traits)
+        first_trait = top_traits[0] if top_traits else None
+        
+        # Most helpers only read the two leading traits and interests; pass
+        # just those so profiles that differ further down share cache entries
+        lead_traits = top_traits[:2]
+        lead_interests = top_interests[:2]
+        
+        return {
+            # Generate academic insights specific for teachers
+            "academic_insights": cls._generate_academic_insights(
+                primary_style,
+                secondary_styles,
+                first_trait,
+                top_traits_set,
+                top_interests
+            ),
+            # Generate classroom strategies based on learning profile
+            "classroom_strategies": cls._generate_classroom_strategies(
+                primary_style,
+                lead_traits
+            ),
+            # Generate potential challenges and solutions
+            "challenges_solutions": cls._generate_challenges_solutions(
+                primary_style,
+                first_trait
+            ),
+            # Generate academic strengths and growth areas
+            "strengths_growth": cls._generate_strengths_growth_areas(
+                primary_style,
+                lead_traits,
+                lead_interests
+            ),
+            # Generate parent alignment insights
+            "parent_alignment": cls._generate_parent_alignment_insights(
+                profile["pc"]
+            ),
+            # Generate mathematical aptitude assessment
+            "math_aptitude": cls._generate_math_aptitude_assessment(
+                primary_style,
+                top_traits,
+                top_traits_set,
+                top_interests
+            ),
+            # Generate examination readiness assessment
+            "exam_readiness": cls._generate_exam_readiness(
+                profile["age"],
+                primary_style,
+                top_traits
+            )
+        }
+    
+    @classmethod
+    def _generate_academic_insights(cls, primary_style, secondary_styles, first_trait, top_traits_set, top_interests):
         """
         Generates academic insights specific for teachers.
         
         Args:
-            student_info (dict): Student information
-            learning_styles (dict): Learning style analysis results
-            traits (dict): Personality traits analysis results
-            interests (dict): Interest areas analysis results
+            primary_style (str): Primary learning style
+            secondary_styles (tuple): Secondary learning styles
+            first_trait (str): Highest ranked personality trait, None if there are none
+            top_traits_set (frozenset): Top personality traits for membership tests
+            top_interests (tuple): Top interest areas
             
         Returns:
             dict: Academic insights for teachers
         """
-        # Extract primary learning style and traits
-        primary_style = learning_styles.get("primary", "")
-        secondary_styles = learning_styles.get("secondary", [])
-        top_traits = traits.get("top_traits", [])
-        
         # Generate general academic approach
-        academic_approach = self._get_academic_approach(primary_style, top_traits)
+        academic_approach = cls._get_academic_approach(primary_style, top_traits_set)
         
         # Generate subject affinities based on learning style and interests
-        subject_affinities = self._get_subject_affinities(
+        subject_affinities = cls._get_subject_affinities(
             primary_style,
             secondary_styles,
-            interests.get("top_interests", [])
+            top_interests
         )
         
         # Generate learning pace and depth insights
-        learning_pace = self._get_learning_pace(primary_style, top_traits)
+        learning_pace = cls._get_learning_pace(primary_style, first_trait)
         
         # Generate attention span and focus insights
-        attention_focus = self._get_attention_focus(primary_style, top_traits)
+        attention_focus = cls._get_attention_focus(primary_style, first_trait)
         
         # Generate group work dynamics
-        group_dynamics = self._get_group_dynamics(primary_style, top_traits)
+        group_dynamics = cls._get_group_dynamics(primary_style, first_trait, top_traits_set)
         
         # Generate assessment preferences
-        assessment_preferences = self._get_assessment_preferences(primary_style, top_traits)
+        assessment_preferences = cls._get_assessment_preferences(primary_style, first_trait)
         
         # Compile academic insights
         academic_insights = {
@@ -184,253 +1131,133 @@ class TeacherReportGenerator:
         
         return academic_insights
     
-    def _get_academic_approach(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_academic_approach(primary_style, top_traits_set):
         """
         Determines the student's general academic approach.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            top_traits_set (frozenset): Top personality traits for membership tests
             
         Returns:
             str: Description of academic approach
         """
-        approaches = {
-            "visual": "Tends to understand and remember concepts through visual representations. " +
-                     "Responds well to diagrams, charts, and written instructions.",
-            "auditory": "Processes information effectively through listening and discussion. " +
-                       "Benefits from verbal explanations and group discussions.",
-            "kinesthetic": "Learns best through hands-on activities and physical engagement. " +
-                          "May struggle with long periods of sitting still.",
-            "logical": "Excels in systematic and logical problem-solving. " +
-                      "Appreciates clear structures and sequential learning.",
-            "social": "Thrives in collaborative learning environments. " +
-                     "Benefits from group projects and peer teaching opportunities.",
-            "independent": "Works well independently and is self-directed. " +
-                          "May need less direct supervision but benefits from clear expectations."
-        }
-        
-        # Get base approach from primary learning style
-        approach = approaches.get(primary_style, "Shows a balanced approach to learning.")
+        # Start from the base approach for the primary learning style
+        style = _STYLE_INDEX.get(primary_style)
+        parts = [_APPROACHES[style] if style is not None else "Shows a balanced approach to learning."]
         
         # Modify based on top traits
-        if "analytical" in top_traits:
-            approach += " Shows strong analytical thinking and attention to detail."
-        if "creative" in top_traits:
-            approach += " Demonstrates creative thinking and novel approaches to problems."
-        if "persistent" in top_traits:
-            approach += " Exhibits persistence when facing challenging material."
-        if "organized" in top_traits:
-            approach += " Maintains good organization of materials and assignments."
-        
-        return approach
+        parts.extend(suffix for trait, suffix in _APPROACH_TRAIT_MODIFIERS if trait in top_traits_set)
+        
+        return "".join(parts)
     
-    def _get_subject_affinities(self, primary_style, secondary_styles, interests):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_subject_affinities(primary_style, secondary_styles, interests):
         """
         Determines subject affinities based on learning style and interests.
         
         Args:
             primary_style (str): Primary learning style
-            secondary_styles (list): Secondary learning styles
-            interests (list): Top interest areas
+            secondary_styles (tuple): Secondary learning styles
+            interests (tuple): Top interest areas
             
         Returns:
             dict: Subject affinities with strengths and potential challenges
         """
-        # Define subject affinities by learning style
-        style_affinities = {
-            "visual": {
-                "strengths": ["Art", "Geography", "Geometry", "Biology (diagrams)"],
-                "challenges": ["Abstract concepts without visual aids", "Purely auditory lectures"]
-            },
-            "auditory": {
-                "strengths": ["Languages", "Music", "History", "Literature"],
-                "challenges": ["Complex visual diagrams", "Silent reading comprehension"]
-            },
-            "kinesthetic": {
-                "strengths": ["Physical Education", "Chemistry (labs)", "Engineering", "Drama"],
-                "challenges": ["Long lectures", "Extended writing assignments"]
-            },
-            "logical": {
-                "strengths": ["Mathematics", "Physics", "Computer Science", "Chess"],
-                "challenges": ["Creative writing", "Abstract art interpretation"]
-            },
-            "social": {
-                "strengths": ["Group projects", "Debate", "Team sports", "Social studies"],
-                "challenges": ["Independent research", "Individual assessments"]
-            },
-            "independent": {
-                "strengths": ["Research projects", "Creative writing", "Self-paced subjects"],
-                "challenges": ["Group presentations", "Team-based assessments"]
-            }
-        }
+        style = _STYLE_INDEX.get(primary_style)
+        primary = _STYLE_AFFINITIES[style] if style is not None else {}
+        
+        # Collect strengths in an insertion-ordered dict so duplicates are
+        # dropped: the primary style affinities, then secondary style
+        # strengths (but not challenges), then interest-based subjects
+        strengths = dict.fromkeys(itertools.chain(
+            primary.get("strengths", ()),
+            itertools.chain.from_iterable(
+                _STYLE_STRENGTHS_HEAD2[style]
+                for style in map(_STYLE_INDEX.get, secondary_styles) if style is not None
+            ),
+            itertools.chain.from_iterable(
+                _INTEREST_SUBJECTS_HEAD2.get(interest, _EMPTY) for interest in interests
+            )
+        ))
         
-        # Get primary style affinities
-        affinities = {
-            "strengths": style_affinities.get(primary_style, {}).get("strengths", []),
-            "challenges": style_affinities.get(primary_style, {}).get("challenges", [])
-        }
-        
-        # Add secondary style strengths (but not challenges)
-        for style in secondary_styles:
-            if style in style_affinities:
-                affinities["strengths"].extend(style_affinities[style].get("strengths", [])[:2])
-        
-        # Add interest-based subjects
-        interest_subjects = {
-            "technology": ["Computer Science", "Digital Media", "Robotics"],
-            "arts": ["Visual Arts", "Music", "Drama", "Creative Writing"],
-            "entrepreneurship": ["Business Studies", "Economics", "Public Speaking"],
-            "science": ["Biology", "Chemistry", "Physics", "Environmental Science"],
-            "language": ["Literature", "Foreign Languages", "Journalism"],
-            "mathematics": ["Algebra", "Geometry", "Calculus", "Statistics"]
+        return {
+            "strengths": tuple(strengths),
+            "challenges": tuple(dict.fromkeys(primary.get("challenges", ())))
         }
-        
-        for interest in interests:
-            if interest in interest_subjects:
-                affinities["strengths"].extend(interest_subjects[interest][:2])
-        
-        # Remove duplicates
-        affinities["strengths"] = list(dict.fromkeys(affinities["strengths"]))
-        affinities["challenges"] = list(dict.fromkeys(affinities["challenges"]))
-        
-        return affinities
     
-    def _get_learning_pace(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_learning_pace(primary_style, first_trait):
         """
         Determines the student's learning pace and depth preferences.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            first_trait (str): Highest ranked personality trait, None if there are none
             
         Returns:
             dict: Learning pace insights
         """
-        # Base pace by learning style
-        pace_by_style = {
-            "visual": "Moderate; needs time to process visual information thoroughly",
-            "auditory": "Variable; can process verbal information quickly but may need time for reflection",
-            "kinesthetic": "Hands-on pace; learns quickly through direct experience",
-            "logical": "Methodical; prefers to understand concepts deeply before moving on",
-            "social": "Adaptive; pace often influenced by group dynamics",
-            "independent": "Self-regulated; may move quickly through familiar material and slower through challenging concepts"
-        }
-        
-        # Depth preferences by traits
-        depth_by_traits = {
-            "analytical": "Prefers deep exploration of topics with attention to details and connections",
-            "creative": "Enjoys exploring novel aspects and unconventional applications of concepts",
-            "persistent": "Will work through difficult material thoroughly; doesn't give up easily",
-            "leadership": "May focus more on broad understanding than details; sees big picture",
-            "collaborative": "Benefits from discussing concepts in depth with peers",
-            "organized": "Systematic in approaching new material; builds comprehensive understanding"
-        }
-        
         # Get base pace
-        pace = pace_by_style.get(primary_style, "Moderate and balanced learning pace")
+        pace = _PACE_BY_STYLE.get(primary_style, "Moderate and balanced learning pace")
         
         # Get depth preference based on top trait
-        depth = "Shows balanced interest in both breadth and depth of material"
-        if top_traits and top_traits[0] in depth_by_traits:
-            depth = depth_by_traits[top_traits[0]]
+        depth = _DEPTH_BY_TRAITS.get(first_trait, "Shows balanced interest in both breadth and depth of material")
         
         return {
             "pace": pace,
             "depth": depth
         }
     
-    def _get_attention_focus(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_attention_focus(primary_style, first_trait):
         """
         Determines the student's attention span and focus characteristics.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            first_trait (str): Highest ranked personality trait, None if there are none
             
         Returns:
             dict: Attention and focus insights
         """
-        # Attention characteristics by learning style
-        attention_by_style = {
-            "visual": "Strong visual focus; may lose attention during long verbal explanations",
-            "auditory": "Good auditory attention; may struggle with focus in noisy environments",
-            "kinesthetic": "May fidget during passive learning; excellent focus during hands-on activities",
-            "logical": "Strong focus for logical problems; may disengage from unstructured activities",
-            "social": "Attention enhanced in social learning contexts; may be distracted in isolated work",
-            "independent": "Generally good self-directed focus; may tune out during group activities"
-        }
-        
-        # Focus duration by traits
-        focus_by_traits = {
-            "analytical": "Can maintain extended focus on complex problems",
-            "creative": "May have variable focus; intense concentration on interesting topics",
-            "persistent": "Strong sustained focus, especially when challenged",
-            "leadership": "Good focus when leading or engaged; may disengage when passive",
-            "collaborative": "Focus enhanced in collaborative settings",
-            "organized": "Methodical focus; good at managing attention across multiple tasks"
-        }
-        
         # Get attention characteristics
-        attention = attention_by_style.get(primary_style, "Shows typical attention patterns for age")
+        attention = _ATTENTION_BY_STYLE.get(primary_style, "Shows typical attention patterns for age")
         
         # Get focus duration based on top trait
-        focus = "Shows age-appropriate focus duration"
-        if top_traits and top_traits[0] in focus_by_traits:
-            focus = focus_by_traits[top_traits[0]]
+        focus = _FOCUS_BY_TRAITS.get(first_trait, "Shows age-appropriate focus duration")
         
         # Compile strategies
-        strategies = [
-            "Break complex tasks into smaller segments",
-            "Provide clear transitions between activities",
-            "Use learning style-aligned engagement techniques",
-            "Offer periodic movement breaks"
-        ]
-        
         return {
             "characteristics": attention,
             "duration": focus,
-            "strategies": strategies
+            "strategies": _ATTENTION_STRATEGIES
         }
     
-    def _get_group_dynamics(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_group_dynamics(primary_style, first_trait, top_traits_set):
         """
         Determines the student's group work dynamics.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            first_trait (str): Highest ranked personality trait, None if there are none
+            top_traits_set (frozenset): Top personality traits for membership tests
             
         Returns:
             dict: Group dynamics insights
         """
-        # Role preferences by learning style
-        role_by_style = {
-            "visual": "May excel at creating visual representations for the group",
-            "auditory": "Often effective at verbal presentations and discussions",
-            "kinesthetic": "Prefers active roles in group activities",
-            "logical": "Naturally takes on problem-solving and planning roles",
-            "social": "Thrives in collaborative settings; often helps maintain group cohesion",
-            "independent": "May prefer defined individual contributions within group projects"
-        }
-        
-        # Collaboration style by traits
-        collab_by_traits = {
-            "analytical": "Contributes through careful analysis and attention to detail",
-            "creative": "Offers innovative ideas and unconventional approaches",
-            "persistent": "Helps keep the group on task and working through challenges",
-            "leadership": "Naturally assumes leadership or coordination roles",
-            "collaborative": "Excels at fostering cooperation and inclusive participation",
-            "organized": "Often manages project organization and timeline adherence"
-        }
-        
         # Get role preference
-        role = role_by_style.get(primary_style, "Adapts to various roles in group settings")
+        role = _ROLE_BY_STYLE.get(primary_style, "Adapts to various roles in group settings")
         
         # Get collaboration style based on top trait
-        collab = "Shows balanced collaboration style"
-        if top_traits and top_traits[0] in collab_by_traits:
-            collab = collab_by_traits[top_traits[0]]
+        collab = _COLLAB_BY_TRAITS.get(first_trait, "Shows balanced collaboration style")
         
         # Determine optimal group size and composition
         if primary_style in ["social", "auditory"]:
@@ -440,11 +1267,11 @@ class TeacherReportGenerator:
         else:
             group_size = "Adapts well to various group sizes"
         
-        if "leadership" in top_traits:
+        if "leadership" in top_traits_set:
             composition = "Benefits from groups where leadership opportunities exist"
-        elif "collaborative" in top_traits:
+        elif "collaborative" in top_traits_set:
             composition = "Thrives in groups with cooperative dynamics"
-        elif "analytical" in top_traits or "organized" in top_traits:
+        elif "analytical" in top_traits_set or "organized" in top_traits_set:
             composition = "Works well in groups with clear role definitions"
         else:
             composition = "Adapts to various group compositions"
@@ -456,569 +1283,124 @@ class TeacherReportGenerator:
             "optimal_composition": composition
         }
     
-    def _get_assessment_preferences(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_assessment_preferences(primary_style, first_trait):
         """
         Determines the student's assessment preferences.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            first_trait (str): Highest ranked personality trait, None if there are none
             
         Returns:
             dict: Assessment preferences insights
         """
-        # Preferred assessment types by learning style
-        assessment_by_style = {
-            "visual": ["Visual projects", "Diagram creation", "Written exams with visual components"],
-            "auditory": ["Oral presentations", "Debates", "Audio/video projects"],
-            "kinesthetic": ["Hands-on demonstrations", "Role-playing", "Model building"],
-            "logical": ["Problem-solving tasks", "Logical reasoning tests", "Structured projects"],
-            "social": ["Group presentations", "Collaborative projects", "Peer teaching"],
-            "independent": ["Research papers", "Individual projects", "Self-assessments"]
-        }
-        
-        # Assessment approach by traits
-        approach_by_traits = {
-            "analytical": "Methodical and detail-oriented approach to assessments",
-            "creative": "Brings creative elements to assessments; may excel with open-ended formats",
-            "persistent": "Thorough in preparation; perseveres through challenging assessments",
-            "leadership": "Confident in presentation-based assessments; may rush through details",
-            "collaborative": "Performs well in group assessments; may need encouragement for individual work",
-            "organized": "Well-prepared and structured approach to assessments"
-        }
-        
         # Get preferred assessment types
-        preferred = assessment_by_style.get(primary_style, ["Mixed assessment types"])
+        preferred = _ASSESSMENT_BY_STYLE.get(primary_style, ("Mixed assessment types",))
         
         # Get challenging assessment types (opposite of preferred)
-        challenging_map = {
-            "visual": ["Pure auditory assessments", "Extended essays without visual aids"],
-            "auditory": ["Silent reading comprehension", "Complex visual analysis"],
-            "kinesthetic": ["Extended written exams", "Passive listening assessments"],
-            "logical": ["Unstructured creative tasks", "Subjective assessments"],
-            "social": ["Individual timed tests", "Isolated research projects"],
-            "independent": ["Group performance assessments", "Team-based evaluations"]
-        }
-        
-        challenging = challenging_map.get(primary_style, ["Varies based on content"])
+        style = _STYLE_INDEX.get(primary_style)
+        challenging = _CHALLENGING_MAP[style] if style is not None else ("Varies based on content",)
         
         # Get assessment approach based on top trait
-        approach = "Balanced approach to assessments"
-        if top_traits and top_traits[0] in approach_by_traits:
-            approach = approach_by_traits[top_traits[0]]
+        approach = _ASSESSMENT_APPROACH_BY_TRAITS.get(first_trait, "Balanced approach to assessments")
         
         # Compile recommendations
-        recommendations = [
-            "Offer assessment options aligned with learning style when possible",
-            "Provide clear rubrics and expectations",
-            "Allow adequate preparation time",
-            "Balance assessment types throughout the term"
-        ]
-        
         return {
             "preferred_types": preferred,
             "challenging_types": challenging,
             "approach": approach,
-            "recommendations": recommendations
+            "recommendations": _ASSESSMENT_RECOMMENDATIONS
         }
     
-    def _generate_classroom_strategies(self, learning_styles, traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_classroom_strategies(primary_style, lead_traits):
         """
         Generates classroom strategies based on learning profile.
         
         Args:
-            learning_styles (dict): Learning style analysis results
-            traits (dict): Personality traits analysis results
+            primary_style (str): Primary learning style
+            lead_traits (tuple): Two highest ranked personality traits
             
         Returns:
             dict: Classroom strategies
         """
-        primary_style = learning_styles.get("primary", "")
-        top_traits = traits.get("top_traits", [])
-        
-        # Engagement strategies by learning style
-        engagement_by_style = {
-            "visual": [
-                "Use visual aids, diagrams, and charts",
-                "Provide written instructions alongside verbal ones",
-                "Incorporate color-coding for organization",
-                "Use graphic organizers for note-taking"
-            ],
-            "auditory": [
-                "Incorporate discussions and verbal explanations",
-                "Use audio recordings or read-alouds",
-                "Encourage verbal summarization of concepts",
-                "Implement think-pair-share activities"
-            ],
-            "kinesthetic": [
-                "Incorporate hands-on activities and manipulatives",
-                "Allow movement during learning when possible",
-                "Use role-play and physical demonstrations",
-                "Implement lab-style activities across subjects"
-            ],
-            "logical": [
-                "Provide clear, sequential instructions",
-                "Use problem-solving activities and puzzles",
-                "Explain the reasoning behind concepts",
-                "Incorporate pattern recognition activities"
-            ],
-            "social": [
-                "Implement collaborative learning activities",
-                "Use group discussions and projects",
-                "Incorporate peer teaching opportunities",
-                "Create interactive classroom experiences"
-            ],
-            "independent": [
-                "Provide self-directed learning opportunities",
-                "Allow for independent research projects",
-                "Offer choice in assignments when possible",
-                "Provide clear expectations for independent work"
-            ]
-        }
-        
-        # Motivation strategies by traits
-        motivation_by_traits = {
-            "analytical": [
-                "Provide complex problems to analyze",
-                "Offer opportunities to dive deep into topics",
-                "Recognize attention to detail and thoroughness"
-            ],
-            "creative": [
-                "Allow creative expression in assignments",
-                "Provide open-ended project options",
-                "Recognize and value unique approaches"
-            ],
-            "persistent": [
-                "Acknowledge effort and perseverance",
-                "Provide appropriately challenging material",
-                "Celebrate progress and improvement"
-            ],
-            "leadership": [
-                "Offer opportunities to lead small groups",
-                "Provide classroom responsibilities",
-                "Recognize positive influence on peers"
-            ],
-            "collaborative": [
-                "Create meaningful collaborative experiences",
-                "Recognize contributions to group success",
-                "Provide opportunities to help peers"
-            ],
-            "organized": [
-                "Recognize effective organization and planning",
-                "Provide tools for organization (templates, planners)",
-                "Acknowledge thorough and structured work"
-            ]
-        }
-        
         # Get engagement strategies
-        engagement = engagement_by_style.get(primary_style, [
-            "Use varied instructional approaches",
-            "Combine visual, auditory, and kinesthetic elements",
-            "Provide both structured and open-ended activities",
-            "Balance individual and group work"
-        ])
-        
-        # Get motivation strategies based on top traits
-        motivation = []
-        for trait in top_traits[:2]:  # Use top two traits
-            if trait in motivation_by_traits:
-                motivation.extend(motivation_by_traits[trait])
-        
-        if not motivation:
-            motivation = [
-                "Provide specific, meaningful feedback",
-                "Connect learning to real-world applications",
-                "Celebrate achievements and progress"
-            ]
+        engagement = _ENGAGEMENT_BY_STYLE.get(primary_style, _DEFAULT_ENGAGEMENT)
         
-        # Compile differentiation strategies
-        differentiation = [
-            "Adjust complexity of assignments based on readiness",
-            "Provide extension activities for deeper exploration",
-            "Offer multiple ways to demonstrate understanding",
-            "Vary grouping strategies based on learning objectives"
-        ]
+        # Get motivation strategies based on the top two traits
+        motivation = tuple(itertools.chain.from_iterable(
+            _MOTIVATION_BY_TRAITS.get(trait, _EMPTY) for trait in lead_traits
+        )) or _DEFAULT_MOTIVATION
         
+        # Compile differentiation strategies
         return {
             "engagement": engagement,
             "motivation": motivation,
-            "differentiation": differentiation
+            "differentiation": _DIFFERENTIATION_STRATEGIES
         }
     
-    def _generate_challenges_solutions(self, learning_styles, traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_challenges_solutions(primary_style, first_trait):
         """
         Generates potential challenges and solutions.
         
         Args:
-            learning_styles (dict): Learning style analysis results
-            traits (dict): Personality traits analysis results
+            primary_style (str): Primary learning style
+            first_trait (str): Highest ranked personality trait, None if there are none
             
         Returns:
-            list: Challenges and solutions
-        """
-        primary_style = learning_styles.get("primary", "")
-        top_traits = traits.get("top_traits", [])
-        
-        # Potential challenges by learning style
-        challenges_by_style = {
-            "visual": [
-                {
-                    "challenge": "May struggle with purely auditory instruction",
-                    "solutions": [
-                        "Provide visual supplements to verbal instruction",
-                        "Allow time to create visual notes or diagrams",
-                        "Use visual cues for important information"
-                    ]
-                },
-                {
-                    "challenge": "May miss details in verbal directions",
-                    "solutions": [
-                        "Provide written instructions for complex tasks",
-                        "Check for understanding through visual confirmation",
-                        "Use visual checklists for multi-step processes"
-                    ]
-                }
-            ],
-            "auditory": [
-                {
-                    "challenge": "May be distracted in noisy environments",
-                    "solutions": [
-                        "Provide quiet work spaces when possible",
-                        "Use noise-cancelling headphones for independent work",
-                        "Position away from high-traffic classroom areas"
-                    ]
-                },
-                {
-                    "challenge": "May struggle with complex visual information",
-                    "solutions": [
-                        "Provide verbal explanations of visual materials",
-                        "Allow verbal processing of visual information",
-                        "Break down visual information into smaller components"
-                    ]
-                }
-            ],
-            "kinesthetic": [
-                {
-                    "challenge": "May appear fidgety or restless during passive learning",
-                    "solutions": [
-                        "Incorporate movement breaks",
-                        "Provide fidget tools when appropriate",
-                        "Allow standing or alternative seating options"
-                    ]
-                },
-                {
-                    "challenge": "May rush through written work",
-                    "solutions": [
-                        "Break writing tasks into smaller segments",
-                        "Incorporate physical elements into writing tasks",
-                        "Provide clear structures for written assignments"
-                    ]
-                }
-            ],
-            "logical": [
-                {
-                    "challenge": "May question instructions or methods frequently",
-                    "solutions": [
-                        "Explain reasoning behind instructional decisions",
-                        "Provide logical frameworks for activities",
-                        "Allow time for questions and clarification"
-                    ]
-                },
-                {
-                    "challenge": "May struggle with creative or subjective tasks",
-                    "solutions": [
-                        "Provide clear criteria even for creative assignments",
-                        "Break down creative processes into logical steps",
-                        "Connect creative tasks to logical frameworks"
-                    ]
-                }
-            ],
-            "social": [
-                {
-                    "challenge": "May be chatty or distracted during independent work",
-                    "solutions": [
-                        "Provide clear expectations for quiet work time",
-                        "Use visual timers for independent work periods",
-                        "Balance independent work with collaborative opportunities"
-                    ]
-                },
-                {
-                    "challenge": "May rely too heavily on peers in group work",
-                    "solutions": [
-                        "Assign specific roles in group activities",
-                        "Require individual accountability within group projects",
-                        "Balance group work with individual assessments"
-                    ]
-                }
-            ],
-            "independent": [
-                {
-                    "challenge": "May resist group work or collaboration",
-                    "solutions": [
-                        "Provide clear individual roles within group projects",
-                        "Start with pair work before larger groups",
-                        "Explain the value of collaborative skills"
-                    ]
-                },
-                {
-                    "challenge": "May work too independently without seeking help",
-                    "solutions": [
-                        "Check in regularly during independent work",
-                        "Teach explicit help-seeking strategies",
-                        "Create safe opportunities to ask questions"
-                    ]
-                }
-            ]
-        }
-        
-        # Trait-based challenges
-        challenges_by_traits = {
-            "analytical": {
-                "challenge": "May get caught in details and miss big picture",
-                "solutions": [
-                    "Help connect details to overarching concepts",
-                    "Provide opportunities to synthesize information",
-                    "Use graphic organizers to show relationships between concepts"
-                ]
-            },
-            "creative": {
-                "challenge": "May pursue tangential ideas during lessons",
-                "solutions": [
-                    "Provide creative outlets within structured activities",
-                    "Allow time for creative exploration after core content",
-                    "Help connect creative ideas back to learning objectives"
-                ]
-            },
-            "persistent": {
-                "challenge": "May become frustrated when not immediately successful",
-                "solutions": [
-                    "Normalize struggle as part of learning",
-                    "Break challenging tasks into manageable steps",
-                    "Recognize effort and perseverance, not just results"
-                ]
-            },
-            "leadership": {
-                "challenge": "May dominate group activities",
-                "solutions": [
-                    "Assign specific roles in group work",
-                    "Teach collaborative leadership skills",
-                    "Provide leadership opportunities in appropriate contexts"
-                ]
-            },
-            "collaborative": {
-                "challenge": "May prioritize social harmony over academic rigor",
-                "solutions": [
-                    "Set clear academic expectations for group work",
-                    "Teach constructive academic discourse",
-                    "Model how to respectfully challenge ideas"
-                ]
-            },
-            "organized": {
-                "challenge": "May become anxious when routines are disrupted",
-                "solutions": [
-                    "Provide advance notice of schedule changes",
-                    "Teach flexibility strategies",
-                    "Help develop adaptable organizational systems"
-                ]
-            }
-        }
-        
+            tuple: Challenges and solutions
+        """
         # Get style-based challenges
-        challenges = challenges_by_style.get(primary_style, [
-            {
-                "challenge": "May need varied instructional approaches",
-                "solutions": [
-                    "Use multi-modal instruction",
-                    "Provide options for demonstrating understanding",
-                    "Check for understanding in different ways"
-                ]
-            }
-        ])
+        challenges = _challenges_by_style().get(primary_style, _DEFAULT_CHALLENGES)
         
         # Add trait-based challenge if relevant
-        if top_traits and top_traits[0] in challenges_by_traits:
-            challenges.append(challenges_by_traits[top_traits[0]])
+        trait_challenge = _challenges_by_traits().get(first_trait)
+        if trait_challenge is not None:
+            challenges = challenges + (trait_challenge,)
         
         return challenges
     
-    def _generate_strengths_growth_areas(self, learning_styles, traits, interests):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_strengths_growth_areas(primary_style, lead_traits, lead_interests):
         """
         Generates academic strengths and growth areas.
         
         Args:
-            learning_styles (dict): Learning style analysis results
-            traits (dict): Personality traits analysis results
-            interests (dict): Interest areas analysis results
+            primary_style (str): Primary learning style
+            lead_traits (tuple): Two highest ranked personality traits
+            lead_interests (tuple): Two highest ranked interest areas
             
         Returns:
-            dict: Strengths and growth areas
-        """
-        primary_style = learning_styles.get("primary", "")
-        top_traits = traits.get("top_traits", [])
-        top_interests = interests.get("top_interests", [])
-        
-        # Academic strengths by learning style
-        strengths_by_style = {
-            "visual": [
-                "Processing and remembering visual information",
-                "Creating visual representations of concepts",
-                "Understanding spatial relationships",
-                "Noticing visual patterns and details"
-            ],
-            "auditory": [
-                "Processing verbal instructions",
-                "Participating in discussions",
-                "Remembering spoken information",
-                "Verbal explanation of concepts"
-            ],
-            "kinesthetic": [
-                "Hands-on learning activities",
-                "Physical demonstrations of concepts",
-                "Learning through movement and touch",
-                "Applied and practical learning"
-            ],
-            "logical": [
-                "Systematic problem-solving",
-                "Recognizing patterns and relationships",
-                "Sequential and organized thinking",
-                "Abstract reasoning and analysis"
-            ],
-            "social": [
-                "Collaborative learning",
-                "Group discussions and projects",
-                "Peer teaching and learning",
-                "Communication and interpersonal skills"
-            ],
-            "independent": [
-                "Self-directed learning",
-                "Independent research and projects",
-                "Setting and pursuing learning goals",
-                "Focused individual work"
-            ]
-        }
-        
-        # Growth areas by learning style
-        growth_by_style = {
-            "visual": [
-                "Processing information without visual aids",
-                "Taking notes from verbal lectures",
-                "Expressing ideas verbally",
-                "Following multi-step verbal directions"
-            ],
-            "auditory": [
-                "Processing complex visual information",
-                "Creating visual representations",
-                "Working for extended periods in silence",
-                "Organizing information spatially"
-            ],
-            "kinesthetic": [
-                "Sitting still for extended periods",
-                "Abstract conceptual learning",
-                "Traditional test-taking",
-                "Detailed written work"
-            ],
-            "logical": [
-                "Creative and open-ended tasks",
-                "Subjective or ambiguous content",
-                "Emotional or social aspects of learning",
-                "Flexibility when approaches need to change"
-            ],
-            "social": [
-                "Extended independent work",
-                "Self-directed learning",
-                "Focusing in social environments",
-                "Individual assessment"
-            ],
-            "independent": [
-                "Collaborative projects",
-                "Group discussions and activities",
-                "Seeking help when needed",
-                "Sharing ideas in group settings"
-            ]
-        }
-        
-        # Get strengths based on learning style
-        strengths = strengths_by_style.get(primary_style, [
-            "Adaptable learning approach",
-            "Processing information in multiple ways",
-            "Balancing independent and collaborative work"
-        ])
-        
-        # Add trait-based strengths
-        trait_strengths = {
-            "analytical": "Detailed analysis and critical thinking",
-            "creative": "Creative problem-solving and innovative thinking",
-            "persistent": "Perseverance through challenging material",
-            "leadership": "Taking initiative and guiding peers",
-            "collaborative": "Working effectively with others",
-            "organized": "Systematic approach to learning and tasks"
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_strengths:
-                strengths.append(trait_strengths[trait])
+            StrengthsGrowth: Strengths and growth areas
+        """
+        # Get strengths based on learning style and the leading traits
+        strengths = _lookup_by_traits(
+            _STRENGTHS_TABLE, _STRENGTHS_BY_STYLE, _TRAIT_STRENGTHS,
+            primary_style, lead_traits
+        )
         
         # Get growth areas based on learning style
-        growth_areas = growth_by_style.get(primary_style, [
-            "Adapting to various instructional approaches",
-            "Balancing different learning modalities",
-            "Developing versatility in learning strategies"
-        ])
+        growth_areas = _GROWTH_BY_STYLE.get(primary_style, _DEFAULT_GROWTH_AREAS)
         
         # Add interest-based recommendations
-        recommendations = []
-        
-        interest_recommendations = {
-            "technology": [
-                "Incorporate technology tools for organization and learning",
-                "Connect academic concepts to technological applications",
-                "Explore coding or digital creation to reinforce concepts"
-            ],
-            "arts": [
-                "Use artistic expression to demonstrate understanding",
-                "Connect academic concepts to creative applications",
-                "Incorporate visual or performing arts into projects"
-            ],
-            "entrepreneurship": [
-                "Connect learning to real-world applications",
-                "Develop project management and planning skills",
-                "Practice presenting and communicating ideas"
-            ],
-            "science": [
-                "Emphasize scientific method across subject areas",
-                "Connect concepts to scientific principles",
-                "Incorporate inquiry-based approaches to learning"
-            ],
-            "language": [
-                "Strengthen vocabulary development across subjects",
-                "Practice clear written and verbal communication",
-                "Use storytelling to reinforce concepts"
-            ],
-            "mathematics": [
-                "Strengthen mathematical reasoning across subjects",
-                "Practice logical thinking and problem-solving",
-                "Connect abstract concepts to concrete applications"
-            ]
-        }
-        
-        for interest in top_interests[:2]:
-            if interest in interest_recommendations:
-                recommendations.extend(interest_recommendations[interest][:2])
-        
-        if not recommendations:
-            recommendations = [
-                "Provide balanced learning experiences across modalities",
-                "Connect learning to personal interests when possible",
-                "Develop metacognitive awareness of learning process"
-            ]
-        
-        return {
-            "strengths": strengths,
-            "growth_areas": growth_areas,
-            "recommendations": recommendations
-        }
+        recommendations = tuple(itertools.chain.from_iterable(
+            _INTEREST_RECOMMENDATIONS.get(interest, _EMPTY)[:2] for interest in lead_interests
+        )) or _DEFAULT_RECOMMENDATIONS
+        
+        return StrengthsGrowth(
+            strengths=strengths,
+            growth_areas=growth_areas,
+            recommendations=recommendations
+        )
     
-    def _generate_parent_alignment_insights(self, parent_comparison):
+    @staticmethod
+    def _generate_parent_alignment_insights(parent_comparison):
         """
         Generates insights on parent-student alignment.
         
@@ -1026,540 +1408,228 @@ class TeacherReportGenerator:
             parent_comparison (dict): Results from parent-student comparison
             
         Returns:
-            dict: Parent alignment insights
+            ParentAlignment: Parent alignment insights
         """
         if not parent_comparison:
-            return {
-                "alignment_areas": ["No parent comparison data available"],
-                "difference_areas": ["No parent comparison data available"],
-                "communication_strategies": [
-                    "Discuss learning preferences with both student and parents",
-                    "Share specific observations about learning style",
-                    "Provide concrete examples of effective strategies"
-                ]
-            }
+            return _NO_PARENT_ALIGNMENT
         
         # Extract alignment and difference areas
         alignment_areas = parent_comparison.get("alignment_areas", [])
         difference_areas = parent_comparison.get("difference_areas", [])
         
         # Generate communication strategies based on differences
-        communication_strategies = [
-            "Share specific observations about learning patterns",
-            "Provide concrete examples of classroom successes",
-            "Focus on strengths while addressing growth areas"
-        ]
-        
         if difference_areas:
-            communication_strategies.extend([
-                "Discuss different perspectives without judgment",
-                "Use student work samples to illustrate learning style",
-                "Suggest home activities aligned with learning preferences"
-            ])
+            communication_strategies = _COMMUNICATION_STRATEGIES_WITH_DIFFERENCES
+        else:
+            communication_strategies = _COMMUNICATION_STRATEGIES
         
-        return {
-            "alignment_areas": alignment_areas or ["Limited alignment data available"],
-            "difference_areas": difference_areas or ["Limited difference data available"],
-            "communication_strategies": communication_strategies
-        }
+        return ParentAlignment(
+            alignment_areas=tuple(alignment_areas) or _NO_ALIGNMENT_AREAS,
+            difference_areas=tuple(difference_areas) or _NO_DIFFERENCE_AREAS,
+            communication_strategies=communication_strategies
+        )
     
-    def _generate_math_aptitude_assessment(self, analysis_results):
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_math_aptitude_assessment(cls, primary_style, top_traits, top_traits_set, top_interests):
         """
         Generates mathematical aptitude assessment.
         
         Args:
-            analysis_results (dict): Results from learning style analysis
+            primary_style (str): Primary learning style
+            top_traits (tuple): Top personality traits
+            top_traits_set (frozenset): Top personality traits for membership tests
+            top_interests (tuple): Top interest areas
             
         Returns:
-            dict: Mathematical aptitude assessment
+            MathAptitude: Mathematical aptitude assessment
         """
-        # Extract relevant information
-        learning_styles = analysis_results.get("learning_styles", {})
-        traits = analysis_results.get("traits", {})
-        interests = analysis_results.get("interests", {})
-        
-        primary_style = learning_styles.get("primary", "")
-        top_traits = traits.get("top_traits", [])
-        top_interests = interests.get("top_interests", [])
+        # The per-trait math helpers only look at the two leading traits, so
+        # key their caches on those alone
+        lead_traits = top_traits[:2]
         
         # Assess math learning style
-        math_learning_style = self._assess_math_learning_style(primary_style, top_traits)
+        math_learning_style = cls._assess_math_learning_style(primary_style, top_traits_set)
         
         # Assess potential for Abacus & Vedic Math
-        abacus_vedic_potential = self._assess_abacus_vedic_potential(
+        abacus_vedic_potential = cls._assess_abacus_vedic_potential(
             primary_style,
-            top_traits,
+            lead_traits,
             top_interests
         )
         
         # Generate math strengths
-        math_strengths = self._generate_math_strengths(primary_style, top_traits)
+        math_strengths = cls._generate_math_strengths(primary_style, lead_traits)
         
         # Generate math challenges
-        math_challenges = self._generate_math_challenges(primary_style, top_traits)
+        math_challenges = cls._generate_math_challenges(primary_style, lead_traits)
         
         # Generate teaching strategies
-        teaching_strategies = self._generate_math_teaching_strategies(
+        teaching_strategies = cls._generate_math_teaching_strategies(
             primary_style,
-            top_traits
+            lead_traits
         )
         
-        return {
-            "math_learning_style": math_learning_style,
-            "abacus_vedic_potential": abacus_vedic_potential,
-            "strengths": math_strengths,
-            "challenges": math_challenges,
-            "teaching_strategies": teaching_strategies
-        }
+        return MathAptitude(
+            math_learning_style=math_learning_style,
+            abacus_vedic_potential=abacus_vedic_potential,
+            strengths=math_strengths,
+            challenges=math_challenges,
+            teaching_strategies=teaching_strategies
+        )
     
-    def _assess_math_learning_style(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _assess_math_learning_style(primary_style, top_traits_set):
         """
         Assesses the student's mathematical learning style.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            top_traits_set (frozenset): Top personality traits for membership tests
             
         Returns:
             str: Description of mathematical learning style
         """
-        math_styles = {
-            "visual": "Visual-spatial mathematical learner who benefits from diagrams, graphs, and visual representations of mathematical concepts. Likely to understand geometric concepts readily and may visualize number relationships.",
-            "auditory": "Verbal-mathematical learner who benefits from talking through problems and hearing explanations. May prefer word problems and verbal reasoning over abstract symbolic manipulation.",
-            "kinesthetic": "Tactile-mathematical learner who benefits from manipulatives and physical representations. Learns mathematical concepts best through hands-on activities and real-world applications.",
-            "logical": "Abstract-logical mathematical learner who naturally connects with mathematical patterns and relationships. Likely to enjoy the systematic nature of mathematics and abstract reasoning.",
-            "social": "Collaborative mathematical learner who benefits from discussing problems and working with others. May understand concepts better when explaining them to peers or working through problems in groups.",
-            "independent": "Reflective mathematical learner who benefits from time to process concepts independently. Likely to prefer working through problems at their own pace with time for deep thinking."
-        }
-        
         # Get base math learning style
-        style = math_styles.get(primary_style, "Balanced mathematical learner who can adapt to various approaches to mathematical concepts.")
+        parts = [_MATH_STYLES.get(primary_style, _DEFAULT_MATH_STYLE)]
         
         # Modify based on traits
-        if "analytical" in top_traits:
-            style += " Shows strong analytical thinking and attention to mathematical detail and precision."
-        if "creative" in top_traits:
-            style += " Demonstrates creative approaches to problem-solving and may find multiple solution paths."
-        if "persistent" in top_traits:
-            style += " Exhibits persistence when facing challenging mathematical problems."
-        
-        return style
+        parts.extend(suffix for trait, suffix in _MATH_STYLE_TRAIT_MODIFIERS if trait in top_traits_set)
+        
+        return "".join(parts)
     
-    def _assess_abacus_vedic_potential(self, primary_style, top_traits, top_interests):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _assess_abacus_vedic_potential(primary_style, top_traits, top_interests):
         """
         Assesses potential for Abacus & Vedic Math.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
-            top_interests (list): Top interest areas
+            top_traits (tuple): Top personality traits
+            top_interests (tuple): Top interest areas
             
         Returns:
-            dict: Assessment of potential for Abacus & Vedic Math
-        """
-        # Base potential by learning style
-        abacus_potential = {
-            "visual": "High",
-            "kinesthetic": "High",
-            "logical": "Medium-High",
-            "independent": "Medium",
-            "auditory": "Medium-Low",
-            "social": "Medium-Low"
-        }.get(primary_style, "Medium")
-        
-        vedic_potential = {
-            "logical": "High",
-            "visual": "Medium-High",
-            "independent": "Medium-High",
-            "auditory": "Medium",
-            "kinesthetic": "Medium-Low",
-            "social": "Medium-Low"
-        }.get(primary_style, "Medium")
-        
-        # Adjust based on traits
-        trait_adjustments = {
-            "analytical": {"abacus": 1, "vedic": 1},
-            "persistent": {"abacus": 1, "vedic": 1},
-            "organized": {"abacus": 1, "vedic": 1},
-            "creative": {"abacus": 0, "vedic": 1},
-            "leadership": {"abacus": 0, "vedic": 0},
-            "collaborative": {"abacus": -1, "vedic": -1}
-        }
+            AbacusVedic: Assessment of potential for Abacus & Vedic Math
+        """
+        # Base potential by learning style, as a PotentialLevel score
+        abacus_score = _ABACUS_POTENTIAL.get(primary_style, _POTENTIAL_DEFAULT)
+        vedic_score = _VEDIC_POTENTIAL.get(primary_style, _POTENTIAL_DEFAULT)
         
-        # Apply trait adjustments
+        # Apply trait adjustments one step at a time, clamping to the scale
         for trait in top_traits[:2]:
-            if trait in trait_adjustments:
-                # Adjust abacus potential
-                if trait_adjustments[trait]["abacus"] == 1:
-                    if abacus_potential == "Medium-Low":
-                        abacus_potential = "Medium"
-                    elif abacus_potential == "Medium":
-                        abacus_potential = "Medium-High"
-                    elif abacus_potential == "Medium-High":
-                        abacus_potential = "High"
-                elif trait_adjustments[trait]["abacus"] == -1:
-                    if abacus_potential == "High":
-                        abacus_potential = "Medium-High"
-                    elif abacus_potential == "Medium-High":
-                        abacus_potential = "Medium"
-                    elif abacus_potential == "Medium":
-                        abacus_potential = "Medium-Low"
-                
-                # Adjust vedic potential
-                if trait_adjustments[trait]["vedic"] == 1:
-                    if vedic_potential == "Medium-Low":
-                        vedic_potential = "Medium"
-                    elif vedic_potential == "Medium":
-                        vedic_potential = "Medium-High"
-                    elif vedic_potential == "Medium-High":
-                        vedic_potential = "High"
-                elif trait_adjustments[trait]["vedic"] == -1:
-                    if vedic_potential == "High":
-                        vedic_potential = "Medium-High"
-                    elif vedic_potential == "Medium-High":
-                        vedic_potential = "Medium"
-                    elif vedic_potential == "Medium":
-                        vedic_potential = "Medium-Low"
+            abacus_delta, vedic_delta = _TRAIT_ADJUSTMENTS.get(trait, (0, 0))
+            abacus_score = max(0, min(_POTENTIAL_MAX, abacus_score + abacus_delta))
+            vedic_score = max(0, min(_POTENTIAL_MAX, vedic_score + vedic_delta))
         
         # Further adjust if mathematics is a top interest
         if "mathematics" in top_interests:
-            if abacus_potential == "Medium-Low":
-                abacus_potential = "Medium"
-            elif abacus_potential == "Medium":
-                abacus_potential = "Medium-High"
-            elif abacus_potential == "Medium-High":
-                abacus_potential = "High"
-            
-            if vedic_potential == "Medium-Low":
-                vedic_potential = "Medium"
-            elif vedic_potential == "Medium":
-                vedic_potential = "Medium-High"
-            elif vedic_potential == "Medium-High":
-                vedic_potential = "High"
+            abacus_score = min(_POTENTIAL_MAX, abacus_score + 1)
+            vedic_score = min(_POTENTIAL_MAX, vedic_score + 1)
+        
+        abacus_potential = PotentialLevel(abacus_score)
+        vedic_potential = PotentialLevel(vedic_score)
         
         # Generate recommendations
-        abacus_recommendations = []
-        vedic_recommendations = []
-        
-        if abacus_potential in ["High", "Medium-High"]:
-            abacus_recommendations = [
-                "Consider introducing Abacus training to develop visual-spatial calculation skills",
-                "Start with basic Abacus concepts and progress based on interest and aptitude",
-                "Use Abacus training to strengthen mental math abilities"
-            ]
+        if abacus_potential >= PotentialLevel.MEDIUM_HIGH:
+            abacus_recommendations = _ABACUS_RECOMMENDATIONS_HIGH
         else:
-            abacus_recommendations = [
-                "Introduce Abacus concepts gradually if interest develops",
-                "Use physical manipulatives to build number sense before formal Abacus training",
-                "Consider alternative approaches to mental math development"
-            ]
-        
-        if vedic_potential in ["High", "Medium-High"]:
-            vedic_recommendations = [
-                "Consider introducing Vedic Math techniques to enhance calculation speed",
-                "Start with basic Vedic Math sutras and applications",
-                "Use Vedic Math to develop pattern recognition and mathematical intuition"
-            ]
+            abacus_recommendations = _ABACUS_RECOMMENDATIONS_LOW
+        
+        if vedic_potential >= PotentialLevel.MEDIUM_HIGH:
+            vedic_recommendations = _VEDIC_RECOMMENDATIONS_HIGH
         else:
-            vedic_recommendations = [
-                "Focus on building strong foundational math skills before introducing Vedic techniques",
-                "Introduce Vedic Math concepts gradually as supplements to traditional methods",
-                "Consider alternative approaches to developing mathematical fluency"
-            ]
+            vedic_recommendations = _VEDIC_RECOMMENDATIONS_LOW
         
-        return {
-            "abacus": {
-                "potential": abacus_potential,
-                "recommendations": abacus_recommendations
-            },
-            "vedic": {
-                "potential": vedic_potential,
-                "recommendations": vedic_recommendations
-            }
-        }
+        return AbacusVedic(
+            abacus=Potential(abacus_potential, abacus_recommendations),
+            vedic=Potential(vedic_potential, vedic_recommendations)
+        )
     
-    def _generate_math_strengths(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_math_strengths(primary_style, top_traits):
         """
         Generates mathematical strengths based on learning style and traits.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            top_traits (tuple): Top personality traits
             
         Returns:
-            list: Mathematical strengths
-        """
-        # Strengths by learning style
-        strengths_by_style = {
-            "visual": [
-                "Geometric reasoning and spatial relationships",
-                "Understanding visual patterns in mathematics",
-                "Interpreting graphs and visual data",
-                "Visualizing mathematical concepts"
-            ],
-            "auditory": [
-                "Verbal reasoning in mathematics",
-                "Following verbal explanations of mathematical concepts",
-                "Discussing mathematical ideas",
-                "Word problems and mathematical language"
-            ],
-            "kinesthetic": [
-                "Hands-on mathematical activities",
-                "Applied and practical mathematics",
-                "Using manipulatives effectively",
-                "Real-world mathematical applications"
-            ],
-            "logical": [
-                "Abstract mathematical reasoning",
-                "Recognizing patterns and relationships",
-                "Systematic problem-solving",
-                "Logical proofs and deductions"
-            ],
-            "social": [
-                "Collaborative problem-solving",
-                "Explaining mathematical concepts to others",
-                "Learning from mathematical discussions",
-                "Group mathematical projects"
-            ],
-            "independent": [
-                "Self-directed mathematical exploration",
-                "Focused individual problem-solving",
-                "Developing personal mathematical strategies",
-                "Independent mathematical research"
-            ]
-        }
-        
-        # Get base strengths from learning style
-        strengths = strengths_by_style.get(primary_style, [
-            "Adaptable approach to mathematical concepts",
-            "Balancing different mathematical thinking styles",
-            "Applying various strategies to problem-solving"
-        ])
-        
-        # Add trait-based strengths
-        trait_strengths = {
-            "analytical": "Detailed mathematical analysis and precision",
-            "creative": "Creative approaches to mathematical problem-solving",
-            "persistent": "Perseverance through challenging mathematical problems",
-            "leadership": "Taking initiative in mathematical discussions and group work",
-            "collaborative": "Working effectively with others on mathematical tasks",
-            "organized": "Systematic approach to mathematical procedures and problem-solving"
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_strengths:
-                strengths.append(trait_strengths[trait])
-        
-        return strengths
+            tuple: Mathematical strengths
+        """
+        # Style-based strengths followed by those of the leading traits
+        return _lookup_by_traits(
+            _MATH_STRENGTHS_TABLE, _MATH_STRENGTHS_BY_STYLE, _MATH_TRAIT_STRENGTHS,
+            primary_style, top_traits
+        )
     
-    def _generate_math_challenges(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_math_challenges(primary_style, top_traits):
         """
         Generates mathematical challenges based on learning style and traits.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            top_traits (tuple): Top personality traits
             
         Returns:
-            list: Mathematical challenges
-        """
-        # Challenges by learning style
-        challenges_by_style = {
-            "visual": [
-                "Abstract mathematical concepts without visual representation",
-                "Showing work in a step-by-step manner",
-                "Verbal mathematical explanations",
-                "Mental math without visual aids"
-            ],
-            "auditory": [
-                "Complex visual or spatial mathematics",
-                "Silent, independent mathematical work",
-                "Geometric reasoning",
-                "Visual pattern recognition"
-            ],
-            "kinesthetic": [
-                "Abstract mathematical theory",
-                "Extended periods of seated mathematical work",
-                "Multi-step problems without concrete application",
-                "Showing detailed written work"
-            ],
-            "logical": [
-                "Creative or open-ended mathematical problems",
-                "Mathematical concepts without clear patterns",
-                "Showing work when solution paths seem obvious",
-                "Collaborative mathematical tasks"
-            ],
-            "social": [
-                "Independent mathematical practice",
-                "Silent, focused mathematical work",
-                "Abstract mathematical reasoning",
-                "Detailed individual problem-solving"
-            ],
-            "independent": [
-                "Collaborative mathematical projects",
-                "Explaining mathematical thinking to others",
-                "Group problem-solving activities",
-                "Seeking help with mathematical challenges"
-            ]
-        }
-        
-        # Get base challenges from learning style
-        challenges = challenges_by_style.get(primary_style, [
-            "Adapting to various mathematical teaching approaches",
-            "Balancing conceptual and procedural understanding",
-            "Connecting abstract and applied mathematics"
-        ])
-        
-        # Add trait-based challenges
-        trait_challenges = {
-            "analytical": "May get caught in mathematical details and miss broader concepts",
-            "creative": "May use unconventional approaches that are difficult to assess",
-            "persistent": "May become frustrated when mathematical solutions aren't readily apparent",
-            "leadership": "May dominate group mathematical activities",
-            "collaborative": "May rely too heavily on others during mathematical problem-solving",
-            "organized": "May struggle with open-ended or creative mathematical tasks"
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_challenges:
-                challenges.append(trait_challenges[trait])
-        
-        return challenges
+            tuple: Mathematical challenges
+        """
+        # Style-based challenges followed by those of the leading traits
+        return _lookup_by_traits(
+            _MATH_CHALLENGES_TABLE, _MATH_CHALLENGES_BY_STYLE, _MATH_TRAIT_CHALLENGES,
+            primary_style, top_traits
+        )
     
-    def _generate_math_teaching_strategies(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_math_teaching_strategies(primary_style, top_traits):
         """
         Generates mathematical teaching strategies based on learning style and traits.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            top_traits (tuple): Top personality traits
             
         Returns:
-            list: Mathematical teaching strategies
-        """
-        # Strategies by learning style
-        strategies_by_style = {
-            "visual": [
-                "Use visual models, diagrams, and graphs",
-                "Incorporate color-coding for mathematical processes",
-                "Provide visual step-by-step procedures",
-                "Use graphic organizers for mathematical concepts"
-            ],
-            "auditory": [
-                "Explain mathematical concepts verbally",
-                "Encourage mathematical discussions and think-alouds",
-                "Use rhythmic patterns for mathematical memorization",
-                "Incorporate mathematical vocabulary development"
-            ],
-            "kinesthetic": [
-                "Use manipulatives and hands-on activities",
-                "Incorporate movement into mathematical learning",
-                "Connect mathematics to real-world applications",
-                "Use physical models for abstract concepts"
-            ],
-            "logical": [
-                "Emphasize patterns and relationships in mathematics",
-                "Provide logical sequences and clear procedures",
-                "Encourage analytical thinking and reasoning",
-                "Connect new concepts to previously learned material"
-            ],
-            "social": [
-                "Incorporate collaborative problem-solving",
-                "Use mathematical discussions and peer teaching",
-                "Implement group projects with mathematical components",
-                "Create opportunities for mathematical communication"
-            ],
-            "independent": [
-                "Provide self-directed mathematical exploration opportunities",
-                "Allow time for independent problem-solving",
-                "Offer choice in mathematical practice activities",
-                "Provide clear expectations for independent work"
-            ]
-        }
-        
-        # Get base strategies from learning style
-        strategies = strategies_by_style.get(primary_style, [
-            "Use multi-modal approaches to mathematical instruction",
-            "Balance conceptual understanding with procedural fluency",
-            "Provide both independent and collaborative mathematical experiences",
-            "Connect abstract concepts to concrete applications"
-        ])
-        
-        # Add trait-based strategies
-        trait_strategies = {
-            "analytical": [
-                "Provide opportunities for detailed mathematical analysis",
-                "Encourage precision and attention to mathematical detail"
-            ],
-            "creative": [
-                "Allow for multiple solution paths",
-                "Incorporate open-ended mathematical problems"
-            ],
-            "persistent": [
-                "Provide appropriately challenging mathematical tasks",
-                "Recognize effort and perseverance in mathematics"
-            ],
-            "leadership": [
-                "Provide opportunities to lead mathematical discussions",
-                "Encourage positive mathematical leadership"
-            ],
-            "collaborative": [
-                "Create meaningful collaborative mathematical experiences",
-                "Teach effective mathematical communication"
-            ],
-            "organized": [
-                "Provide organizational tools for mathematical work",
-                "Recognize systematic approaches to problem-solving"
-            ]
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_strategies:
-                strategies.extend(trait_strategies[trait])
-        
-        # Add Abacus and Vedic Math specific strategies
-        strategies.extend([
-            "Consider introducing Abacus for visual-spatial calculation development",
-            "Explore Vedic Mathematics for mental math and calculation speed",
-            "Balance traditional and alternative mathematical approaches"
-        ])
-        
-        return strategies
+            tuple: Mathematical teaching strategies
+        """
+        # Style-based strategies, those of the leading traits, then the Abacus
+        # and Vedic Math specific strategies
+        return _lookup_by_traits(
+            _MATH_STRATEGIES_TABLE, _MATH_STRATEGIES_BY_STYLE, _MATH_TRAIT_STRATEGIES,
+            primary_style, top_traits
+        )
     
-    def _generate_exam_readiness(self, student_info, analysis_results):
+    @classmethod
+    def _generate_exam_readiness(cls, age, primary_style, top_traits):
         """
         Generates examination readiness assessment.
         
         Args:
-            student_info (dict): Student information
-            analysis_results (dict): Results from learning style analysis
+            age (int): Student's age
+            primary_style (str): Primary learning style
+            top_traits (tuple): Top personality traits
             
         Returns:
             dict: Examination readiness assessment
         """
-        # Extract relevant information
-        age = student_info.get("age", 10)
-        grade = student_info.get("grade", age - 5)  # Estimate grade if not provided
-        
-        learning_styles = analysis_results.get("learning_styles", {})
-        traits = analysis_results.get("traits", {})
-        
-        primary_style = learning_styles.get("primary", "")
-        top_traits = traits.get("top_traits", [])
+        # The exam helpers only look at the two leading traits; slice them
+        # once and key the helper caches on that pair
+        lead_traits = top_traits[:2]
         
         # Determine age-appropriate global examinations
-        global_exams = self._get_age_appropriate_exams(age, grade)
+        global_exams = cls._get_age_appropriate_exams(age)
         
-        # Assess exam-taking strengths
-        exam_strengths = self._assess_exam_strengths(primary_style, top_traits)
-        
-        # Assess exam-taking challenges
-        exam_challenges = self._assess_exam_challenges(primary_style, top_traits)
-        
-        # Generate exam preparation strategies
-        preparation_strategies = self._generate_exam_preparation_strategies(
+        # Assess exam-taking strengths and challenges and generate exam
+        # preparation strategies
+        exam_strengths, exam_challenges, preparation_strategies = cls._assess_exam(
             primary_style,
-            top_traits
+            lead_traits
         )
         
         return {
@@ -1569,176 +1639,24 @@ class TeacherReportGenerator:
             "preparation_strategies": preparation_strategies
         }
     
-    def _get_age_appropriate_exams(self, age, grade):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_age_appropriate_exams(age):
         """
         Determines age-appropriate global examinations.
         
         Args:
             age (int): Student's age
-            grade (int): Student's grade level
             
         Returns:
-            list: Age-appropriate global examinations
-        """
-        # Elementary school exams (ages 5-10, grades K-5)
-        elementary_exams = [
-            {
-                "name": "International Mathematics Olympiad (IMO)",
-                "description": "Elementary level mathematics competition for young students",
-                "age_range": "Grades 1-5",
-                "benefits": "Develops problem-solving skills and mathematical thinking",
-                "preparation": "Regular practice with mathematical puzzles and problems"
-            },
-            {
-                "name": "International English Olympiad (IEO)",
-                "description": "English language and comprehension competition for elementary students",
-                "age_range": "Grades 1-5",
-                "benefits": "Enhances vocabulary, grammar, and reading comprehension",
-                "preparation": "Regular reading practice and language exercises"
-            },
-            {
-                "name": "National Science Olympiad (NSO)",
-                "description": "Science competition covering age-appropriate scientific concepts",
-                "age_range": "Grades 1-5",
-                "benefits": "Develops scientific thinking and knowledge",
-                "preparation": "Exploring scientific concepts through experiments and reading"
-            },
-            {
-                "name": "ASSET (Assessment of Scholastic Skills through Educational Testing)",
-                "description": "Diagnostic test assessing conceptual understanding across subjects",
-                "age_range": "Grades 3-5",
-                "benefits": "Provides detailed feedback on conceptual understanding",
-                "preparation": "Focus on understanding concepts rather than memorization"
-            }
-        ]
-        
-        # Middle school exams (ages 11-13, grades 6-8)
-        middle_exams = [
-            {
-                "name": "International Mathematics Olympiad (IMO)",
-                "description": "Challenging mathematics competition for middle school students",
-                "age_range": "Grades 6-8",
-                "benefits": "Develops advanced problem-solving and mathematical reasoning",
-                "preparation": "Regular practice with challenging math problems"
-            },
-            {
-                "name": "International Science Olympiad (ISO)",
-                "description": "Science competition covering physics, chemistry, and biology",
-                "age_range": "Grades 6-8",
-                "benefits": "Enhances scientific knowledge and analytical thinking",
-                "preparation": "In-depth study of scientific concepts and principles"
-            },
-            {
-                "name": "ASSET (Assessment of Scholastic Skills through Educational Testing)",
-                "description": "Diagnostic test assessing conceptual understanding across subjects",
-                "age_range": "Grades 6-8",
-                "benefits": "Provides detailed feedback on conceptual understanding",
-                "preparation": "Focus on understanding concepts rather than memorization"
-            },
-            {
-                "name": "International English Olympiad (IEO)",
-                "description": "English language competition for middle school students",
-                "age_range": "Grades 6-8",
-                "benefits": "Enhances language skills and critical reading",
-                "preparation": "Regular reading, writing practice, and vocabulary development"
-            },
-            {
-                "name": "American Mathematics Competition 8 (AMC 8)",
-                "description": "Mathematics competition for middle school students",
-                "age_range": "Grades 6-8",
-                "benefits": "Develops problem-solving skills and mathematical thinking",
-                "preparation": "Regular practice with challenging math problems"
-            }
-        ]
-        
-        # High school exams (ages 14-18, grades 9-12)
-        high_exams = [
-            {
-                "name": "PSAT/NMSQT (Preliminary SAT/National Merit Scholarship Qualifying Test)",
-                "description": "Preliminary version of the SAT, used for National Merit Scholarships",
-                "age_range": "Grades 10-11",
-                "benefits": "Prepares for SAT and qualifies for scholarships",
-                "preparation": "Practice tests and targeted study in critical reading, math, and writing"
-            },
-            {
-                "name": "SAT (Scholastic Assessment Test)",
-                "description": "College admission test measuring reading, writing, and math skills",
-                "age_range": "Grades 11-12",
-                "benefits": "Required for many college applications",
-                "preparation": "Regular practice tests and subject-specific study"
-            },
-            {
-                "name": "ACT (American College Testing)",
-                "description": "College admission test covering English, math, reading, and science",
-                "age_range": "Grades 11-12",
-                "benefits": "Alternative to SAT for college applications",
-                "preparation": "Practice tests and subject-specific study"
-            },
-            {
-                "name": "AP (Advanced Placement) Exams",
-                "description": "College-level exams in specific subject areas",
-                "age_range": "Grades 10-12",
-                "benefits": "Can earn college credit and demonstrate subject mastery",
-                "preparation": "AP courses and intensive subject study"
-            },
-            {
-                "name": "International Baccalaureate (IB) Exams",
-                "description": "Rigorous international education program exams",
-                "age_range": "Grades 11-12",
-                "benefits": "Internationally recognized qualification",
-                "preparation": "IB Diploma Programme coursework"
-            },
-            {
-                "name": "American Mathematics Competition (AMC 10/12)",
-                "description": "Mathematics competition for high school students",
-                "age_range": "Grades 9-12",
-                "benefits": "Develops advanced mathematical problem-solving",
-                "preparation": "Regular practice with challenging math problems"
-            },
-            {
-                "name": "Science Olympiads (Physics, Chemistry, Biology)",
-                "description": "Subject-specific science competitions",
-                "age_range": "Grades 9-12",
-                "benefits": "Develops deep subject knowledge and problem-solving",
-                "preparation": "In-depth study and laboratory practice"
-            }
-        ]
-        
-        # Aptitude tests for all age groups
-        aptitude_tests = [
-            {
-                "name": "Cognitive Abilities Test (CogAT)",
-                "description": "Measures reasoning abilities in verbal, quantitative, and nonverbal areas",
-                "age_range": "K-12",
-                "benefits": "Identifies cognitive strengths and learning styles",
-                "preparation": "Exposure to diverse problem-solving activities"
-            },
-            {
-                "name": "Naglieri Nonverbal Ability Test (NNAT)",
-                "description": "Nonverbal test of general ability using geometric shapes and patterns",
-                "age_range": "K-12",
-                "benefits": "Assesses ability independent of language and cultural background",
-                "preparation": "Practice with pattern recognition and spatial reasoning"
-            },
-            {
-                "name": "Otis-Lennon School Ability Test (OLSAT)",
-                "description": "Measures abstract thinking and reasoning ability",
-                "age_range": "K-12",
-                "benefits": "Assesses aptitude for learning",
-                "preparation": "Practice with verbal and nonverbal reasoning problems"
-            }
-        ]
+            dict: Age-appropriate academic exams and aptitude tests
+        """
+        # Select age-appropriate exams; bisect_left keeps each cut age in
+        # the younger tier
+        appropriate_exams = _EXAM_TIERS[bisect_left(_EXAM_AGE_CUTS, age)]
         
-        # Select age-appropriate exams
-        if age <= 10:  # Elementary school
-            appropriate_exams = elementary_exams
-            appropriate_aptitude = aptitude_tests
-        elif age <= 13:  # Middle school
-            appropriate_exams = middle_exams
-            appropriate_aptitude = aptitude_tests
-        else:  # High school
-            appropriate_exams = high_exams
-            appropriate_aptitude = aptitude_tests
+        # Aptitude tests suit all age groups
+        appropriate_aptitude = _APTITUDE_TESTS
         
         # Combine and return
         return {
@@ -1746,253 +1664,40 @@ class TeacherReportGenerator:
             "aptitude_tests": appropriate_aptitude
         }
     
-    def _assess_exam_strengths(self, primary_style, top_traits):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _assess_exam(primary_style, lead_traits):
         """
-        Assesses exam-taking strengths based on learning style and traits.
+        Assesses exam-taking strengths and challenges and generates exam
+        preparation strategies in a single pass over the traits.
         
         Args:
             primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
+            lead_traits (tuple): Two highest ranked personality traits
             
         Returns:
-            list: Exam-taking strengths
-        """
-        # Strengths by learning style
-        strengths_by_style = {
-            "visual": [
-                "Processing visual information in exams",
-                "Interpreting graphs, charts, and diagrams",
-                "Remembering information presented visually",
-                "Spatial reasoning questions"
-            ],
-            "auditory": [
-                "Recalling information from discussions",
-                "Processing verbal instructions in exams",
-                "Language-based questions",
-                "Verbal reasoning sections"
-            ],
-            "kinesthetic": [
-                "Practical or lab-based assessments",
-                "Exams with manipulative components",
-                "Applied problem-solving questions",
-                "Performance-based assessments"
-            ],
-            "logical": [
-                "Logical reasoning questions",
-                "Mathematical problem-solving",
-                "Sequential thinking tasks",
-                "Pattern recognition questions"
-            ],
-            "social": [
-                "Group assessment components",
-                "Discussion-based evaluations",
-                "Collaborative problem-solving tasks",
-                "Interpersonal scenario questions"
-            ],
-            "independent": [
-                "Self-paced exam sections",
-                "Independent problem-solving questions",
-                "Extended response questions",
-                "Research-based assessments"
-            ]
-        }
-        
-        # Get base strengths from learning style
-        strengths = strengths_by_style.get(primary_style, [
-            "Adapting to various question formats",
-            "Balancing different cognitive approaches",
-            "Processing information in multiple formats"
-        ])
-        
-        # Add trait-based strengths
-        trait_strengths = {
-            "analytical": "Detailed analysis of complex questions",
-            "creative": "Novel approaches to problem-solving questions",
-            "persistent": "Maintaining focus throughout lengthy exams",
-            "leadership": "Confidence in assessment situations",
-            "collaborative": "Effective performance in group assessment components",
-            "organized": "Systematic approach to exam questions and time management"
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_strengths:
-                strengths.append(trait_strengths[trait])
-        
-        return strengths
-    
-    def _assess_exam_challenges(self, primary_style, top_traits):
+            tuple: Exam-taking strengths, exam-taking challenges and exam
+                preparation strategies, each a tuple
         """
-        Assesses exam-taking challenges based on learning style and traits.
-        
-        Args:
-            primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
-            
-        Returns:
-            list: Exam-taking challenges
-        """
-        # Challenges by learning style
-        challenges_by_style = {
-            "visual": [
-                "Extended reading without visual supports",
-                "Purely auditory instructions or content",
-                "Remembering verbal information without visual cues",
-                "Writing extensive text responses"
-            ],
-            "auditory": [
-                "Complex visual information without verbal explanation",
-                "Silent reading comprehension under time pressure",
-                "Interpreting detailed graphs or diagrams",
-                "Spatial reasoning questions"
-            ],
-            "kinesthetic": [
-                "Sitting still for extended exam periods",
-                "Abstract theoretical questions",
-                "Limited physical interaction with materials",
-                "Extended writing tasks"
-            ],
-            "logical": [
-                "Ambiguous or open-ended questions",
-                "Subjective assessment criteria",
-                "Creative writing or expression tasks",
-                "Questions without clear logical structure"
-            ],
-            "social": [
-                "Extended individual work without interaction",
-                "Competitive assessment environments",
-                "Limited verbal processing opportunities",
-                "Isolated problem-solving under pressure"
-            ],
-            "independent": [
-                "Group assessment components",
-                "Time pressure that limits reflection",
-                "Collaborative problem-solving requirements",
-                "Verbal presentation components"
-            ]
-        }
-        
-        # Get base challenges from learning style
-        challenges = challenges_by_style.get(primary_style, [
-            "Adapting to unfamiliar question formats",
-            "Managing time across different question types",
-            "Balancing speed and accuracy"
-        ])
-        
-        # Add trait-based challenges
-        trait_challenges = {
-            "analytical": "May spend too much time on detailed analysis of questions",
-            "creative": "May use unconventional approaches that don't match scoring criteria",
-            "persistent": "May perseverate on difficult questions instead of moving on",
-            "leadership": "May rush through individual assessment components",
-            "collaborative": "May struggle with competitive assessment environments",
-            "organized": "May become anxious if exam structure differs from expectations"
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_challenges:
-                challenges.append(trait_challenges[trait])
-        
-        return challenges
+        # Read the precomputed style and trait combination
+        return _lookup_by_traits(
+            _EXAM_TABLE, _EXAM_BY_STYLE, _EXAM_BY_TRAIT,
+            primary_style, lead_traits
+        )
+
+def _render_one(task):
+    """
+    Renders a single report inside a worker process.
     
-    def _generate_exam_preparation_strategies(self, primary_style, top_traits):
-        """
-        Generates exam preparation strategies based on learning style and traits.
-        
-        Args:
-            primary_style (str): Primary learning style
-            top_traits (list): Top personality traits
-            
-        Returns:
-            list: Exam preparation strategies
-        """
-        # Strategies by learning style
-        strategies_by_style = {
-            "visual": [
-                "Use visual study aids like mind maps and diagrams",
-                "Convert notes into visual formats",
-                "Practice with visual practice questions",
-                "Use color-coding for organizing information"
-            ],
-            "auditory": [
-                "Record and listen to study materials",
-                "Discuss concepts verbally",
-                "Use mnemonic devices and verbal repetition",
-                "Participate in study groups with discussion"
-            ],
-            "kinesthetic": [
-                "Use movement while studying",
-                "Create physical models or manipulatives",
-                "Take breaks for physical activity",
-                "Practice with hands-on simulations when possible"
-            ],
-            "logical": [
-                "Organize study materials in logical sequences",
-                "Create systematic study plans",
-                "Practice with problem-solving questions",
-                "Look for patterns and connections between concepts"
-            ],
-            "social": [
-                "Form study groups",
-                "Teach concepts to others",
-                "Discuss practice questions with peers",
-                "Use collaborative study techniques"
-            ],
-            "independent": [
-                "Create personalized study schedules",
-                "Find quiet, focused study environments",
-                "Set individual study goals",
-                "Self-test regularly"
-            ]
-        }
-        
-        # Get base strategies from learning style
-        strategies = strategies_by_style.get(primary_style, [
-            "Use multi-modal study techniques",
-            "Balance individual and group study",
-            "Practice with various question formats",
-            "Develop personalized study routines"
-        ])
-        
-        # Add trait-based strategies
-        trait_strategies = {
-            "analytical": [
-                "Practice analyzing complex questions",
-                "Develop systematic approaches to different question types"
-            ],
-            "creative": [
-                "Balance creative thinking with standard approaches",
-                "Practice identifying what scoring criteria require"
-            ],
-            "persistent": [
-                "Set time limits for practice questions",
-                "Develop strategies for knowing when to move on"
-            ],
-            "leadership": [
-                "Practice careful reading of all instructions",
-                "Develop patience with detailed individual work"
-            ],
-            "collaborative": [
-                "Balance collaborative study with independent practice",
-                "Simulate test conditions during some practice sessions"
-            ],
-            "organized": [
-                "Create detailed study plans",
-                "Practice with unfamiliar formats to build flexibility"
-            ]
-        }
-        
-        for trait in top_traits[:2]:
-            if trait in trait_strategies:
-                strategies.extend(trait_strategies[trait])
-        
-        # Add general exam strategies
-        general_strategies = [
-            "Practice with timed conditions",
-            "Develop effective test-taking strategies",
-            "Learn relaxation techniques for test anxiety",
-            "Ensure physical readiness (sleep, nutrition, etc.)"
-        ]
-        
-        strategies.extend(general_strategies)
+    Each worker builds its generator from the shared per-process Jinja
+    environment, so templates are compiled at most once per worker.
+    
+    Args:
+        task (tuple): Templates directory followed by the _write_report arguments
         
-        return strategies
+    Returns:
+        str: Path to the generated HTML report
+    """
+    templates_dir, student_info, analysis_results, parent_comparison, output_dir = task
+    generator = TeacherReportGenerator(templates_dir)
+    return generator._write_report(student_info, analysis_results, parent_comparison, output_dir)
@@ -3,9 +3,9 @@ SQLite database configuration for LearningLens application
 """
 import os
 import sqlite3
-from datetime import datetime
+import threading
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -17,11 +17,53 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 # Initialize SQLAlchemy
 db = SQLAlchemy()
 
-# Create engine and session
-engine = create_engine(SQLALCHEMY_DATABASE_URI)
+# SQLite settings applied once to every pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Raw connections also map the database file for reads
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+# Raw SQLite connections, one per thread, reused across get_db_connection calls
+_thread_local = threading.local()
+
+# Create engine and session; file-backed SQLite keeps its connections pooled
+# across requests, so they are opened and tuned once rather than per request
+engine = create_engine(SQLALCHEMY_DATABASE_URI, future=True)
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply the SQLite pragmas when the pool opens a new connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 db_session = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 Base = declarative_base()
-Base.query = db_session.query_property()
+
+# Models used by init_db, imported on first use so that importing this module
+# never pulls in the models, then kept for later calls
+_admin_models = None
+
+def _get_admin_models():
+    """Import the User and Role models once and return them"""
+    global _admin_models
+    if _admin_models is None:
+        from models import User, Role
+        _admin_models = (User, Role)
+    return _admin_models
+
+def _database_has_tables():
+    """Check with a single query whether the database already has tables"""
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' LIMIT 1"
+        ).first() is not None
 
 def init_db(app):
     """Initialize the database with the app context"""
@@ -30,26 +72,52 @@ def init_db(app):
     db.init_app(app)
     
     with app.app_context():
-        db.create_all()
+        # Create the schema in one transaction, without per-table existence
+        # checks, only when the database is new
+        if not _database_has_tables():
+            with engine.begin() as conn:
+                db.metadata.create_all(conn, checkfirst=False)
+        
         # Initialize admin user if not exists
-        from models import User, Role
-        if not User.query.filter_by(username='admin').first():
+        User, Role = _get_admin_models()
+        
+        # Resolve the thread's session once instead of through the proxy on
+        # every call
+        session = db_session()
+        if not session.query(User.id).filter_by(username='admin').first():
+            # Hash the password before opening the transaction, since the
+            # hash is deliberately slow
+            admin_password_hash = User.generate_password_hash('admin123')
+            
             admin_role = Role(name='admin')
-            db_session.add(admin_role)
-            db_session.commit()
+            session.add(admin_role)
+            session.flush()  # Assigns admin_role.id without committing
             
             admin_user = User(
                 username='admin',
                 email='admin@learninglens.com',
-                password_hash=User.generate_password_hash('admin123'),
-                role_id=admin_role.id,
-                created_at=datetime.now()
+                password_hash=admin_password_hash,
+                role_id=admin_role.id
             )
-            db_session.add(admin_user)
-            db_session.commit()
+            session.add(admin_user)
+            
+            # Role and user are written in a single transaction
+            session.commit()
 
 def get_db_connection():
-    """Get a direct SQLite connection for raw queries"""
+    """Get a direct SQLite connection for raw queries, reused within a thread"""
+    conn = getattr(_thread_local, 'conn', None)
+    if conn is not None:
+        try:
+            conn.total_changes  # Raises once a caller has closed the connection
+            return conn
+        except sqlite3.ProgrammingError:
+            pass
+    
     conn = sqlite3.connect(SQLITE_DB_PATH)
     conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    _thread_local.conn = conn
     return conn
@@ -3,34 +3,10 @@ Domain and SSL configuration for Render deployment
 """
 
 import os
+from pathlib import Path
 
-def get_render_config():
-    """
-    Generate configuration for Render deployment
-    """
-    return {
-        "name": "learninglens",
-        "env": "python",
-        "buildCommand": "pip install -r requirements.txt",
-        "startCommand": "gunicorn wsgi:application",
-        "envVars": [
-            {"key": "FLASK_ENV", "value": "production"},
-            {"key": "SECRET_KEY", "value": "{{ .Secrets.SECRET_KEY }}"},
-            {"key": "DATABASE_URL", "value": "{{ .Secrets.DATABASE_URL }}"},
-            {"key": "MAIL_USERNAME", "value": "{{ .Secrets.MAIL_USERNAME }}"},
-            {"key": "MAIL_PASSWORD", "value": "{{ .Secrets.MAIL_PASSWORD }}"},
-            {"key": "ADMIN_EMAIL", "value": "helpdesk@shiningstaronline.com"}
-        ],
-        "healthCheckPath": "/",
-        "autoDeploy": True,
-        "domains": ["learninglens.shiningstaronline.com"]
-    }
-
-def generate_render_yaml():
-    """
-    Generate render.yaml file for Render Blueprint deployment
-    """
-    render_yaml = """
+# Generated deployment files, encoded once at import
+_RENDER_YAML = """
 services:
   - type: web
     name: learninglens
@@ -60,18 +36,9 @@ databases:
     databaseName: learninglens
     user: learninglens_user
     plan: starter
-"""
-    
-    with open('render.yaml', 'w') as f:
-        f.write(render_yaml)
-    
-    print("Generated render.yaml for Render Blueprint deployment")
+""".encode('utf-8')
 
-def setup_custom_domain_instructions():
-    """
-    Generate instructions for setting up a custom domain on Render
-    """
-    instructions = """
+_DOMAIN_INSTRUCTIONS = """
 # Setting up a Custom Domain on Render
 
 After deploying your application to Render, follow these steps to configure your custom domain:
@@ -113,12 +80,63 @@ If your DNS provider doesn't support CNAME records at the root domain, use these
 
 Once the SSL certificate is issued, visit your custom domain to verify it's working:
 https://learninglens.shiningstaronline.com
-"""
-    
-    with open('custom_domain_setup.md', 'w') as f:
-        f.write(instructions)
+""".encode('utf-8')
+
+# Generated files older than this module are rewritten from the constants above
+_MODULE_MTIME = os.path.getmtime(__file__)
+
+def _write_generated_file(path, content):
+    """
+    Write a generated file unless an up-to-date copy already exists
     
-    print("Generated custom domain setup instructions")
+    Returns:
+        bool: True if the file was written
+    """
+    target = Path(path)
+    if target.exists() and target.stat().st_mtime >= _MODULE_MTIME:
+        return False
+    target.write_bytes(content)
+    return True
+
+def get_render_config():
+    """
+    Generate configuration for Render deployment
+    """
+    return {
+        "name": "learninglens",
+        "env": "python",
+        "buildCommand": "pip install -r requirements.txt",
+        "startCommand": "gunicorn wsgi:application",
+        "envVars": [
+            {"key": "FLASK_ENV", "value": "production"},
+            {"key": "SECRET_KEY", "value": "{{ .Secrets.SECRET_KEY }}"},
+            {"key": "DATABASE_URL", "value": "{{ .Secrets.DATABASE_URL }}"},
+            {"key": "MAIL_USERNAME", "value": "{{ .Secrets.MAIL_USERNAME }}"},
+            {"key": "MAIL_PASSWORD", "value": "{{ .Secrets.MAIL_PASSWORD }}"},
+            {"key": "ADMIN_EMAIL", "value": "helpdesk@shiningstaronline.com"}
+        ],
+        "healthCheckPath": "/",
+        "autoDeploy": True,
+        "domains": ["learninglens.shiningstaronline.com"]
+    }
+
+def generate_render_yaml():
+    """
+    Generate render.yaml file for Render Blueprint deployment
+    """
+    if _write_generated_file('render.yaml', _RENDER_YAML):
+        print("Generated render.yaml for Render Blueprint deployment")
+    else:
+        print("render.yaml is up to date")
+
+def setup_custom_domain_instructions():
+    """
+    Generate instructions for setting up a custom domain on Render
+    """
+    if _write_generated_file('custom_domain_setup.md', _DOMAIN_INSTRUCTIONS):
+        print("Generated custom domain setup instructions")
+    else:
+        print("custom_domain_setup.md is up to date")
 
 def main():
     generate_render_yaml()
@@ -5,9 +5,23 @@ Main application that integrates all components of the diagnostic system.
 
 import os
 import json
+import queue
+import atexit
+import functools
 import argparse
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from datetime import datetime
 import logging
+import logging.handlers
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+try:
+    import orjson
+except ImportError:  # orjson not installed; results are serialized with json
+    orjson = None
 
 # Import all components
 from data.questionnaire import get_questions_for_age, get_parent_questions
@@ -19,11 +33,100 @@ from data.report_generator import ReportGenerator
 from data.report_delivery import ReportDeliveryManager
 from data.security import DataSecurityManager, UserAccessControl
 
+# Question sets are static per age and for parents, so build each one once;
+# callers only read the returned lists
+_cached_questions_for_age = functools.lru_cache(maxsize=32)(get_questions_for_age)
+_cached_parent_questions = functools.lru_cache(maxsize=1)(get_parent_questions)
+
+# Listener writing queued log records to the log file, started by the first
+# system instance in this process
+_log_listener = None
+
+# Flags for the assessment results file, which is always written whole
+_RESULTS_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _dump_results(results):
+    """
+    Serializes assessment results to indented JSON.
+    
+    Args:
+        results (dict): Assessment results to serialize
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    return json.dumps(results, indent=2).encode('utf-8')
+
+
+def _write_results_file(path, results):
+    """
+    Writes assessment results to a file with a single write per call.
+    
+    Args:
+        path (str): Path of the results file
+        results (dict): Assessment results to write
+    """
+    payload = memoryview(_dump_results(results))
+    fd = os.open(path, _RESULTS_FILE_FLAGS, 0o640)
+    try:
+        # Loop only for short writes; the payload normally goes out in one call
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+
+
+def _read_results_file(path):
+    """
+    Reads assessment results written by _write_results_file.
+    
+    Args:
+        path (str): Path of the results file
+        
+    Returns:
+        dict: Assessment results
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _log_delivery_error(student_id, future):
+    """
+    Logs the failure of a background report delivery as soon as it finishes.
+    
+    Args:
+        student_id (str): Student ID the reports were for
+        future (Future): Finished delivery
+    """
+    if future.cancelled():
+        return
+    
+    error = future.exception()
+    if error is not None:
+        logging.error(f"Error delivering reports for student {student_id}: {error}")
+
+
 class ShiningStarDiagnosticSystem:
     """
     Main class that integrates all components of the diagnostic system.
     """
     
+    # Roles that may request assessment results
+    READ_ACCESS_ROLES = frozenset(("admin", "teacher", "parent"))
+    
+    # Fields each record must carry, in the order missing ones are reported
+    STUDENT_REQUIRED_FIELDS = ("id", "name", "age")
+    PARENT_REQUIRED_FIELDS = ("id", "name")
+    
+    # Accepted types for questionnaire answers
+    ANSWER_TYPES = (int, str)
+    
     def __init__(self, base_dir=None):
         """
         Initialize the diagnostic system.
@@ -37,31 +140,55 @@ class ShiningStarDiagnosticSystem:
         self.templates_dir = os.path.join(self.base_dir, "templates")
         self.output_dir = os.path.join(self.base_dir, "output")
         self.static_dir = os.path.join(self.base_dir, "static")
+        self.reports_dir = os.path.join(self.output_dir, "reports")
+        self.results_dir = os.path.join(self.output_dir, "data")
+        self.results_index_dir = os.path.join(self.results_dir, "index")
+        self.jinja_cache_dir = os.path.join(self.output_dir, "jinja_cache")
+        self.security_dir = os.path.join(self.output_dir, "security")
         
         # Create directories if they don't exist
         os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "reports"), exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "data"), exist_ok=True)
+        os.makedirs(self.reports_dir, exist_ok=True)
+        os.makedirs(self.results_dir, exist_ok=True)
+        os.makedirs(self.results_index_dir, exist_ok=True)
+        os.makedirs(self.jinja_cache_dir, exist_ok=True)
         
         # Set up logging
         self._setup_logging()
         
+        # Compile report templates once and share them between the generators
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(self.templates_dir),
+            bytecode_cache=FileSystemBytecodeCache(self.jinja_cache_dir),
+            auto_reload=False
+        )
+        
         # Initialize components
         self.analyzer = LearningStyleAnalyzer()
         self.pathway_mapper = LearningPathwayMapper()
         self.career_advisor = CareerAffinityAdvisor()
         self.course_recommender = CourseRecommender()
-        self.report_generator = ReportGenerator(self.templates_dir)
+        self.report_generator = ReportGenerator(self.templates_dir, self.jinja_env)
         self.report_delivery = ReportDeliveryManager(
-            os.path.join(self.output_dir, "reports"),
-            self.templates_dir
+            self.reports_dir,
+            self.templates_dir,
+            self.jinja_env
         )
-        self.security_manager = DataSecurityManager(os.path.join(self.output_dir, "security"))
-        self.access_control = UserAccessControl(os.path.join(self.output_dir, "security"))
+        self.security_manager = DataSecurityManager(self.security_dir)
+        self.access_control = UserAccessControl(self.security_dir)
+        
+        # Background report delivery: student ID -> future of the latest delivery
+        self._delivery_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="assess-io")
+        self._pending_deliveries = {}
+        
+        # Wait for queued deliveries when the system is closed, collected or
+        # the interpreter exits, without keeping the system alive
+        self._delivery_pool_finalizer = weakref.finalize(self, self._delivery_pool.shutdown, wait=True)
         
         logging.info("Shining Star Diagnostic System initialized")
     
-    def process_student_assessment(self, student_info, student_responses, parent_info=None, parent_responses=None):
+    def process_student_assessment(self, student_info, student_responses, parent_info=None, parent_responses=None,
+                                   background_delivery=False):
         """
         Processes a complete student assessment.
         
@@ -70,6 +197,9 @@ class ShiningStarDiagnosticSystem:
             student_responses (dict): Student's questionnaire responses
             parent_info (dict, optional): Parent information
             parent_responses (dict, optional): Parent's questionnaire responses
+            background_delivery (bool, optional): Generate and deliver reports on a
+                background thread and return without waiting for them; poll
+                get_delivery_status for the outcome
             
         Returns:
             dict: Processing results including report paths
@@ -126,7 +256,8 @@ class ShiningStarDiagnosticSystem:
             # Add recommended courses to analysis results for reports
             analysis_results["recommended_courses"] = course_recommendations
             
-            # Save all results securely
+            # Save all results securely, stamped with a single clock reading
+            now = datetime.now()
             assessment_results = {
                 "student_info": student_info,
                 "parent_info": parent_info,
@@ -134,7 +265,7 @@ class ShiningStarDiagnosticSystem:
                 "parent_comparison": parent_comparison,
                 "pathway_results": pathway_results,
                 "career_results": career_results,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             }
             
             # Encrypt sensitive data
@@ -142,18 +273,22 @@ class ShiningStarDiagnosticSystem:
             
             # Save secure results
             results_file = os.path.join(
-                self.output_dir, 
-                "data", 
-                f"assessment_{student_info.get('id')}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+                self.results_dir,
+                f"assessment_{student_info.get('id')}_{now:%Y%m%d%H%M%S}.json"
             )
             
-            with open(results_file, 'w') as f:
-                json.dump(secure_results, f, indent=2)
+            _write_results_file(results_file, secure_results)
+            self._append_to_assessment_index(
+                student_info.get("id"),
+                results_file,
+                assessment_results["timestamp"]
+            )
             
             # Generate and deliver reports
             delivery_results = None
+            delivery_pending = False
             if parent_info:
-                delivery_results = self.report_delivery.generate_and_deliver_reports(
+                delivery_args = (
                     student_info,
                     parent_info,
                     analysis_results,
@@ -162,6 +297,16 @@ class ShiningStarDiagnosticSystem:
                     career_results,
                     course_recommendations
                 )
+                if background_delivery:
+                    future = self._delivery_pool.submit(
+                        self.report_delivery.generate_and_deliver_reports,
+                        *delivery_args
+                    )
+                    future.add_done_callback(functools.partial(_log_delivery_error, student_info.get("id")))
+                    self._pending_deliveries[student_info.get("id")] = future
+                    delivery_pending = True
+                else:
+                    delivery_results = self.report_delivery.generate_and_deliver_reports(*delivery_args)
             
             # Log the assessment completion
             self.security_manager.log_data_access(
@@ -176,7 +321,8 @@ class ShiningStarDiagnosticSystem:
                 "status": "success",
                 "student_id": student_info.get("id"),
                 "results_file": results_file,
-                "delivery_results": delivery_results
+                "delivery_results": delivery_results,
+                "delivery_pending": delivery_pending
             }
             
         except Exception as e:
@@ -186,6 +332,47 @@ class ShiningStarDiagnosticSystem:
                 "message": str(e)
             }
     
+    def close(self):
+        """
+        Waits for background report deliveries and releases the security manager.
+        """
+        self._delivery_pool_finalizer()
+        self.security_manager.close()
+    
+    def get_delivery_status(self, student_id):
+        """
+        Gets the status of the latest background report delivery for a student.
+        
+        Args:
+            student_id (str): Student ID
+            
+        Returns:
+            dict: Delivery status, with the delivery results once complete
+        """
+        future = self._pending_deliveries.get(student_id)
+        if future is None:
+            return {
+                "status": "error",
+                "message": f"No background delivery found for student ID: {student_id}"
+            }
+        
+        if not future.done():
+            return {"status": "pending"}
+        
+        # Failures were already logged when the delivery finished
+        try:
+            delivery_results = future.result()
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+        
+        return {
+            "status": "success",
+            "delivery_results": delivery_results
+        }
+    
     def get_questionnaire_for_student(self, age):
         """
         Gets the appropriate questionnaire for a student based on age.
@@ -196,7 +383,7 @@ class ShiningStarDiagnosticSystem:
         Returns:
             list: List of questions
         """
-        return get_questions_for_age(age)
+        return _cached_questions_for_age(age)
     
     def get_questionnaire_for_parent(self):
         """
@@ -205,7 +392,7 @@ class ShiningStarDiagnosticSystem:
         Returns:
             list: List of questions
         """
-        return get_parent_questions()
+        return _cached_parent_questions()
     
     def retrieve_assessment_results(self, student_id, user_id, user_role):
         """
@@ -220,31 +407,18 @@ class ShiningStarDiagnosticSystem:
             dict: Assessment results
         """
         # Check if user has permission to access this student's data
-        if user_role == "admin":
-            # Admins can access all data
-            pass
-        elif user_role == "teacher":
-            # Check if teacher is assigned to this student
-            teacher_access = self.access_control.get_user_specific_data_access(user_id)
-            if not teacher_access.get("all_access") and student_id not in teacher_access.get("student_ids", []):
-                return {
-                    "status": "error",
-                    "message": "Access denied: You are not authorized to access this student's data"
-                }
-        elif user_role == "parent":
-            # Check if parent is associated with this student
-            parent_access = self.access_control.get_user_specific_data_access(user_id)
-            if not parent_access.get("all_access") and student_id not in parent_access.get("student_ids", []):
-                return {
-                    "status": "error",
-                    "message": "Access denied: You are not authorized to access this student's data"
-                }
-        else:
+        if user_role not in self.READ_ACCESS_ROLES:
             return {
                 "status": "error",
                 "message": "Access denied: Invalid user role"
             }
         
+        if not self._can_access(user_id, user_role, student_id):
+            return {
+                "status": "error",
+                "message": "Access denied: You are not authorized to access this student's data"
+            }
+        
         # Log the data access
         self.security_manager.log_data_access(
             user_id,
@@ -254,22 +428,16 @@ class ShiningStarDiagnosticSystem:
         )
         
         # Find the latest assessment file for this student
-        data_dir = os.path.join(self.output_dir, "data")
-        assessment_files = [f for f in os.listdir(data_dir) if f.startswith(f"assessment_{student_id}_")]
+        latest_file = self._find_latest_assessment_file(student_id)
         
-        if not assessment_files:
+        if not latest_file:
             return {
                 "status": "error",
                 "message": f"No assessment found for student ID: {student_id}"
             }
         
-        # Sort files by timestamp (newest first)
-        assessment_files.sort(reverse=True)
-        latest_file = os.path.join(data_dir, assessment_files[0])
-        
         # Load and decrypt the assessment results
-        with open(latest_file, 'r') as f:
-            secure_results = json.load(f)
+        secure_results = _read_results_file(latest_file)
         
         # Decrypt sensitive data
         results = self.security_manager.decrypt_sensitive_data(secure_results)
@@ -279,6 +447,89 @@ class ShiningStarDiagnosticSystem:
             "results": results
         }
     
+    def _can_access(self, user_id, user_role, student_id):
+        """
+        Checks whether a user may read a student's data.
+        
+        Args:
+            user_id (str): ID of the user requesting the data
+            user_role (str): Role of the user requesting the data
+            student_id (str): Student ID
+            
+        Returns:
+            bool: True if the user may read the student's data
+        """
+        # Admins can access all data
+        if user_role == "admin":
+            return True
+        
+        # Teachers and parents need the student among their assigned students or children
+        access = self.access_control.get_user_specific_data_access(user_id)
+        return access.get("all_access", False) or student_id in access.get("student_ids", ())
+    
+    def _assessment_index_path(self, student_id):
+        """
+        Gets the path of a student's assessment index.
+        
+        Args:
+            student_id (str): Student ID
+            
+        Returns:
+            str: Path of the student's index file
+        """
+        return os.path.join(self.results_index_dir, f"{student_id}.jsonl")
+    
+    def _append_to_assessment_index(self, student_id, results_file, timestamp):
+        """
+        Records a saved assessment in the student's index.
+        
+        Args:
+            student_id (str): Student ID
+            results_file (str): Path of the saved assessment file
+            timestamp (str): ISO timestamp of the assessment
+        """
+        entry = json.dumps({"file": os.path.basename(results_file), "ts": timestamp})
+        with open(self._assessment_index_path(student_id), 'ab') as f:
+            f.write(entry.encode('utf-8') + b"\n")
+    
+    def _find_latest_assessment_file(self, student_id):
+        """
+        Finds the newest assessment file for a student.
+        
+        Args:
+            student_id (str): Student ID
+            
+        Returns:
+            str: Path of the newest assessment file, or None if there is none
+        """
+        data_dir = self.results_dir
+        
+        # The index is appended in save order, so its last line is the newest
+        try:
+            with open(self._assessment_index_path(student_id), 'rb') as f:
+                last_line = deque(f, maxlen=1)
+        except FileNotFoundError:
+            last_line = None
+        
+        if last_line:
+            # A crash can cut the last append short, and indexed files can be
+            # removed; both fall back to the directory scan
+            try:
+                latest_file = os.path.join(data_dir, json.loads(last_line[0])["file"])
+            except (ValueError, KeyError, TypeError):
+                latest_file = None
+            if latest_file is not None and os.path.exists(latest_file):
+                return latest_file
+        
+        # Assessments saved before the index existed, or missing from it, are
+        # found by scanning
+        assessment_files = [f for f in os.listdir(data_dir) if f.startswith(f"assessment_{student_id}_")]
+        if not assessment_files:
+            return None
+        
+        # File names end in a timestamp, so the greatest name is the newest
+        return os.path.join(data_dir, max(assessment_files))
+    
     def create_user_account(self, admin_id, username, role, password, email=None, name=None):
         """
         Creates a new user account.
@@ -386,8 +637,7 @@ class ShiningStarDiagnosticSystem:
         Raises:
             ValueError: If student information is invalid
         """
-        required_fields = ["id", "name", "age"]
-        for field in required_fields:
+        for field in self.STUDENT_REQUIRED_FIELDS:
             if field not in student_info:
                 raise ValueError(f"Missing required student information: {field}")
         
@@ -406,8 +656,7 @@ class ShiningStarDiagnosticSystem:
         Raises:
             ValueError: If parent information is invalid
         """
-        required_fields = ["id", "name"]
-        for field in required_fields:
+        for field in self.PARENT_REQUIRED_FIELDS:
             if field not in parent_info:
                 raise ValueError(f"Missing required parent information: {field}")
         
@@ -428,28 +677,94 @@ class ShiningStarDiagnosticSystem:
         if not responses:
             raise ValueError("Responses cannot be empty")
         
+        # Check all IDs and answers with C-level map/isinstance passes; only
+        # invalid responses fall through to the loop that names the offender
+        if (all(map(isinstance, responses, repeat(str))) and
+                all(map(isinstance, responses.values(), repeat(self.ANSWER_TYPES)))):
+            return
+        
         for question_id, answer in responses.items():
             if not isinstance(question_id, str):
                 raise ValueError(f"Invalid question ID: {question_id}")
             
-            if not isinstance(answer, int) and not isinstance(answer, str):
+            if not isinstance(answer, self.ANSWER_TYPES):
                 raise ValueError(f"Invalid answer for question {question_id}: {answer}")
     
     def _setup_logging(self):
         """
         Sets up logging for the application.
         """
+        global _log_listener
+        
+        # Configure once per process and, like basicConfig, leave a root logger
+        # that already has handlers alone
+        root_logger = logging.getLogger()
+        if _log_listener is not None or root_logger.handlers:
+            return
+        
         log_dir = os.path.join(self.output_dir, "logs")
         os.makedirs(log_dir, exist_ok=True)
         
         log_file = os.path.join(log_dir, f"app_{datetime.now().strftime('%Y%m%d')}.log")
         
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        ))
+        
+        # Callers only enqueue records; a background thread does the file writes
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        root_logger.setLevel(logging.INFO)
+
+
+def _demo_choice_answer(question, pick, correct):
+    """
+    Answers a choice question in the demo with the random pick.
+    
+    Args:
+        question (dict): Question to answer
+        pick (int): Random option index drawn for the question
+        correct (bool): Unused; choice questions have no correct answer
+        
+    Returns:
+        int: Option index, or None if the question has no options
+    """
+    return pick if question.get("options") else None
+
+
+def _demo_logic_puzzle_answer(question, pick, correct):
+    """
+    Answers a logic puzzle in the demo, correctly when the coin flip says so.
+    
+    Args:
+        question (dict): Question to answer
+        pick (int): Random option index drawn for the question
+        correct (bool): Whether to select the correct answer
+        
+    Returns:
+        int: Option index
+    """
+    if correct:
+        return question["options"].index(question["correct_answer"])
+    return pick
+
+
+# Demo answer generators by question type; types without one (open-ended
+# questions) are skipped
+_DEMO_STUDENT_ANSWERS = {
+    "multiple_choice": _demo_choice_answer,
+    "situational": _demo_choice_answer,
+    "logic_puzzle": _demo_logic_puzzle_answer
+}
+_DEMO_PARENT_ANSWERS = {
+    "multiple_choice": _demo_choice_answer
+}
 
 
 def main():
@@ -505,32 +820,45 @@ def main():
         student_questions = system.get_questionnaire_for_student(student_info["age"])
         parent_questions = system.get_questionnaire_for_parent()
         
-        # Generate some demo responses
-        import random
+        # Generate some demo responses, drawing every random number up front
+        import numpy as np
+        
+        rng = np.random.default_rng()
+        
+        # One option pick per question; questions without options draw from a
+        # single slot and their pick is never used
+        student_bounds = np.fromiter(
+            (len(question.get("options", [])) for question in student_questions),
+            dtype=np.int64,
+            count=len(student_questions)
+        )
+        student_picks = rng.integers(0, np.maximum(student_bounds, 1)).tolist()
+        
+        # For logic puzzles, select the correct answer 70% of the time
+        answer_correctly = (rng.random(len(student_questions)) < 0.7).tolist()
         
         student_responses = {}
-        for question in student_questions:
-            if question["type"] == "multiple_choice" or question["type"] == "situational":
-                options = question.get("options", [])
-                if options:
-                    student_responses[question["id"]] = random.randint(0, len(options) - 1)
-            elif question["type"] == "logic_puzzle":
-                # For logic puzzles, select the correct answer 70% of the time
-                if random.random() < 0.7:
-                    correct_index = question["options"].index(question["correct_answer"])
-                    student_responses[question["id"]] = correct_index
-                else:
-                    student_responses[question["id"]] = random.randint(0, len(question["options"]) - 1)
-            elif question["type"] == "open_ended":
-                # Skip open-ended questions in the demo
-                pass
+        for question, pick, correct in zip(student_questions, student_picks, answer_correctly):
+            handler = _DEMO_STUDENT_ANSWERS.get(question["type"])
+            if handler is not None:
+                answer = handler(question, pick, correct)
+                if answer is not None:
+                    student_responses[question["id"]] = answer
+        
+        parent_bounds = np.fromiter(
+            (len(question.get("options", [])) for question in parent_questions),
+            dtype=np.int64,
+            count=len(parent_questions)
+        )
+        parent_picks = rng.integers(0, np.maximum(parent_bounds, 1)).tolist()
         
         parent_responses = {}
-        for question in parent_questions:
-            if question["type"] == "multiple_choice":
-                options = question.get("options", [])
-                if options:
-                    parent_responses[question["id"]] = random.randint(0, len(options) - 1)
+        for question, pick in zip(parent_questions, parent_picks):
+            handler = _DEMO_PARENT_ANSWERS.get(question["type"])
+            if handler is not None:
+                answer = handler(question, pick, False)
+                if answer is not None:
+                    parent_responses[question["id"]] = answer
         
         # Process the assessment
         result = system.process_student_assessment(
@@ -1,19 +1,65 @@
 from flask_sqlalchemy import SQLAlchemy
+import sqlalchemy as sa
 from datetime import datetime
 from flask_login import UserMixin
+from werkzeug.security import generate_password_hash, check_password_hash
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi not installed; hashes fall back to werkzeug PBKDF2
+    PasswordHasher = None
 
 db = SQLAlchemy()
 
+# Argon2id at 19 MiB and two passes, cheap enough to verify on every login;
+# built once so the parameters are not re-validated per hash
+_password_hasher = (
+    PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+    if PasswordHasher is not None else None
+)
+
 class User(db.Model, UserMixin):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(128), nullable=False)
     role = db.Column(db.String(20), default='user')  # admin, teacher, user
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
     
     students = db.relationship('Student', backref='parent', lazy=True)
     
+    @staticmethod
+    def generate_password_hash(password):
+        """Hash a password with Argon2id, or werkzeug PBKDF2 without argon2-cffi."""
+        if _password_hasher is not None:
+            return _password_hasher.hash(password)
+        return generate_password_hash(password)
+    
+    def set_password(self, password):
+        """Set password hash."""
+        self.password_hash = User.generate_password_hash(password)
+    
+    def check_password(self, password):
+        """Check password against hash, upgrading outdated hashes in place (commit to persist)."""
+        if self.password_hash.startswith('$argon2'):
+            if _password_hasher is None:
+                return False
+            try:
+                _password_hasher.verify(self.password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+            if _password_hasher.check_needs_rehash(self.password_hash):
+                self.set_password(password)
+            return True
+        
+        # Legacy werkzeug PBKDF2 hash; migrate it to Argon2id on success
+        if not check_password_hash(self.password_hash, password):
+            return False
+        if _password_hasher is not None:
+            self.set_password(password)
+        return True
+    
     def __repr__(self):
         return f'<User {self.username}>'
 
@@ -21,7 +67,7 @@ class Student(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     age = db.Column(db.Integer, nullable=False)
-    parent_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    parent_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     assessments = db.relationship('Assessment', backref='student', lazy=True)
@@ -30,12 +76,15 @@ class Student(db.Model):
         return f'<Student {self.name}>'
 
 class Assessment(db.Model):
+    # Serves student.assessments and "latest assessment per student" as one index range scan
+    __table_args__ = (db.Index('ix_assessment_student_created', 'student_id', 'created_at'),)
+    
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False)
-    responses = db.Column(db.Text, nullable=False)  # JSON string of responses
+    responses = db.Column(db.JSON, nullable=False)  # Responses, stored as JSON
     age_group = db.Column(db.String(20), nullable=False)  # elementary, middle, high
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     
     report = db.relationship('Report', backref='assessment', lazy=True, uselist=False)
     
@@ -44,15 +93,16 @@ class Assessment(db.Model):
 
 class Report(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    assessment_id = db.Column(db.Integer, db.ForeignKey('assessment.id'), nullable=False)
-    student_report = db.Column(db.Text, nullable=False)  # JSON string
-    parent_report = db.Column(db.Text, nullable=False)  # JSON string
-    teacher_report = db.Column(db.Text, nullable=False)  # JSON string
-    learning_pathway = db.Column(db.Text, nullable=False)  # JSON string
-    math_pathway = db.Column(db.Text, nullable=True)  # JSON string
-    career_suggestions = db.Column(db.Text, nullable=False)  # JSON string
-    course_recommendations = db.Column(db.Text, nullable=False)  # JSON string
-    exam_suggestions = db.Column(db.Text, nullable=False)  # JSON string
+    assessment_id = db.Column(db.Integer, db.ForeignKey('assessment.id'), nullable=False, index=True)
+    # Report sections are JSON columns, encoded and decoded by the driver
+    student_report = db.Column(db.JSON, nullable=False)
+    parent_report = db.Column(db.JSON, nullable=False)
+    teacher_report = db.Column(db.JSON, nullable=False)
+    learning_pathway = db.Column(db.JSON, nullable=False)
+    math_pathway = db.Column(db.JSON, nullable=True)
+    career_suggestions = db.Column(db.JSON, nullable=False)
+    course_recommendations = db.Column(db.JSON, nullable=False)
+    exam_suggestions = db.Column(db.JSON, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def __repr__(self):
@@ -60,10 +110,39 @@ class Report(db.Model):
 
 class ActivityLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), nullable=False)
+    username = db.Column(db.String(80), nullable=False, index=True)
     action = db.Column(db.String(50), nullable=False)
     details = db.Column(db.Text, nullable=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
     def __repr__(self):
         return f'<ActivityLog {self.id} by {self.username}>'
+
+def upgrade_json_columns():
+    """Convert payload columns created as TEXT to json on PostgreSQL.
+    
+    Assessment and Report payloads used to be TEXT columns holding JSON
+    strings. create_all() does not alter existing tables, and psycopg2 only
+    decodes values of json-typed columns, so older databases would return
+    those payloads as str. SQLite stores JSON as text and needs no change.
+    Must be called inside an application context.
+    """
+    engine = db.engine
+    if engine.dialect.name != 'postgresql':
+        return
+    
+    inspector = sa.inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        for model in (Assessment, Report):
+            table = model.__table__
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing = {column['name']: column['type'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if isinstance(column.type, sa.JSON) and isinstance(existing.get(column.name), sa.Text):
+                    name = quote(column.name)
+                    conn.execute(sa.text(
+                        f'ALTER TABLE {quote(table.name)} ALTER COLUMN {name} TYPE json USING {name}::json'
+                    ))
@@ -3,24 +3,85 @@ Monitoring and maintenance configuration for LearningLens production deployment
 """
 
 import os
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import time
 import threading
 import psutil
 import requests
+from flask import has_request_context, request
+
+# Records from every queued file handler go through one queue, written out by
+# a single background listener thread
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+_log_listener_lock = threading.Lock()
+
+class _FileQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the file handler it is bound for"""
+    def __init__(self, log_queue, file_handler):
+        super().__init__(log_queue)
+        self.file_handler = file_handler
+    
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.file_handler = self.file_handler
+        return record
+
+class _FileHandlerRouter(logging.Handler):
+    """Passes queued records on to the file handler they were tagged with"""
+    def handle(self, record):
+        file_handler = record.file_handler
+        if record.levelno >= file_handler.level:
+            file_handler.handle(record)
+
+def queue_file_handler(file_handler):
+    """Return a handler that queues records for file_handler on the log listener"""
+    # Queued records need a consumer, so make sure the listener is running
+    start_log_listener()
+    return _FileQueueHandler(_log_queue, file_handler)
+
+def start_log_listener():
+    """Start the listener writing queued records to their files"""
+    global _log_listener
+    
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+        
+        _log_listener = QueueListener(_log_queue, _FileHandlerRouter())
+        _log_listener.start()
+        
+        # Drain the queue at interpreter exit
+        atexit.register(_log_listener.stop)
 
 class SystemMonitor:
     """
     System monitoring for the LearningLens application
     """
+    # Seconds a metrics snapshot is reused, so a burst of /metrics scrapes
+    # shares one set of psutil calls
+    METRICS_SNAPSHOT_TTL = 1.0
+    
     def __init__(self, app=None):
         self.app = app
         self.logger = logging.getLogger('learninglens.monitor')
         self.setup_logging()
         self.monitoring_interval = 300  # 5 minutes
         self.monitoring_thread = None
-        self.stop_monitoring = False
+        self._stop_event = threading.Event()
+        
+        # Boot time never changes, so read it once
+        self._boot_time = psutil.boot_time()
+        
+        # CPU usage is measured by the monitoring thread only
+        self._last_cpu = 0.0
+        
+        self._snapshot_lock = threading.Lock()
+        self._last_snapshot = None
+        self._last_snapshot_at = 0.0
         
         if app is not None:
             self.init_app(app)
@@ -41,13 +102,7 @@ class SystemMonitor:
             if not self.is_authorized_request():
                 return {"error": "Unauthorized"}, 401
                 
-            return {
-                "memory_usage": psutil.virtual_memory().percent,
-                "cpu_usage": psutil.cpu_percent(),
-                "disk_usage": psutil.disk_usage('/').percent,
-                "uptime": time.time() - psutil.boot_time(),
-                "timestamp": time.time()
-            }
+            return dict(self._snapshot())
     
     def setup_logging(self):
         """Setup logging for monitoring"""
@@ -65,7 +120,7 @@ class SystemMonitor:
         handler.setFormatter(formatter)
         
         self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(handler)
+        self.logger.addHandler(queue_file_handler(handler))
     
     def is_authorized_request(self):
         """Check if request is authorized to access monitoring endpoints"""
@@ -73,12 +128,30 @@ class SystemMonitor:
         # For now, we'll just check if it's a local request
         return True
     
+    def _snapshot(self, refresh=False):
+        """Return current system metrics, reusing a snapshot younger than the TTL"""
+        with self._snapshot_lock:
+            now = time.monotonic()
+            if (refresh or self._last_snapshot is None
+                    or now - self._last_snapshot_at >= self.METRICS_SNAPSHOT_TTL):
+                timestamp = time.time()
+                self._last_snapshot = {
+                    "memory_usage": psutil.virtual_memory().percent,
+                    "cpu_usage": self._last_cpu,
+                    "disk_usage": psutil.disk_usage('/').percent,
+                    "uptime": timestamp - self._boot_time,
+                    "timestamp": timestamp
+                }
+                self._last_snapshot_at = now
+            
+            return self._last_snapshot
+    
     def start_monitoring(self):
         """Start the monitoring thread"""
         if self.monitoring_thread is not None:
             return
             
-        self.stop_monitoring = False
+        self._stop_event.clear()
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_worker,
             daemon=True
@@ -91,30 +164,28 @@ class SystemMonitor:
         if self.monitoring_thread is None:
             return
             
-        self.stop_monitoring = True
-        self.monitoring_thread.join(timeout=1.0)
+        self._stop_event.set()
+        self.monitoring_thread.join()
         self.monitoring_thread = None
         self.logger.info("System monitoring stopped")
     
     def _monitoring_worker(self):
         """Worker thread for periodic monitoring"""
-        while not self.stop_monitoring:
+        while True:
             try:
                 self._collect_and_log_metrics()
             except Exception as e:
                 self.logger.error(f"Error in monitoring: {str(e)}")
             
-            # Sleep for the monitoring interval
-            time.sleep(self.monitoring_interval)
+            # Wait for the monitoring interval, waking at once on stop
+            if self._stop_event.wait(self.monitoring_interval):
+                break
     
     def _collect_and_log_metrics(self):
         """Collect and log system metrics"""
-        metrics = {
-            "memory_usage": psutil.virtual_memory().percent,
-            "cpu_usage": psutil.cpu_percent(),
-            "disk_usage": psutil.disk_usage('/').percent,
-            "timestamp": time.time()
-        }
+        # CPU usage since the previous collection, shared with /metrics
+        self._last_cpu = psutil.cpu_percent()
+        metrics = self._snapshot(refresh=True)
         
         # Log metrics
         self.logger.info(f"System metrics: {metrics}")
@@ -133,9 +204,29 @@ class MaintenanceScheduler:
     """
     Maintenance scheduler for the LearningLens application
     """
+    # Paths that stay reachable while maintenance mode is on
+    EXEMPT_PATHS = frozenset((
+        '/maintenance/status',
+        '/maintenance/enable',
+        '/maintenance/disable',
+        '/admin/login'
+    ))
+    
+    # Seconds between checks of the flag file, so a change made by another
+    # worker process is picked up without a stat() on every request
+    MAINTENANCE_RECHECK_INTERVAL = 5.0
+    
     def __init__(self, app=None):
         self.app = app
         self.logger = logging.getLogger('learninglens.maintenance')
+        self.maintenance_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'maintenance_mode'
+        )
+        
+        # In-memory maintenance flag, read once from the flag file at startup
+        self._maintenance_flag = os.path.exists(self.maintenance_file)
+        self._maintenance_checked_at = time.monotonic()
         
         if app is not None:
             self.init_app(app)
@@ -185,25 +276,19 @@ class MaintenanceScheduler:
     
     def is_maintenance_mode(self):
         """Check if maintenance mode is enabled"""
-        # In a real implementation, this would check a database flag or file
-        maintenance_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'maintenance_mode'
-        )
-        return os.path.exists(maintenance_file)
+        # Served from memory; the flag file is re-read only once the recheck
+        # interval has passed
+        now = time.monotonic()
+        if now - self._maintenance_checked_at >= self.MAINTENANCE_RECHECK_INTERVAL:
+            self._maintenance_flag = os.path.exists(self.maintenance_file)
+            self._maintenance_checked_at = now
+        return self._maintenance_flag
     
     def is_maintenance_exempt(self):
         """Check if current request is exempt from maintenance mode"""
         # Exempt maintenance endpoints and admin paths
-        exempt_paths = [
-            '/maintenance/status',
-            '/maintenance/enable',
-            '/maintenance/disable',
-            '/admin/login'
-        ]
-        
-        if self.app and hasattr(self.app, 'request'):
-            return self.app.request.path in exempt_paths
+        if has_request_context():
+            return request.path in self.EXEMPT_PATHS
         
         return False
     
@@ -213,28 +298,31 @@ class MaintenanceScheduler:
     
     def enable_maintenance_mode(self):
         """Enable maintenance mode"""
-        maintenance_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'maintenance_mode'
-        )
-        with open(maintenance_file, 'w') as f:
+        with open(self.maintenance_file, 'w') as f:
             f.write(str(time.time()))
         
+        self._maintenance_flag = True
+        self._maintenance_checked_at = time.monotonic()
+        
         self.logger.info("Maintenance mode enabled")
     
     def disable_maintenance_mode(self):
         """Disable maintenance mode"""
-        maintenance_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'maintenance_mode'
-        )
-        if os.path.exists(maintenance_file):
-            os.remove(maintenance_file)
+        try:
+            os.remove(self.maintenance_file)
+        except FileNotFoundError:
+            pass
+        
+        self._maintenance_flag = False
+        self._maintenance_checked_at = time.monotonic()
         
         self.logger.info("Maintenance mode disabled")
 
 def setup_monitoring_and_maintenance(app):
     """Setup monitoring and maintenance for the application"""
+    # Write log files from a background thread
+    start_log_listener()
+    
     # Initialize monitoring
     monitor = SystemMonitor(app)
     monitor.start_monitoring()
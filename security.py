@@ -9,6 +9,12 @@ from flask_wtf.csrf import CSRFProtect
 from werkzeug.middleware.proxy_fix import ProxyFix
 import logging
 from logging.handlers import RotatingFileHandler
+from monitoring import queue_file_handler
+
+try:
+    from nplusone.ext.flask_sqlalchemy import NPlusOne
+except ImportError:  # nplusone not installed; N+1 query detection is skipped
+    NPlusOne = None
 
 def configure_security(app):
     """Configure security enhancements for the Flask application."""
@@ -54,6 +60,10 @@ def configure_security(app):
         # This is just for rate limiting, the actual route is defined elsewhere
         pass
     
+    # Flag lazy loads that should have been eager loads during development
+    if app.debug and NPlusOne is not None:
+        NPlusOne(app)
+    
     # Configure logging
     if not os.path.exists('logs'):
         os.mkdir('logs')
@@ -63,7 +73,7 @@ def configure_security(app):
         '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
     ))
     file_handler.setLevel(logging.INFO)
-    app.logger.addHandler(file_handler)
+    app.logger.addHandler(queue_file_handler(file_handler))
     
     app.logger.setLevel(logging.INFO)
     app.logger.info('LearningLens startup')
@@ -6,6 +6,10 @@ This module tests and validates the AI-driven diagnostic system.
 import os
 import sys
 import json
+import base64
+import shutil
+import tempfile
+import time
 import unittest
 import random
 from datetime import datetime
@@ -14,6 +18,12 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import ShiningStarDiagnosticSystem
+from data.security import DataSecurityManager, PasswordHasher, UserAccessControl
+
+try:
+    from models import User
+except ImportError:  # Flask-SQLAlchemy not installed; the User model tests are skipped
+    User = None
 
 class TestDiagnosticSystem(unittest.TestCase):
     """
@@ -386,6 +396,244 @@ class TestDiagnosticSystem(unittest.TestCase):
             )
             self.assertEqual(has_permission, expected)
 
+    
+    def test_09_stale_assessment_index(self):
+        """
+        Test that an index entry for a removed file falls back to the newest file on disk.
+        """
+        student_id = "test_student_stale_index"
+        results_dir = self.system.results_dir
+        
+        older = os.path.join(results_dir, f"assessment_{student_id}_20240101000000.json")
+        newer = os.path.join(results_dir, f"assessment_{student_id}_20240102000000.json")
+        for path in (older, newer):
+            with open(path, 'w') as f:
+                json.dump({"student_info": {"id": student_id}}, f)
+        
+        # Index the newer file, then point the last entry at a file that no longer exists
+        self.system._append_to_assessment_index(student_id, newer, "2024-01-02T00:00:00")
+        self.system._append_to_assessment_index(
+            student_id,
+            os.path.join(results_dir, f"assessment_{student_id}_20240103000000.json"),
+            "2024-01-03T00:00:00"
+        )
+        
+        self.assertEqual(self.system._find_latest_assessment_file(student_id), newer)
+    
+    def test_10_truncated_assessment_index(self):
+        """
+        Test that a partially written last index line falls back to the directory scan.
+        """
+        student_id = "test_student_truncated_index"
+        results_dir = self.system.results_dir
+        
+        results_file = os.path.join(results_dir, f"assessment_{student_id}_20240101000000.json")
+        with open(results_file, 'w') as f:
+            json.dump({"student_info": {"id": student_id}}, f)
+        
+        self.system._append_to_assessment_index(student_id, results_file, "2024-01-01T00:00:00")
+        with open(self.system._assessment_index_path(student_id), 'ab') as f:
+            f.write(b'{"file": "assessment_')
+        
+        self.assertEqual(self.system._find_latest_assessment_file(student_id), results_file)
+
+
+
+class TestDataSecurity(unittest.TestCase):
+    """
+    Test cases for the data security manager, each on a fresh security directory.
+    """
+    
+    # Fixed master key and a "1.0" record value encrypted under it with Fernet
+    LEGACY_KEY = b"AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8="
+    LEGACY_EMAIL = "legacy@example.com"
+    LEGACY_EMAIL_TOKEN = (
+        "Z0FBQUFBQmxVX0VBQUFFQ0F3UUZCZ2NJQ1FvTERBME9EMXZmbGFHbTJPSDJ4R0t1d3YzaUtXenlCMm9v"
+        "aDRDM2ZJMjU0N0pQOTRoamtBMzlfWkhHc0RyblNjaks2YVF5RFl5RFpEdUNYMWpvV1hBR0JJY0JSalE9"
+    )
+    
+    def setUp(self):
+        """
+        Create a security manager on an empty directory.
+        """
+        self.security_dir = tempfile.mkdtemp()
+        self.manager = DataSecurityManager(self.security_dir)
+    
+    def tearDown(self):
+        """
+        Close the manager and remove its directory.
+        """
+        self.manager.close()
+        shutil.rmtree(self.security_dir, ignore_errors=True)
+    
+    def test_field_encryption_round_trip(self):
+        """
+        Test that records are written in the 2.0 format and decrypt back to the original.
+        """
+        data = {
+            "student": {"id": "s1", "email": "student@example.com"},
+            "parent": {"id": "p1", "email": "parent@example.com", "phone": "555-000-1111"}
+        }
+        
+        encrypted = self.manager.encrypt_sensitive_data(data)
+        self.assertEqual(encrypted["_security"]["version"], "2.0")
+        self.assertNotEqual(encrypted["parent"]["phone"], data["parent"]["phone"])
+        
+        # Each value gets a fresh nonce
+        again = self.manager.encrypt_sensitive_data(data)
+        self.assertNotEqual(again["student"]["email"], encrypted["student"]["email"])
+        
+        self.assertEqual(self.manager.decrypt_sensitive_data(encrypted), data)
+    
+    def test_legacy_fernet_decryption(self):
+        """
+        Test that records in the 1.0 Fernet format still decrypt.
+        """
+        self.manager.close()
+        shutil.rmtree(self.security_dir)
+        os.makedirs(os.path.join(self.security_dir, "keys"))
+        with open(os.path.join(self.security_dir, "keys", "encryption_key.key"), 'wb') as f:
+            f.write(self.LEGACY_KEY)
+        self.manager = DataSecurityManager(self.security_dir)
+        
+        legacy_record = {
+            "student": {"id": "s1", "email": self.LEGACY_EMAIL_TOKEN},
+            "_security": {"encrypted": True, "timestamp": "2024-01-01T00:00:00", "version": "1.0"}
+        }
+        
+        decrypted = self.manager.decrypt_sensitive_data(legacy_record)
+        self.assertEqual(decrypted["student"]["email"], self.LEGACY_EMAIL)
+        self.assertNotIn("_security", decrypted)
+    
+    def test_tampered_ciphertext_rejected(self):
+        """
+        Test that a modified authentication tag or ciphertext fails to decrypt.
+        """
+        encrypted = self.manager.encrypt_sensitive_data({"student": {"email": "student@example.com"}})
+        raw = base64.b64decode(encrypted["student"]["email"])
+        
+        # The tag is the last 16 bytes; the ciphertext follows the 12-byte nonce
+        for offset in (len(raw) - 1, 12):
+            tampered = bytearray(raw)
+            tampered[offset] ^= 0x01
+            record = dict(encrypted, student={"email": base64.b64encode(bytes(tampered)).decode()})
+            
+            decrypted = self.manager.decrypt_sensitive_data(record)
+            self.assertEqual(decrypted["student"]["email"], "[DECRYPTION_ERROR]")
+    
+    def test_access_token_round_trip(self):
+        """
+        Test that a generated token validates to its user and role.
+        """
+        token = self.manager.generate_access_token("user1", "teacher")
+        
+        token_data = self.manager.validate_access_token(token)
+        self.assertEqual(token_data["user_id"], "user1")
+        self.assertEqual(token_data["role"], "teacher")
+        self.assertEqual(token_data["token"], token)
+        
+        self.assertIsNone(self.manager.validate_access_token("not-a-token"))
+    
+    def test_expired_access_token_deleted(self):
+        """
+        Test that an expired token is rejected and removed from the store.
+        """
+        token = self.manager.generate_access_token("user1", "parent", expiry_hours=-1)
+        
+        self.assertIsNone(self.manager.validate_access_token(token))
+        row = self.manager._tokens.execute("SELECT 1 FROM tokens WHERE token = ?", (token,)).fetchone()
+        self.assertIsNone(row)
+    
+    def test_access_token_cache_returns_copies(self):
+        """
+        Test that callers mutating validated token data cannot alter the cached entry.
+        """
+        token = self.manager.generate_access_token("user1", "admin")
+        
+        # Miss, then hit
+        first = self.manager.validate_access_token(token)
+        first["role"] = "parent"
+        second = self.manager.validate_access_token(token)
+        self.assertEqual(second["role"], "admin")
+        
+        second["role"] = "parent"
+        self.assertEqual(self.manager.validate_access_token(token)["role"], "admin")
+        self.assertIsNot(second, self.manager._token_cache[token][1])
+    
+    def test_access_token_cache_expires(self):
+        """
+        Test that a cached token stops validating once it expires.
+        """
+        token = self.manager.generate_access_token("user1", "teacher", expiry_hours=1 / 3600)
+        self.assertIsNotNone(self.manager.validate_access_token(token))
+        self.assertIn(token, self.manager._token_cache)
+        
+        time.sleep(1.1)
+        
+        self.assertIsNone(self.manager.validate_access_token(token))
+        self.assertNotIn(token, self.manager._token_cache)
+
+
+
+@unittest.skipIf(PasswordHasher is None, "argon2-cffi is not installed")
+class TestPasswordHashing(unittest.TestCase):
+    """
+    Test cases for Argon2id password hashing and the upgrade of legacy hashes on login.
+    """
+    
+    PASSWORD = "LegacyPass123!"
+    
+    def setUp(self):
+        """
+        Create user access control on an empty directory.
+        """
+        self.security_dir = tempfile.mkdtemp()
+        self.access_control = UserAccessControl(self.security_dir)
+    
+    def tearDown(self):
+        """
+        Remove the user directory.
+        """
+        shutil.rmtree(self.security_dir, ignore_errors=True)
+    
+    def test_legacy_pbkdf2_hash_upgraded_on_login(self):
+        """
+        Test that logging in with a PBKDF2 record rewrites it as Argon2id.
+        """
+        user_file = os.path.join(self.access_control.users_dir, "legacy_user.json")
+        with open(user_file, 'w') as f:
+            json.dump({
+                "username": "legacy_user",
+                "role": "parent",
+                "password_hash": self.access_control._hash_password_pbkdf2(self.PASSWORD),
+                "active": True
+            }, f)
+        
+        self.assertIsNone(self.access_control.authenticate_user("legacy_user", "wrong"))
+        self.assertIsNotNone(self.access_control.authenticate_user("legacy_user", self.PASSWORD))
+        
+        with open(user_file) as f:
+            password_hash = json.load(f)["password_hash"]
+        self.assertTrue(password_hash.startswith("$argon2id$"))
+        self.assertTrue(self.access_control._verify_password(self.PASSWORD, password_hash))
+        
+        # The upgraded record still authenticates
+        self.assertIsNotNone(self.access_control.authenticate_user("legacy_user", self.PASSWORD))
+    
+    @unittest.skipIf(User is None, "Flask-SQLAlchemy is not installed")
+    def test_user_werkzeug_hash_upgraded_on_login(self):
+        """
+        Test that User.check_password migrates a werkzeug PBKDF2 hash to Argon2id.
+        """
+        from werkzeug.security import generate_password_hash
+        
+        user = User(username="legacy_user", password_hash=generate_password_hash(self.PASSWORD))
+        
+        self.assertFalse(user.check_password("wrong"))
+        self.assertTrue(user.check_password(self.PASSWORD))
+        self.assertTrue(user.password_hash.startswith("$argon2id$"))
+        self.assertTrue(user.check_password(self.PASSWORD))
+
 
 def run_tests():
     """
@@ -4,7 +4,6 @@ This module implements the web interface and deployment components.
 """
 
 import os
-import json
 from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
@@ -76,24 +75,24 @@ class Assessment(db.Model):
     status = db.Column(db.String(20), default='pending')  # 'pending', 'in_progress', 'completed'
     
     # Assessment data (stored as JSON)
-    student_responses = db.Column(db.Text)  # JSON string
-    parent_responses = db.Column(db.Text)  # JSON string
-    teacher_responses = db.Column(db.Text)  # JSON string
+    student_responses = db.Column(db.JSON)
+    parent_responses = db.Column(db.JSON)
+    teacher_responses = db.Column(db.JSON)
     
     # Analysis results (stored as JSON)
-    learning_styles = db.Column(db.Text)  # JSON string
-    traits = db.Column(db.Text)  # JSON string
-    interests = db.Column(db.Text)  # JSON string
+    learning_styles = db.Column(db.JSON)
+    traits = db.Column(db.JSON)
+    interests = db.Column(db.JSON)
     
     # Reports
     student_report_path = db.Column(db.String(255))
     parent_report_path = db.Column(db.String(255))
     teacher_report_path = db.Column(db.String(255))
     
-    # Recommendations
-    course_recommendations = db.Column(db.Text)  # JSON string
-    math_pathway = db.Column(db.Text)  # JSON string
-    exam_recommendations = db.Column(db.Text)  # JSON string
+    # Recommendations (stored as JSON)
+    course_recommendations = db.Column(db.JSON)
+    math_pathway = db.Column(db.JSON)
+    exam_recommendations = db.Column(db.JSON)
 
 class ActivityLog(db.Model):
     """Activity log for audit trail."""
@@ -485,12 +484,12 @@ def admin_view_assessment(assessment_id):
     student = Student.query.get(assessment.student_id)
     
     # Parse JSON data
-    learning_styles = json.loads(assessment.learning_styles) if assessment.learning_styles else {}
-    traits = json.loads(assessment.traits) if assessment.traits else {}
-    interests = json.loads(assessment.interests) if assessment.interests else {}
-    course_recommendations = json.loads(assessment.course_recommendations) if assessment.course_recommendations else {}
-    math_pathway = json.loads(assessment.math_pathway) if assessment.math_pathway else {}
-    exam_recommendations = json.loads(assessment.exam_recommendations) if assessment.exam_recommendations else {}
+    learning_styles = assessment.learning_styles or {}
+    traits = assessment.traits or {}
+    interests = assessment.interests or {}
+    course_recommendations = assessment.course_recommendations or {}
+    math_pathway = assessment.math_pathway or {}
+    exam_recommendations = assessment.exam_recommendations or {}
     
     return render_template('admin/view_assessment.html', 
                           assessment=assessment,
@@ -567,18 +566,18 @@ def api_submit_questionnaire(assessment_id):
     
     # Update assessment with responses
     if 'student_responses' in data:
-        assessment.student_responses = json.dumps(data['student_responses'])
+        assessment.student_responses = data['student_responses']
     
     if 'parent_responses' in data:
-        assessment.parent_responses = json.dumps(data['parent_responses'])
+        assessment.parent_responses = data['parent_responses']
     
     if 'teacher_responses' in data:
-        assessment.teacher_responses = json.dumps(data['teacher_responses'])
+        assessment.teacher_responses = data['teacher_responses']
     
     # Update status if all responses are submitted
-    if (assessment.student_responses and 
-        assessment.parent_responses and 
-        assessment.teacher_responses):
+    if (assessment.student_responses is not None and 
+        assessment.parent_responses is not None and 
+        assessment.teacher_responses is not None):
         assessment.status = 'completed'
     
     db.session.commit()
@@ -613,9 +612,9 @@ def api_analyze_assessment(assessment_id):
     }
     
     # Parse responses
-    student_responses = json.loads(assessment.student_responses) if assessment.student_responses else {}
-    parent_responses = json.loads(assessment.parent_responses) if assessment.parent_responses else {}
-    teacher_responses = json.loads(assessment.teacher_responses) if assessment.teacher_responses else {}
+    student_responses = assessment.student_responses or {}
+    parent_responses = assessment.parent_responses or {}
+    teacher_responses = assessment.teacher_responses or {}
     
     # TODO: Implement actual analysis logic here
     # For now, we'll use placeholder data
@@ -661,9 +660,9 @@ def api_analyze_assessment(assessment_id):
     }
     
     # Update assessment with analysis results
-    assessment.learning_styles = json.dumps(learning_styles)
-    assessment.traits = json.dumps(traits)
-    assessment.interests = json.dumps(interests)
+    assessment.learning_styles = learning_styles
+    assessment.traits = traits
+    assessment.interests = interests
     
     # Generate course recommendations
     from data.course_recommender import CourseRecommender
@@ -673,7 +672,7 @@ def api_analyze_assessment(assessment_id):
         'traits': traits,
         'interests': interests
     })
-    assessment.course_recommendations = json.dumps(course_recommendations)
+    assessment.course_recommendations = course_recommendations
     
     # Generate math pathway
     from data.math_pathway import MathematicsPathwayGenerator
@@ -683,7 +682,7 @@ def api_analyze_assessment(assessment_id):
         'traits': traits,
         'interests': interests
     })
-    assessment.math_pathway = json.dumps(math_pathway)
+    assessment.math_pathway = math_pathway
     
     # Generate exam recommendations
     from data.global_exams import GlobalExamRecommender
@@ -693,7 +692,7 @@ def api_analyze_assessment(assessment_id):
         'traits': traits,
         'interests': interests
     })
-    assessment.exam_recommendations = json.dumps(exam_recommendations)
+    assessment.exam_recommendations = exam_recommendations
     
     db.session.commit()
     
@@ -722,7 +721,7 @@ def api_generate_reports(assessment_id):
         return jsonify({'success': False, 'message': 'Access denied.'}), 403
     
     # Check if assessment has been analyzed
-    if not assessment.learning_styles or not assessment.traits or not assessment.interests:
+    if assessment.learning_styles is None or assessment.traits is None or assessment.interests is None:
         return jsonify({'success': False, 'message': 'Assessment has not been analyzed.'}), 400
     
     # Get student info
@@ -738,12 +737,12 @@ def api_generate_reports(assessment_id):
     }
     
     # Parse analysis results
-    learning_styles = json.loads(assessment.learning_styles)
-    traits = json.loads(assessment.traits)
-    interests = json.loads(assessment.interests)
-    course_recommendations = json.loads(assessment.course_recommendations) if assessment.course_recommendations else {}
-    math_pathway = json.loads(assessment.math_pathway) if assessment.math_pathway else {}
-    exam_recommendations = json.loads(assessment.exam_recommendations) if assessment.exam_recommendations else {}
+    learning_styles = assessment.learning_styles
+    traits = assessment.traits
+    interests = assessment.interests
+    course_recommendations = assessment.course_recommendations or {}
+    math_pathway = assessment.math_pathway or {}
+    exam_recommendations = assessment.exam_recommendations or {}
     
     analysis_results = {
         'learning_styles': learning_styles,
@@ -755,8 +754,8 @@ def api_generate_reports(assessment_id):
     }
     
     # Parse responses for parent comparison
-    student_responses = json.loads(assessment.student_responses) if assessment.student_responses else {}
-    parent_responses = json.loads(assessment.parent_responses) if assessment.parent_responses else {}
+    student_responses = assessment.student_responses or {}
+    parent_responses = assessment.parent_responses or {}
     
     # Generate parent comparison
     parent_comparison = {